@@ -5,12 +5,18 @@ Summarizer Agent
 LangGraph-based agent for email summarization workflow.
 """
 
-from typing import Any, Literal, TypedDict
+import operator
+from typing import Annotated, Any, TypedDict
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
+from langgraph.graph.state import CompiledStateGraph
 
 from shared.utils import get_logger
 
+from ..core.config import agent_settings
+from ..core.prefilter import extraction_flags
+
 logger = get_logger(__name__)
 
 
@@ -21,6 +27,7 @@ class SummarizerState(TypedDict):
     email_id: str
     email_content: dict[str, Any]
     user_id: str
+    delegated_token: str | None
     
     # Processing
     summary: str
@@ -31,7 +38,7 @@ class SummarizerState(TypedDict):
     priority: str
     
     # Output
-    calendar_events_created: list[dict[str, Any]]
+    calendar_events_created: Annotated[list[dict[str, Any]], operator.add]
     success: bool
     error: str | None
 
@@ -45,9 +52,24 @@ class SummarizerAgent:
     2. Generate AI summary
     3. Extract action items
     4. Detect calendar events
-    5. Optionally create calendar events via Agent B
+    5. Optionally create calendar events via Agent B in one bulk call
     """
     
+    # Defaults shared by every run. Nodes return new values instead of
+    # mutating state, so the empty containers are never written to.
+    _BASE_STATE: SummarizerState = {
+        "email_content": {},
+        "summary": "",
+        "key_points": [],
+        "action_items": [],
+        "detected_events": [],
+        "sentiment": "neutral",
+        "priority": "medium",
+        "calendar_events_created": [],
+        "success": False,
+        "error": None
+    }
+
     def __init__(
         self,
         gmail_service,
@@ -65,38 +87,11 @@ class SummarizerAgent:
         self.gmail_service = gmail_service
         self.llm_service = llm_service
         self.agent_b_client = agent_b_client
-        self.graph = self._create_graph()
-    
-    def _create_graph(self) -> StateGraph:
-        """Create the LangGraph workflow."""
-        
-        workflow = StateGraph(SummarizerState)
-        
-        # Add nodes
-        workflow.add_node("fetch_email", self.fetch_email_node)
-        workflow.add_node("generate_summary", self.generate_summary_node)
-        workflow.add_node("create_events", self.create_events_node)
-        
-        # Set entry point
-        workflow.set_entry_point("fetch_email")
-        
-        # Add edges
-        workflow.add_edge("fetch_email", "generate_summary")
-        workflow.add_conditional_edges(
-            "generate_summary",
-            self.should_create_events,
-            {
-                "create": "create_events",
-                "skip": END
-            }
-        )
-        workflow.add_edge("create_events", END)
-        
-        return workflow.compile()
+        self.graph = _COMPILED_GRAPH
     
     async def fetch_email_node(self, state: SummarizerState) -> dict:
         """Fetch email content from Gmail."""
-        logger.info(f"Fetching email {state['email_id']}")
+        logger.info("Fetching email", email_id=state["email_id"])
         
         try:
             email = await self.gmail_service.get_email(
@@ -110,7 +105,9 @@ class SummarizerAgent:
             }
             
         except Exception as e:
-            logger.error(f"Error fetching email: {e}")
+            logger.error(
+                "Error fetching email", email_id=state["email_id"], error=str(e)
+            )
             return {
                 "success": False,
                 "error": str(e)
@@ -125,13 +122,19 @@ class SummarizerAgent:
         
         try:
             email = state["email_content"]
+            include_action_items, include_events = extraction_flags(
+                email,
+                include_action_items=True,
+                include_events=True
+            )
             
             result = await self.llm_service.summarize_email(
                 subject=email.get("subject", ""),
                 body=email.get("body", ""),
                 sender=email.get("sender", ""),
-                include_action_items=True,
-                include_events=True
+                include_action_items=include_action_items,
+                include_events=include_events,
+                user_id=state["user_id"]
             )
             
             return {
@@ -144,51 +147,52 @@ class SummarizerAgent:
             }
             
         except Exception as e:
-            logger.error(f"Error generating summary: {e}")
+            logger.error(
+                "Error generating summary", email_id=state["email_id"], error=str(e)
+            )
             return {
                 "success": False,
                 "error": str(e)
             }
     
-    def should_create_events(self, state: SummarizerState) -> Literal["create", "skip"]:
-        """Decide whether to create calendar events."""
-        if state.get("detected_events") and len(state["detected_events"]) > 0:
-            # Check if events have high confidence
-            high_confidence = any(
-                e.get("confidence", 0) >= 0.7
-                for e in state["detected_events"]
-            )
-            return "create" if high_confidence else "skip"
-        return "skip"
+    @staticmethod
+    def should_create_events(state: SummarizerState) -> str:
+        """
+        Route to event creation when a high-confidence event was detected.
+
+        Runs without a delegated token cannot call Agent B, so they end here.
+        """
+        if state.get("delegated_token") and any(
+            event.get("confidence", 0) >= agent_settings.event_confidence_threshold
+            for event in state.get("detected_events") or []
+        ):
+            return "create_events"
+        return END
     
     async def create_events_node(self, state: SummarizerState) -> dict:
-        """Create calendar events via Agent B."""
-        logger.info("Creating calendar events")
-        
-        created_events = []
+        """Create high-confidence detected events via a single Agent B call."""
+        events = [
+            event for event in state.get("detected_events") or []
+            if event.get("confidence", 0) >= agent_settings.event_confidence_threshold
+        ]
+        logger.info("Creating calendar events", event_count=len(events))
         
-        for event in state.get("detected_events", []):
-            if event.get("confidence", 0) >= 0.7:
-                try:
-                    # Get delegated token (simplified for this node)
-                    # In real implementation, pass token through state
-                    created = await self.agent_b_client.create_event(
-                        token="delegated_token",  # Placeholder
-                        event_data=event
-                    )
-                    if created:
-                        created_events.append(created)
-                except Exception as e:
-                    logger.warning(f"Failed to create event: {e}")
+        try:
+            created = await self.agent_b_client.create_events_bulk(
+                token=state.get("delegated_token"),
+                events=events
+            )
+        except Exception as e:
+            logger.warning("Failed to create events", error=str(e))
+            return {"calendar_events_created": []}
         
-        return {
-            "calendar_events_created": created_events
-        }
+        return {"calendar_events_created": created}
     
     async def run(
         self,
         email_id: str,
         user_id: str,
+        delegated_token: str | None = None,
         **kwargs
     ) -> SummarizerState:
         """
@@ -197,30 +201,70 @@ class SummarizerAgent:
         Args:
             email_id: Gmail message ID
             user_id: User ID
+            delegated_token: Agent B token used when creating events
             **kwargs: Additional options
             
         Returns:
             Final workflow state
         """
-        initial_state: SummarizerState = {
+        initial_state: SummarizerState = self._BASE_STATE | {
             "email_id": email_id,
             "user_id": user_id,
-            "email_content": {},
-            "summary": "",
-            "key_points": [],
-            "action_items": [],
-            "detected_events": [],
-            "sentiment": "neutral",
-            "priority": "medium",
-            "calendar_events_created": [],
-            "success": False,
-            "error": None
+            "delegated_token": delegated_token
         }
         
-        result = await self.graph.ainvoke(initial_state)
+        # Nodes are shared across agents; the config tells them which agent runs
+        result = await self.graph.ainvoke(
+            initial_state,
+            config={"configurable": {"agent": self}}
+        )
         return result
 
 
+def _agent_node(method_name: str):
+    """
+    Build a graph node that dispatches to a method of the running agent.
+
+    The agent is taken from the run config, which lets every
+    SummarizerAgent share one compiled graph.
+    """
+    async def node(state: dict, config: RunnableConfig) -> dict:
+        agent = config["configurable"]["agent"]
+        return await getattr(agent, method_name)(state)
+
+    node.__name__ = method_name
+    return node
+
+
+def _build_graph() -> CompiledStateGraph:
+    """Create and compile the LangGraph workflow."""
+
+    workflow = StateGraph(SummarizerState)
+
+    # Add nodes
+    workflow.add_node("fetch_email", _agent_node("fetch_email_node"))
+    workflow.add_node("generate_summary", _agent_node("generate_summary_node"))
+    workflow.add_node("create_events", _agent_node("create_events_node"))
+
+    # Set entry point
+    workflow.set_entry_point("fetch_email")
+
+    # Add edges
+    workflow.add_edge("fetch_email", "generate_summary")
+    workflow.add_conditional_edges(
+        "generate_summary",
+        SummarizerAgent.should_create_events,
+        ["create_events", END]
+    )
+    workflow.add_edge("create_events", END)
+
+    return workflow.compile()
+
+
+# Compiled once per process and shared by every SummarizerAgent
+_COMPILED_GRAPH = _build_graph()
+
+
 def create_summarizer_graph(
     gmail_service,
     llm_service,
@@ -5,35 +5,26 @@ FastAPI Dependencies
 Dependency injection for Agent A services.
 """
 
-from functools import lru_cache
-from typing import AsyncGenerator
-
-from fastapi import Depends
-
-from shared.auth import TokenClaims, validate_token
-from shared.database import get_db_session
+from fastapi import Request
 
+from ..services.agent_b_client import AgentBClient
 from ..services.gmail_service import GmailService
 from ..services.llm_service import LLMService
-from ..services.agent_b_client import AgentBClient
-from ..core.config import agent_settings
+
+# Dependencies are async def so FastAPI awaits them inline; a plain def
+# dependency is dispatched to the threadpool on every request.
 
 
-@lru_cache
-def get_gmail_service() -> GmailService:
-    """Get Gmail service instance."""
-    return GmailService()
+async def get_gmail_service(request: Request) -> GmailService:
+    """Get the Gmail service created at startup."""
+    return request.app.state.gmail_service
 
 
-@lru_cache
-def get_llm_service() -> LLMService:
-    """Get LLM service instance."""
-    return LLMService()
+async def get_llm_service(request: Request) -> LLMService:
+    """Get the LLM service created at startup."""
+    return request.app.state.llm_service
 
 
-@lru_cache
-def get_agent_b_client() -> AgentBClient:
-    """Get Agent B client instance."""
-    return AgentBClient(
-        base_url=agent_settings.agent_b_url
-    )
+async def get_agent_b_client(request: Request) -> AgentBClient:
+    """Get the Agent B client bound to the app's shared HTTP client."""
+    return request.app.state.agent_b_client
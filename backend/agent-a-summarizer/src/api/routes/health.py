@@ -5,9 +5,12 @@ Health Check Routes
 Health and status endpoints for Agent A.
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from shared.database import AsyncSessionLocal
+from shared.database import check_database
+
+from ..dependencies import get_llm_service
+from ...services.llm_service import LLMService
 
 router = APIRouter()
 
@@ -26,13 +29,12 @@ async def health_check():
         "dependencies": {}
     }
     
-    # Check database connection
-    try:
-        async with AsyncSessionLocal() as session:
-            await session.execute("SELECT 1")
+    # Check database connection (result reused for a few seconds)
+    db_error = await check_database()
+    if db_error is None:
         health_status["dependencies"]["database"] = "healthy"
-    except Exception as e:
-        health_status["dependencies"]["database"] = f"unhealthy: {str(e)}"
+    else:
+        health_status["dependencies"]["database"] = f"unhealthy: {db_error}"
         health_status["status"] = "degraded"
     
     return health_status
@@ -46,3 +48,17 @@ async def readiness_check():
     Returns 200 if the agent is ready to accept traffic.
     """
     return {"ready": True}
+
+
+@router.get("/metrics")
+async def metrics(llm_service: LLMService = Depends(get_llm_service)):
+    """
+    Runtime metrics for the agent.
+
+    Currently reports exact and semantic summary cache counters.
+    """
+    return {
+        "agent": "agent-a-summarizer",
+        "summary_cache": llm_service.cache.stats(),
+        "semantic_cache": llm_service.semantic_cache.stats()
+    }
@@ -5,26 +5,32 @@ Email Summarization Routes
 API endpoints for email fetching and summarization.
 """
 
-from typing import Optional
+import asyncio
+import hashlib
+from collections.abc import AsyncIterator
+from contextlib import suppress
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, status
-
-from shared.auth import TokenClaims, validate_token, require_scope, Scope
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.responses import Response, StreamingResponse
+from shared.auth import Scope, TokenClaims, require_scope
 from shared.utils import get_logger
 
-from ..dependencies import get_gmail_service, get_llm_service, get_agent_b_client
+from ...core.config import agent_settings
+from ...core.prefilter import extraction_flags
 from ...schemas.email import (
-    EmailListRequest,
+    ACTION_ITEMS_ADAPTER,
+    DETECTED_EVENTS_ADAPTER,
+    DetectedEvent,
     EmailListResponse,
     SummarizeRequest,
     SummarizeResponse,
     SummaryResult,
-    ActionItem,
-    DetectedEvent,
 )
+from ...services.agent_b_client import AgentBClient
 from ...services.gmail_service import GmailService
 from ...services.llm_service import LLMService
-from ...services.agent_b_client import AgentBClient
+from ..dependencies import get_agent_b_client, get_gmail_service, get_llm_service
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -33,8 +39,8 @@ logger = get_logger(__name__)
 @router.get("/", response_model=EmailListResponse)
 async def list_emails(
     max_results: int = 20,
-    page_token: Optional[str] = None,
-    query: Optional[str] = None,
+    page_token: str | None = None,
+    query: str | None = None,
     claims: TokenClaims = Depends(require_scope(Scope.EMAIL_READ)),
     gmail_service: GmailService = Depends(get_gmail_service),
 ):
@@ -57,7 +63,7 @@ async def list_emails(
             total_count=emails.get("total_count", 0)
         )
     except Exception as e:
-        logger.error(f"Error listing emails: {e}", user_id=claims.sub)
+        logger.error("Error listing emails", user_id=claims.sub, error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch emails: {str(e)}"
@@ -68,7 +74,9 @@ async def list_emails(
 async def summarize_emails(
     request: SummarizeRequest,
     background_tasks: BackgroundTasks,
-    claims: TokenClaims = Depends(require_scope(Scope.EMAIL_READ, Scope.EMAIL_SUMMARIZE)),
+    claims: TokenClaims = Depends(
+        require_scope(Scope.EMAIL_READ, Scope.EMAIL_SUMMARIZE)
+    ),
     gmail_service: GmailService = Depends(get_gmail_service),
     llm_service: LLMService = Depends(get_llm_service),
     agent_b_client: AgentBClient = Depends(get_agent_b_client),
@@ -87,113 +95,186 @@ async def summarize_emails(
     with `calendar.write` scope.
     """
     logger.info(
-        f"Summarize request received",
+        "Summarize request received",
         user_id=claims.sub,
         email_count=len(request.email_ids),
         create_events=request.create_calendar_events
     )
     
-    results = []
-    all_detected_events = []
-    
     try:
-        # Fetch email content
-        for email_id in request.email_ids:
-            try:
-                # Get email details
-                email = await gmail_service.get_email(
-                    user_id=claims.sub,
-                    email_id=email_id
-                )
-                
-                if not email:
-                    results.append(SummaryResult(
-                        email_id=email_id,
-                        success=False,
-                        error="Email not found"
-                    ))
-                    continue
-                
-                # Generate summary using LLM
-                summary_result = await llm_service.summarize_email(
-                    subject=email.get("subject", ""),
-                    body=email.get("body", ""),
-                    sender=email.get("sender", ""),
-                    include_action_items=request.include_action_items,
-                    include_events=request.detect_calendar_events
-                )
-                
-                # Parse action items
-                action_items = [
-                    ActionItem(**item)
-                    for item in summary_result.get("action_items", [])
-                ]
-                
-                # Parse detected events
-                detected_events = [
-                    DetectedEvent(**event)
-                    for event in summary_result.get("detected_events", [])
-                ]
-                all_detected_events.extend(detected_events)
-                
-                results.append(SummaryResult(
-                    email_id=email_id,
-                    success=True,
-                    summary=summary_result.get("summary", ""),
-                    key_points=summary_result.get("key_points", []),
-                    action_items=action_items,
-                    detected_events=detected_events,
-                    sentiment=summary_result.get("sentiment"),
-                    priority=summary_result.get("priority")
-                ))
-                
-            except Exception as e:
-                logger.error(f"Error summarizing email {email_id}: {e}")
-                results.append(SummaryResult(
-                    email_id=email_id,
-                    success=False,
-                    error=str(e)
-                ))
+        # Fetch and summarize emails as an overlapping pipeline
+        summaries = {
+            email_id: summary
+            async for email_id, summary in _iter_summaries(
+                email_ids=request.email_ids,
+                user_id=claims.sub,
+                gmail_service=gmail_service,
+                llm_service=llm_service,
+                include_action_items=request.include_action_items,
+                include_events=request.detect_calendar_events
+            )
+        }
+
+        results = [
+            _build_summary_result(email_id, summaries.get(email_id))
+            for email_id in request.email_ids
+        ]
         
         # Create calendar events if requested
         calendar_events_created = []
-        if request.create_calendar_events and all_detected_events:
-            try:
-                # Create delegated token for Agent B
-                delegated_token = await agent_b_client.get_delegated_token(
-                    user_claims=claims,
-                    scopes=["calendar.write"]
-                )
-                
-                # Send events to Agent B
-                for event in all_detected_events:
-                    created_event = await agent_b_client.create_event(
-                        token=delegated_token,
-                        event_data=event.model_dump()
-                    )
-                    if created_event:
-                        calendar_events_created.append(created_event)
-                        
-            except Exception as e:
-                logger.error(f"Error creating calendar events: {e}")
-                # Don't fail the entire request, just log the error
+        if request.create_calendar_events:
+            calendar_events_created = await _create_calendar_events(
+                agent_b_client=agent_b_client,
+                claims=claims,
+                events=[event for result in results for event in result.detected_events]
+            )
         
-        return SummarizeResponse(
-            success=True,
-            results=results,
-            calendar_events_created=calendar_events_created,
-            total_processed=len(results),
-            successful_count=len([r for r in results if r.success])
+        # Validate and encode the response off the event loop
+        return await asyncio.to_thread(
+            _render_summarize_response,
+            results,
+            calendar_events_created
         )
         
     except Exception as e:
-        logger.error(f"Summarization failed: {e}", user_id=claims.sub)
+        logger.error("Summarization failed", user_id=claims.sub, error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Summarization failed: {str(e)}"
         )
 
 
+@router.post("/summarize/stream")
+async def stream_summaries(
+    request: SummarizeRequest,
+    claims: TokenClaims = Depends(
+        require_scope(Scope.EMAIL_READ, Scope.EMAIL_SUMMARIZE)
+    ),
+    gmail_service: GmailService = Depends(get_gmail_service),
+    llm_service: LLMService = Depends(get_llm_service),
+    agent_b_client: AgentBClient = Depends(get_agent_b_client),
+):
+    """
+    Summarize emails, streaming results as server-sent events.
+
+    Emits a `result` event carrying a SummaryResult as soon as each
+    email's summary is ready (in completion order, not request order),
+    followed by a final `done` event with totals and any calendar events
+    created. If the pipeline fails, an `error` event ends the stream instead.
+
+    Requires `email.read` and `email.summarize` scopes.
+    """
+    logger.info(
+        "Streaming summarize request received",
+        user_id=claims.sub,
+        email_count=len(request.email_ids),
+        create_events=request.create_calendar_events
+    )
+
+    async def event_stream():
+        results = []
+
+        try:
+            async for email_id, summary in _iter_summaries(
+                email_ids=request.email_ids,
+                user_id=claims.sub,
+                gmail_service=gmail_service,
+                llm_service=llm_service,
+                include_action_items=request.include_action_items,
+                include_events=request.detect_calendar_events
+            ):
+                result = _build_summary_result(email_id, summary)
+                results.append(result)
+                yield f"event: result\ndata: {result.model_dump_json()}\n\n"
+        except Exception as e:
+            logger.error(
+                "Streaming summarization failed", user_id=claims.sub, error=str(e)
+            )
+            data = orjson.dumps({"error": str(e)}).decode()
+            yield f"event: error\ndata: {data}\n\n"
+            return
+
+        calendar_events_created = []
+        if request.create_calendar_events:
+            calendar_events_created = await _create_calendar_events(
+                agent_b_client=agent_b_client,
+                claims=claims,
+                events=[event for result in results for event in result.detected_events]
+            )
+
+        done = {
+            "total_processed": len(results),
+            "successful_count": sum(1 for r in results if r.success),
+            "calendar_events_created": calendar_events_created
+        }
+        yield f"event: done\ndata: {orjson.dumps(done, default=str).decode()}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@router.get("/{email_id}/summary/stream")
+async def stream_email_summary(
+    email_id: str,
+    include_action_items: bool = True,
+    detect_calendar_events: bool = True,
+    claims: TokenClaims = Depends(
+        require_scope(Scope.EMAIL_READ, Scope.EMAIL_SUMMARIZE)
+    ),
+    gmail_service: GmailService = Depends(get_gmail_service),
+    llm_service: LLMService = Depends(get_llm_service),
+):
+    """
+    Summarize one email, streaming summary fields as server-sent events.
+
+    Emits a `field` event carrying `{"field": name, "value": value}` as
+    soon as each top-level summary field is generated, so the summary text
+    can be shown before action items and events finish. A final `done`
+    event closes the stream; an `error` event reports a failure.
+
+    Requires `email.read` and `email.summarize` scopes.
+    """
+    email = await gmail_service.get_email(
+        user_id=claims.sub,
+        email_id=email_id
+    )
+    if not email:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Email not found"
+        )
+
+    include_action_items, include_events = extraction_flags(
+        email,
+        include_action_items=include_action_items,
+        include_events=detect_calendar_events
+    )
+
+    async def event_stream():
+        try:
+            async for field, value in llm_service.stream_email_summary(
+                subject=email.get("subject", ""),
+                body=email.get("body", ""),
+                sender=email.get("sender", ""),
+                include_action_items=include_action_items,
+                include_events=include_events
+            ):
+                data = orjson.dumps(
+                    {"field": field, "value": value}, default=str
+                ).decode()
+                yield f"event: field\ndata: {data}\n\n"
+        except Exception as e:
+            logger.error(
+                "Error streaming email summary", email_id=email_id, error=str(e)
+            )
+            data = orjson.dumps({"error": str(e)}).decode()
+            yield f"event: error\ndata: {data}\n\n"
+            return
+
+        yield f"event: done\ndata: {orjson.dumps({'email_id': email_id}).decode()}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.get("/{email_id}")
 async def get_email_details(
     email_id: str,
@@ -223,8 +304,254 @@ async def get_email_details(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching email {email_id}: {e}")
+        logger.error("Error fetching email", email_id=email_id, error=str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch email: {str(e)}"
         )
+
+
+def _build_summary_result(
+    email_id: str,
+    summary_result: dict | Exception | None
+) -> SummaryResult:
+    """Convert a pipeline outcome for one email into a SummaryResult."""
+    if summary_result is None:
+        return SummaryResult(
+            email_id=email_id,
+            success=False,
+            error="Email not found"
+        )
+
+    try:
+        if isinstance(summary_result, Exception):
+            raise summary_result
+
+        return SummaryResult(
+            email_id=email_id,
+            success=True,
+            summary=summary_result.get("summary", ""),
+            key_points=summary_result.get("key_points", []),
+            action_items=ACTION_ITEMS_ADAPTER.validate_python(
+                summary_result.get("action_items", [])
+            ),
+            detected_events=DETECTED_EVENTS_ADAPTER.validate_python(
+                summary_result.get("detected_events", [])
+            ),
+            sentiment=summary_result.get("sentiment"),
+            priority=summary_result.get("priority")
+        )
+
+    except Exception as e:
+        logger.error("Error summarizing email", email_id=email_id, error=str(e))
+        return SummaryResult(
+            email_id=email_id,
+            success=False,
+            error=str(e)
+        )
+
+
+def _render_summarize_response(
+    results: list[SummaryResult],
+    calendar_events_created: list[dict]
+) -> Response:
+    """
+    Build and serialize a SummarizeResponse.
+
+    Returning an encoded Response also lets FastAPI skip re-validating
+    the payload against the route's response_model.
+    """
+    response = SummarizeResponse(
+        success=True,
+        results=results,
+        calendar_events_created=calendar_events_created,
+        total_processed=len(results),
+        successful_count=sum(1 for r in results if r.success)
+    )
+    return Response(
+        content=response.model_dump_json(),
+        media_type="application/json"
+    )
+
+
+async def _create_calendar_events(
+    agent_b_client: AgentBClient,
+    claims: TokenClaims,
+    events: list[DetectedEvent]
+) -> list[dict]:
+    """
+    Create detected events on the user's calendar via Agent B.
+
+    Only events at or above the confidence threshold are sent. Failures
+    are logged rather than raised so they never fail the summarization
+    request.
+    """
+    events = [
+        event for event in events
+        if event.confidence >= agent_settings.event_confidence_threshold
+    ]
+    if not events:
+        return []
+
+    calendar_events_created = []
+    try:
+        # Create delegated token for Agent B
+        delegated_token = await agent_b_client.get_delegated_token(
+            user_claims=claims,
+            scopes=["calendar.write"]
+        )
+
+        # Send all events to Agent B in one request
+        calendar_events_created = await agent_b_client.create_events_bulk(
+            token=delegated_token,
+            events=DETECTED_EVENTS_ADAPTER.dump_python(events, mode="json"),
+            max_concurrency=agent_settings.agent_b_max_concurrency
+        )
+
+    except Exception as e:
+        logger.error("Error creating calendar events", error=str(e))
+
+    return calendar_events_created
+
+
+async def _iter_summaries(
+    email_ids: list[str],
+    user_id: str,
+    gmail_service: GmailService,
+    llm_service: LLMService,
+    include_action_items: bool,
+    include_events: bool
+) -> AsyncIterator[tuple[str, dict | Exception | None]]:
+    """
+    Fetch and summarize emails as a producer/consumer pipeline.
+
+    A producer fetches email content from Gmail chunk by chunk while
+    consumers summarize chunks that have already arrived, so Gmail and
+    LLM I/O overlap instead of running back to back. Summaries are
+    yielded in completion order as the LLM streams them.
+
+    Each email is prescanned so that action item and event extraction are
+    only requested from the LLM when the email text could contain them;
+    emails are grouped by the resulting flags before summarization.
+    Emails with identical content are summarized once and the outcome is
+    shared by every ID that carries that content.
+
+    Args:
+        email_ids: Gmail message IDs to summarize
+        user_id: User ID
+        gmail_service: Gmail service instance
+        llm_service: LLM service instance
+        include_action_items: Extract action items
+        include_events: Detect calendar events
+
+    Yields:
+        (email ID, outcome) pairs, once per requested email. The outcome is
+        the summary, the exception that prevented it, or None if the email
+        was not found.
+
+    Raises:
+        Exception: The first unexpected worker failure; the remaining
+            workers are cancelled before it propagates.
+    """
+    batch_size = agent_settings.email_batch_size
+    consumer_count = agent_settings.llm_max_concurrency
+    queue: asyncio.Queue = asyncio.Queue(maxsize=consumer_count)
+    outcomes: asyncio.Queue = asyncio.Queue()
+
+    # Content hash -> representative email ID, and representative -> duplicates
+    representatives: dict[bytes, str] = {}
+    duplicates: dict[str, list[str]] = {}
+    finished: dict[str, dict | Exception] = {}
+
+    def emit(email_id: str, outcome: dict | Exception):
+        finished[email_id] = outcome
+        outcomes.put_nowait((email_id, outcome))
+        for duplicate_id in duplicates.pop(email_id, []):
+            outcomes.put_nowait((duplicate_id, outcome))
+
+    async def produce():
+        for start in range(0, len(email_ids), batch_size):
+            chunk_ids = email_ids[start:start + batch_size]
+            try:
+                emails = await gmail_service.get_emails_batch(
+                    user_id=user_id,
+                    email_ids=chunk_ids
+                )
+            except Exception as e:
+                for email_id in chunk_ids:
+                    outcomes.put_nowait((email_id, e))
+                continue
+
+            groups: dict[tuple[bool, bool], list] = {}
+            for email_id in chunk_ids:
+                email = emails.get(email_id)
+                if not email:
+                    outcomes.put_nowait((email_id, None))
+                    continue
+
+                content_hash = hashlib.sha256(
+                    "\0".join(
+                        email.get(field) or ""
+                        for field in ("subject", "sender", "body")
+                    ).encode()
+                ).digest()
+                representative = representatives.setdefault(content_hash, email_id)
+                if representative != email_id:
+                    if representative in finished:
+                        outcomes.put_nowait((email_id, finished[representative]))
+                    else:
+                        duplicates.setdefault(representative, []).append(email_id)
+                    continue
+
+                flags = extraction_flags(
+                    email,
+                    include_action_items=include_action_items,
+                    include_events=include_events
+                )
+                groups.setdefault(flags, []).append((email_id, email))
+            for flags, found in groups.items():
+                await queue.put((flags, found))
+        # One sentinel per consumer signals that production is done
+        for _ in range(consumer_count):
+            await queue.put(None)
+
+    async def consume():
+        while (item := await queue.get()) is not None:
+            (chunk_action_items, chunk_events), chunk = item
+            pending = dict(enumerate(email_id for email_id, _ in chunk))
+            try:
+                async for index, summary in llm_service.stream_emails_batch(
+                    emails=[email for _, email in chunk],
+                    include_action_items=chunk_action_items,
+                    include_events=chunk_events,
+                    user_id=user_id
+                ):
+                    emit(pending.pop(index), summary)
+            except Exception as e:
+                for email_id in pending.values():
+                    emit(email_id, e)
+
+    async def run():
+        # A failing worker cancels the others instead of leaving them blocked
+        # on the queues
+        async with asyncio.TaskGroup() as workers:
+            workers.create_task(produce())
+            for _ in range(consumer_count):
+                workers.create_task(consume())
+
+    pipeline = asyncio.ensure_future(run())
+    # A bare None after the last outcome marks the end of the pipeline
+    pipeline.add_done_callback(lambda _: outcomes.put_nowait(None))
+
+    try:
+        while (outcome := await outcomes.get()) is not None:
+            yield outcome
+        try:
+            pipeline.result()
+        except BaseExceptionGroup as group:
+            raise group.exceptions[0] from group
+    finally:
+        if not pipeline.done():
+            pipeline.cancel()
+            with suppress(asyncio.CancelledError):
+                await pipeline
@@ -39,12 +39,58 @@ class AgentASettings(BaseSettings):
     
     # Email processing settings
     max_emails_per_request: int = Field(default=50)
-    email_batch_size: int = Field(default=10)
+    email_batch_size: int = Field(
+        default=10,
+        description="Emails summarized per LLM call"
+    )
+    llm_max_concurrency: int = Field(
+        default=5,
+        description="Maximum concurrent LLM calls per request"
+    )
+    agent_b_max_concurrency: int = Field(
+        default=5,
+        description="Maximum concurrent Agent B calls when bulk creation falls back"
+    )
+    llm_coalesce_wait_ms: int = Field(
+        default=50,
+        description="How long single-email summaries wait to be batched (0 disables)"
+    )
+    llm_batch_max_tokens: int = Field(
+        default=16384,
+        description="Upper bound on output tokens for a batched summary request"
+    )
     
     # Summarization settings
     summary_max_length: int = Field(default=500)
     include_action_items: bool = Field(default=True)
     include_calendar_detection: bool = Field(default=True)
+    event_confidence_threshold: float = Field(
+        default=0.7,
+        description="Minimum confidence for a detected event to be created"
+    )
+    summary_cache_ttl_seconds: int = Field(
+        default=3600,
+        description="How long cached email summaries stay valid"
+    )
+    summary_cache_refresh_window_seconds: int = Field(
+        default=300,
+        description=(
+            "Seconds before expiry in which a cache hit is still served "
+            "but refreshed in the background"
+        )
+    )
+    semantic_cache_enabled: bool = Field(
+        default=False,
+        description=(
+            "Reuse summaries of a user's own near-duplicate emails via embeddings "
+            "(summary text only; never action items or events)"
+        )
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.93,
+        description="Minimum cosine similarity for a semantic cache hit"
+    )
+    semantic_cache_model: str = Field(default="sentence-transformers/all-MiniLM-L6-v2")
     
     # Celery settings
     celery_broker_url: Optional[str] = Field(default=None)
@@ -0,0 +1,89 @@
+"""
+Email Prefilter
+===============
+
+Cheap deterministic scans that decide whether an email is worth asking
+the LLM to extract calendar events or action items from.
+
+The patterns are plain alternations without nested quantifiers, so
+matching stays linear in the email length. They are deliberately broad:
+a false positive only costs the extraction the caller asked for anyway,
+while a false negative drops a real event or task.
+"""
+
+import re
+
+_WEEKDAYS = r"(?:mon|tues?|wed(?:nes)?|thu(?:rs)?|fri|sat(?:ur)?|sun)(?:day)?"
+_MONTHS = (
+    r"jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?"
+    r"|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?"
+)
+
+TEMPORAL_PATTERN = re.compile(
+    rf"\b(?:{_WEEKDAYS}|{_MONTHS}"
+    r"|\d{1,2}[:/.]\d{1,2}|\d{1,2}\s?(?:am|pm)|\d{4}-\d{2}-\d{2}"
+    r"|today|tomorrow|tonight|noon|midnight|next\s+(?:week|month|year)"
+    r"|this\s+(?:morning|afternoon|evening|week|weekend)"
+    r"|meeting|meet|call|webinar|appointment|interview|schedule[ds]?|invite|rsvp)\b",
+    re.IGNORECASE
+)
+
+ACTION_PATTERN = re.compile(
+    r"\b(?:please|pls|could\s+you|can\s+you|would\s+you|need\s+to|needs\s+to"
+    r"|must|should|action\s+required|required|deadline|due|asap|eod|reminder"
+    r"|follow[\s-]?up|review|approve|sign|submit|send|complete|finish|prepare"
+    r"|respond|reply|confirm|rsvp|to-?do|let\s+me\s+know)\b",
+    re.IGNORECASE
+)
+
+
+def has_temporal_signal(text: str) -> bool:
+    """
+    Check whether text mentions a date, time, or meeting.
+
+    Args:
+        text: Email subject and body
+
+    Returns:
+        True if event detection could find something
+    """
+    return TEMPORAL_PATTERN.search(text) is not None
+
+
+def has_action_signal(text: str) -> bool:
+    """
+    Check whether text contains a request, task, or deadline phrasing.
+
+    Args:
+        text: Email subject and body
+
+    Returns:
+        True if action item extraction could find something
+    """
+    return ACTION_PATTERN.search(text) is not None
+
+
+def extraction_flags(
+    email: dict,
+    include_action_items: bool,
+    include_events: bool
+) -> tuple[bool, bool]:
+    """
+    Narrow the requested extraction flags to what an email can support.
+
+    Args:
+        email: Email with subject and body keys
+        include_action_items: Caller asked for action items
+        include_events: Caller asked for calendar events
+
+    Returns:
+        (include_action_items, include_events) for this email
+    """
+    if not (include_action_items or include_events):
+        return False, False
+
+    text = f"{email.get('subject', '')}\n{email.get('body', '')}"
+    return (
+        include_action_items and has_action_signal(text),
+        include_events and has_temporal_signal(text)
+    )
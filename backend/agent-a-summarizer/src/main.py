@@ -9,13 +9,19 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from shared.auth.token_validator import get_validator
 from shared.config import settings
 from shared.database import init_async_db, close_db
-from shared.utils import setup_logging, get_logger
+from shared.http import close_client, get_client
+from shared.utils import setup_logging, shutdown_logging, get_logger
 
 from .api.routes import router as api_router
 from .core.config import agent_settings
+from .services.agent_b_client import AgentBClient
+from .services.gmail_service import GmailService
+from .services.llm_service import LLMService
 
 # Setup logging
 setup_logging()
@@ -31,18 +37,37 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     logger.info("Starting Agent A - Email Summarizer")
-    logger.info(f"Debug mode: {settings.app.debug}")
+    logger.info("Debug mode", debug=settings.app.debug)
     
     # Initialize database
     await init_async_db()
     logger.info("Database initialized")
     
+    # Prefetch Descope signing keys and keep them fresh
+    validator = get_validator()
+    try:
+        await validator.prime()
+    except Exception as e:
+        logger.warning("JWKS prefetch failed, fetching on first request", error=str(e))
+    validator.start_refresh()
+
+    # Service singletons shared by every request
+    get_client()
+    app.state.gmail_service = GmailService()
+    app.state.llm_service = LLMService()
+    app.state.agent_b_client = AgentBClient(base_url=agent_settings.agent_b_url)
+
     yield
     
     # Shutdown
     logger.info("Shutting down Agent A")
+    await validator.stop_refresh()
+    await app.state.llm_service.close()
+    await app.state.gmail_service.close()
+    await close_client()
     await close_db()
     logger.info("Cleanup complete")
+    shutdown_logging()
 
 
 # Create FastAPI application
@@ -61,6 +86,7 @@ app = FastAPI(
     """,
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.app.debug else None,
     redoc_url="/redoc" if settings.app.debug else None,
 )
@@ -8,7 +8,7 @@ Pydantic models for email-related requests and responses.
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class EmailMetadata(BaseModel):
@@ -68,6 +68,11 @@ class DetectedEvent(BaseModel):
     confidence: float = Field(default=0.8, ge=0.0, le=1.0)
 
 
+# Validate/serialize whole lists in one call instead of per-object loops
+ACTION_ITEMS_ADAPTER = TypeAdapter(list[ActionItem])
+DETECTED_EVENTS_ADAPTER = TypeAdapter(list[DetectedEvent])
+
+
 class SummaryResult(BaseModel):
     """Result of summarizing a single email."""
     
@@ -3,5 +3,13 @@
 from .gmail_service import GmailService
 from .llm_service import LLMService
 from .agent_b_client import AgentBClient
+from .summary_cache import SummaryCache
+from .semantic_cache import SemanticCache
 
-__all__ = ["GmailService", "LLMService", "AgentBClient"]
+__all__ = [
+    "GmailService",
+    "LLMService",
+    "AgentBClient",
+    "SummaryCache",
+    "SemanticCache"
+]
@@ -6,16 +6,44 @@ HTTP client for communicating with Agent B (Calendar Manager).
 Handles token delegation and secure API calls.
 """
 
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
 from typing import Any, Optional
 
 import httpx
+import jwt
 
 from shared.auth import TokenClaims, DescopeClient, get_descope_client
-from shared.utils import get_logger
-from shared.utils.exceptions import AgentCommunicationError, TokenExchangeError
+from shared.http import get_client
+from shared.utils import CircuitBreaker, get_logger
+from shared.utils.exceptions import (
+    AgentCommunicationError,
+    CircuitOpenError,
+    TokenExchangeError,
+)
 
 logger = get_logger(__name__)
 
+# Delegated token lifetime requested from Descope
+DELEGATED_TOKEN_EXPIRY_SECONDS = 3600
+
+# Refresh cached delegated tokens this long before they expire
+TOKEN_REFRESH_MARGIN_SECONDS = 60
+
+# Maximum number of delegated tokens kept in memory
+TOKEN_CACHE_SIZE = 50000
+
+# Calendar response cache: fresh entries skip Agent B, stale ones back it up
+CALENDAR_CACHE_SIZE = 5000
+CALENDAR_CACHE_MIN_TTL_SECONDS = 15.0
+CALENDAR_CACHE_MAX_TTL_SECONDS = 300.0
+CALENDAR_CACHE_MAX_STALE_SECONDS = 3600.0
+
+# Most events Agent B accepts in one bulk create request
+BULK_CREATE_MAX_EVENTS = 100
+
 
 class AgentBClient:
     """
@@ -35,19 +63,34 @@ class AgentBClient:
             base_url: Base URL of Agent B service
         """
         self.base_url = base_url.rstrip("/")
-        self._http_client: Optional[httpx.AsyncClient] = None
+        self._bulk_supported = True
         self._descope_client: Optional[DescopeClient] = None
+
+        # Delegated tokens keyed by (user_id, sorted scopes) -> (token, expires_at),
+        # least recently used first
+        self._token_cache: OrderedDict[
+            tuple[str, tuple[str, ...]],
+            tuple[str, float]
+        ] = OrderedDict()
+        self._token_locks: dict[tuple[str, tuple[str, ...]], asyncio.Lock] = {}
+
+        # (token fingerprint, start, end) -> (written_at, ttl, events)
+        self._calendar_cache: OrderedDict[
+            tuple[str, str | None, str | None],
+            tuple[float, float, list[dict[str, Any]]]
+        ] = OrderedDict()
+
+        # Fail fast while Agent B is down instead of waiting on timeouts
+        self._breaker = CircuitBreaker(
+            name="agent-b-calendar",
+            fail_max=5,
+            reset_timeout=30.0
+        )
     
     @property
     def http_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._http_client is None:
-            self._http_client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=30.0,
-                headers={"Content-Type": "application/json"}
-            )
-        return self._http_client
+        """Get the process-wide HTTP client (owned by the application lifespan)."""
+        return get_client()
     
     @property
     def descope_client(self) -> DescopeClient:
@@ -56,11 +99,6 @@ class AgentBClient:
             self._descope_client = get_descope_client()
         return self._descope_client
     
-    async def close(self):
-        """Close HTTP client connections."""
-        if self._http_client:
-            await self._http_client.aclose()
-    
     async def get_delegated_token(
         self,
         user_claims: TokenClaims,
@@ -70,7 +108,8 @@ class AgentBClient:
         Get a delegated token for calling Agent B.
         
         This creates a new token with reduced scopes that Agent B
-        can use to act on behalf of the user.
+        can use to act on behalf of the user. Tokens are cached per
+        (user, scopes) and reused until shortly before they expire.
         
         Args:
             user_claims: Current user's token claims
@@ -79,30 +118,137 @@ class AgentBClient:
         Returns:
             Delegated access token
         """
-        logger.info(
-            f"Requesting delegated token for Agent B",
-            user_id=user_claims.sub,
-            requested_scopes=scopes
-        )
+        cache_key = (user_claims.sub, tuple(sorted(scopes)))
         
-        try:
-            # Create delegated token via Descope
-            delegated_token = await self.descope_client.create_delegated_token(
+        cached = self._get_cached_token(cache_key)
+        if cached:
+            return cached
+
+        lock = self._token_locks.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            # Another request may have refreshed the token while we waited
+            cached = self._get_cached_token(cache_key)
+            if cached:
+                return cached
+
+            logger.info(
+                "Requesting delegated token for Agent B",
                 user_id=user_claims.sub,
-                target_agent="agent-b-calendar",
-                scopes=scopes,
-                expiry_seconds=3600  # 1 hour expiry
+                requested_scopes=scopes
             )
             
-            logger.info("Delegated token created successfully")
+            try:
+                # Create delegated token via Descope
+                delegated_token = await self.descope_client.create_delegated_token(
+                    user_id=user_claims.sub,
+                    target_agent="agent-b-calendar",
+                    scopes=scopes,
+                    expiry_seconds=DELEGATED_TOKEN_EXPIRY_SECONDS
+                )
+
+                logger.info("Delegated token created successfully")
+
+            except Exception as e:
+                logger.error("Failed to create delegated token", error=str(e))
+                raise TokenExchangeError(
+                    message=f"Failed to delegate access to Agent B: {str(e)}",
+                    target_agent="agent-b-calendar"
+                )
+
+            self._token_cache[cache_key] = (
+                delegated_token,
+                self._get_token_expiry(delegated_token)
+            )
+            self._token_cache.move_to_end(cache_key)
+            while len(self._token_cache) > TOKEN_CACHE_SIZE:
+                evicted, _ = self._token_cache.popitem(last=False)
+                evicted_lock = self._token_locks.get(evicted)
+                if evicted_lock is not None and not evicted_lock.locked():
+                    del self._token_locks[evicted]
             return delegated_token
+
+    def _get_cached_token(self, cache_key: tuple[str, tuple[str, ...]]) -> str | None:
+        """Return a cached delegated token if it is not close to expiry."""
+        entry = self._token_cache.get(cache_key)
+        if entry and time.time() < entry[1] - TOKEN_REFRESH_MARGIN_SECONDS:
+            self._token_cache.move_to_end(cache_key)
+            return entry[0]
+        return None
+
+    def _invalidate_token(self, token: str) -> None:
+        """Drop a rejected delegated token so the next call fetches a new one."""
+        for cache_key, (cached_token, _) in list(self._token_cache.items()):
+            if cached_token == token:
+                del self._token_cache[cache_key]
+
+    def _get_token_expiry(self, token: str) -> float:
+        """
+        Read a token's expiry timestamp.
+
+        Uses the unverified `exp` claim when the token is a JWT; otherwise
+        assumes the lifetime requested from Descope.
+        """
+        try:
+            exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+            if exp:
+                return float(exp)
+        except Exception:
+            pass
+        return time.time() + DELEGATED_TOKEN_EXPIRY_SECONDS
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send a request to Agent B through the circuit breaker.
+
+        Transport errors and 5xx responses count as failures; any other
+        response, including 4xx, proves Agent B is up.
+
+        Args:
+            method: HTTP method
+            url: Absolute Agent B URL
+            **kwargs: Passed through to httpx
             
-        except Exception as e:
-            logger.error(f"Failed to create delegated token: {e}")
-            raise TokenExchangeError(
-                message=f"Failed to delegate access to Agent B: {str(e)}",
+        Returns:
+            Agent B response
+
+        Raises:
+            AgentCommunicationError: If the breaker is open or the request fails
+        """
+        try:
+            self._breaker.before_call()
+        except CircuitOpenError as e:
+            logger.warning("Agent B circuit open, skipping call", url=url)
+            raise AgentCommunicationError(
+                message="Agent B is unavailable (circuit open)",
+                source_agent="agent-a-summarizer",
+                target_agent="agent-b-calendar",
+                details=e.details
+            )
+
+        try:
+            response = await self.http_client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self._breaker.record_failure()
+            logger.error("HTTP error calling Agent B", error=str(e))
+            raise AgentCommunicationError(
+                message=f"Failed to communicate with Agent B: {str(e)}",
+                source_agent="agent-a-summarizer",
                 target_agent="agent-b-calendar"
             )
+        except BaseException:
+            self._breaker.release()
+            raise
+
+        if response.status_code >= 500:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+        return response
     
     async def create_event(
         self,
@@ -120,57 +266,167 @@ class AgentBClient:
             Created event data or None if failed
         """
         logger.info(
-            f"Creating calendar event via Agent B",
+            "Creating calendar event via Agent B",
             event_title=event_data.get("title")
         )
         
-        try:
-            response = await self.http_client.post(
-                "/api/v1/calendar/events",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "X-Source-Agent": "agent-a-summarizer",
-                    "X-Delegation": "true"
-                },
-                json=event_data
+        response = await self._send(
+            "POST",
+            f"{self.base_url}/api/v1/calendar/events",
+            headers={
+                "Authorization": f"Bearer {token}",
+                "X-Source-Agent": "agent-a-summarizer",
+                "X-Delegation": "true"
+            },
+            json=event_data
+        )
+
+        if response.status_code == 201:
+            data = response.json()
+            logger.info(
+                "Calendar event created successfully",
+                event_id=data.get("id")
             )
-            
-            if response.status_code == 201:
-                data = response.json()
-                logger.info(
-                    f"Calendar event created successfully",
-                    event_id=data.get("id")
-                )
-                return data
-            
-            elif response.status_code == 401:
-                raise TokenExchangeError(
-                    message="Delegated token was rejected by Agent B",
-                    target_agent="agent-b-calendar"
-                )
-            
-            elif response.status_code == 403:
-                raise AgentCommunicationError(
-                    message="Insufficient scopes for calendar.write",
-                    source_agent="agent-a-summarizer",
-                    target_agent="agent-b-calendar"
-                )
-            
-            else:
-                error_data = response.json() if response.content else {}
-                logger.error(
-                    f"Failed to create event: {response.status_code}",
-                    error=error_data
-                )
-                return None
-                
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error calling Agent B: {e}")
+            return data
+
+        elif response.status_code == 401:
+            self._invalidate_token(token)
+            raise TokenExchangeError(
+                message="Delegated token was rejected by Agent B",
+                target_agent="agent-b-calendar"
+            )
+
+        elif response.status_code == 403:
             raise AgentCommunicationError(
-                message=f"Failed to communicate with Agent B: {str(e)}",
+                message="Insufficient scopes for calendar.write",
                 source_agent="agent-a-summarizer",
                 target_agent="agent-b-calendar"
             )
+
+        else:
+            error_data = response.json() if response.content else {}
+            logger.error(
+                "Failed to create event",
+                status_code=response.status_code,
+                error=error_data
+            )
+            return None
+
+    async def create_events_bulk(
+        self,
+        token: str,
+        events: list[dict[str, Any]],
+        max_concurrency: int = 5
+    ) -> list[dict[str, Any]]:
+        """
+        Create several calendar events via Agent B in as few requests as possible.
+
+        Events are sent in chunks of up to BULK_CREATE_MAX_EVENTS, the most
+        Agent B accepts per bulk request. Falls back to concurrent per-event
+        calls when Agent B does not expose the bulk endpoint (HTTP 404/405),
+        and remembers that so later calls skip straight to the fallback.
+
+        Args:
+            token: Delegated access token
+            events: Event details, one entry per event
+            max_concurrency: Maximum concurrent calls in fallback mode
+
+        Returns:
+            Created events (failed events are omitted)
+        """
+        created_events: list[dict[str, Any]] = []
+        sent = 0
+        while self._bulk_supported and sent < len(events):
+            chunk = events[sent:sent + BULK_CREATE_MAX_EVENTS]
+            created = await self._create_events_chunk(token, chunk)
+            if created is None:
+                break
+            created_events.extend(created)
+            sent += len(chunk)
+
+        remaining = events[sent:]
+        if not remaining:
+            return created_events
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def create_one(event_data: dict[str, Any]) -> dict[str, Any] | None:
+            async with semaphore:
+                return await self.create_event(token=token, event_data=event_data)
+
+        results = await asyncio.gather(
+            *[create_one(event_data) for event_data in remaining],
+            return_exceptions=True
+        )
+
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error creating calendar event", error=str(result))
+            elif result:
+                created_events.append(result)
+        return created_events
+
+    async def _create_events_chunk(
+        self,
+        token: str,
+        events: list[dict[str, Any]]
+    ) -> list[dict[str, Any]] | None:
+        """
+        Create up to BULK_CREATE_MAX_EVENTS events with one bulk request.
+
+        Returns:
+            Created events, or None if Agent B has no bulk endpoint
+        """
+        logger.info("Creating calendar events via Agent B", event_count=len(events))
+
+        response = await self._send(
+            "POST",
+            f"{self.base_url}/api/v1/calendar/events/bulk",
+            headers={
+                "Authorization": f"Bearer {token}",
+                "X-Source-Agent": "agent-a-summarizer",
+                "X-Delegation": "true"
+            },
+            json={"events": events}
+        )
+
+        if response.status_code == 201:
+            data = response.json()
+            logger.info(
+                "Calendar events created successfully",
+                created_count=data.get("created_count"),
+                failed_count=data.get("failed_count")
+            )
+            return data.get("events", [])
+
+        elif response.status_code == 401:
+            self._invalidate_token(token)
+            raise TokenExchangeError(
+                message="Delegated token was rejected by Agent B",
+                target_agent="agent-b-calendar"
+            )
+
+        elif response.status_code == 403:
+            raise AgentCommunicationError(
+                message="Insufficient scopes for calendar.write",
+                source_agent="agent-a-summarizer",
+                target_agent="agent-b-calendar"
+            )
+
+        elif response.status_code in (404, 405):
+            logger.warning(
+                "Agent B has no bulk event endpoint, creating events one by one"
+            )
+            self._bulk_supported = False
+            return None
+
+        error_data = response.json() if response.content else {}
+        logger.error(
+            "Failed to create events",
+            status_code=response.status_code,
+            error=error_data
+        )
+        return []
     
     async def check_health(self) -> bool:
         """
@@ -180,7 +436,7 @@ class AgentBClient:
             True if Agent B is responding
         """
         try:
-            response = await self.http_client.get("/health")
+            response = await self.http_client.get(f"{self.base_url}/health")
             return response.status_code == 200
         except Exception:
             return False
@@ -194,6 +450,10 @@ class AgentBClient:
         """
         Fetch user's calendar events via Agent B.
         
+        Responses are cached briefly per token and date range. If Agent B
+        fails or its circuit is open, the last good response is returned
+        with each event marked stale=True.
+
         Args:
             token: Delegated access token with calendar.read scope
             start_date: Start date filter (YYYY-MM-DD)
@@ -202,6 +462,18 @@ class AgentBClient:
         Returns:
             List of calendar events
         """
+        cache_key = (
+            hashlib.blake2b(token.encode(), digest_size=8).hexdigest(),
+            start_date,
+            end_date
+        )
+        cached = self._calendar_cache.get(cache_key)
+        if cached is not None:
+            written_at, ttl, events = cached
+            if time.time() - written_at < ttl:
+                self._calendar_cache.move_to_end(cache_key)
+                return events
+
         try:
             params = {}
             if start_date:
@@ -209,8 +481,9 @@ class AgentBClient:
             if end_date:
                 params["end_date"] = end_date
             
-            response = await self.http_client.get(
-                "/api/v1/calendar/events",
+            response = await self._send(
+                "GET",
+                f"{self.base_url}/api/v1/calendar/events",
                 headers={
                     "Authorization": f"Bearer {token}",
                     "X-Source-Agent": "agent-a-summarizer"
@@ -219,10 +492,68 @@ class AgentBClient:
             )
             
             if response.status_code == 200:
-                return response.json().get("events", [])
+                events = response.json().get("events", [])
+                self._cache_calendar(cache_key, events, cached)
+                return events
             
-            return []
+            if response.status_code == 401:
+                self._invalidate_token(token)
+            logger.error(
+                "Failed to fetch calendar", status_code=response.status_code
+            )
             
         except Exception as e:
-            logger.error(f"Error fetching calendar: {e}")
+            logger.error("Error fetching calendar", error=str(e))
+
+        return self._stale_calendar(cache_key)
+
+    def _cache_calendar(
+        self,
+        cache_key: tuple[str, str | None, str | None],
+        events: list[dict[str, Any]],
+        previous: tuple[float, float, list[dict[str, Any]]] | None
+    ) -> None:
+        """
+        Store a calendar response with an adaptive TTL.
+
+        The TTL halves when the calendar changed since the previous fetch
+        and doubles when it did not, so busy calendars are re-fetched
+        often and quiet ones rarely.
+        """
+        if previous is None:
+            ttl = CALENDAR_CACHE_MIN_TTL_SECONDS * 4
+        elif previous[2] == events:
+            ttl = min(previous[1] * 2, CALENDAR_CACHE_MAX_TTL_SECONDS)
+        else:
+            ttl = max(previous[1] / 2, CALENDAR_CACHE_MIN_TTL_SECONDS)
+
+        self._calendar_cache[cache_key] = (time.time(), ttl, events)
+        self._calendar_cache.move_to_end(cache_key)
+        while len(self._calendar_cache) > CALENDAR_CACHE_SIZE:
+            self._calendar_cache.popitem(last=False)
+
+    def _stale_calendar(
+        self,
+        cache_key: tuple[str, str | None, str | None]
+    ) -> list[dict[str, Any]]:
+        """
+        Serve the last good calendar response while Agent B is failing.
+
+        Returns:
+            Cached events marked with stale=True, or an empty list
+        """
+        cached = self._calendar_cache.get(cache_key)
+        if cached is None:
             return []
+
+        written_at, _, events = cached
+        stale_age = time.time() - written_at
+        if stale_age > CALENDAR_CACHE_MAX_STALE_SECONDS:
+            return []
+
+        logger.warning(
+            "Serving stale calendar from cache",
+            stale_age_seconds=round(stale_age, 1),
+            event_count=len(events)
+        )
+        return [{**event, "stale": True} for event in events]
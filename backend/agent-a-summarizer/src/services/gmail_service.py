@@ -5,53 +5,100 @@ Gmail Service
 Integration with Gmail API for fetching and processing emails.
 """
 
+import asyncio
 import base64
+from collections import deque
+from contextlib import AsyncExitStack
 from datetime import datetime
+from email.utils import formataddr, getaddresses, parseaddr, parsedate_to_datetime
 from typing import Any, Optional
 
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from aiogoogle import Aiogoogle
+from aiogoogle.auth.creds import UserCreds
 
 from shared.utils import get_logger
 from shared.utils.exceptions import ExternalServiceError, NotFoundError
 
 logger = get_logger(__name__)
 
+# Concurrent per-message requests, kept low to respect Gmail's per-user quota
+GMAIL_MAX_CONCURRENCY = 10
+
+# Seconds to wait for a single Gmail API call
+GMAIL_REQUEST_TIMEOUT = 30
+
+# Headers read from each message; metadata fetches request only these
+PARSED_HEADERS = ("Subject", "From", "To", "Cc", "Bcc", "Date")
+_PARSED_HEADER_KEYS = frozenset(name.lower() for name in PARSED_HEADERS)
+
+# MIME types whose content is used as the email body
+MIME_BODY_SLOTS = {"text/plain": "text", "text/html": "html"}
+
 
 class GmailService:
     """
     Service for interacting with Gmail API.
     
     Handles authentication, fetching emails, and parsing content.
+    All calls go through one long-lived aiogoogle client, so they run
+    natively on the event loop and share a single connection pool; each
+    call carries the requesting user's access token.
     """
     
     def __init__(self):
         """Initialize Gmail service."""
-        self._service_cache: dict[str, Any] = {}
+        self._exit_stack: AsyncExitStack | None = None
+        self._client: Aiogoogle | None = None
+        self._gmail = None
+        self._client_lock = asyncio.Lock()
     
-    async def _get_service(self, user_id: str, access_token: str):
+    async def _get_api(self) -> tuple[Aiogoogle, Any]:
+        """
+        Get the shared aiogoogle client and Gmail API resource.
+
+        The client session is opened and the Gmail discovery document is
+        fetched once, on first use.
+
+        Returns:
+            (aiogoogle client, Gmail v1 API resource)
+        """
+        if self._gmail is None:
+            async with self._client_lock:
+                if self._gmail is None:
+                    exit_stack = AsyncExitStack()
+                    client = await exit_stack.enter_async_context(Aiogoogle())
+                    try:
+                        gmail = await client.discover("gmail", "v1")
+                    except BaseException:
+                        await exit_stack.aclose()
+                        raise
+                    self._exit_stack = exit_stack
+                    self._client, self._gmail = client, gmail
+        return self._client, self._gmail
+
+    async def _execute(self, access_token: str, request) -> dict[str, Any]:
         """
-        Get Gmail API service instance for a user.
+        Execute a Gmail API request as a user.
         
         Args:
-            user_id: User ID
             access_token: Google OAuth access token
+            request: aiogoogle request built from the Gmail API resource
             
         Returns:
-            Gmail API service
+            Decoded response body
         """
-        cache_key = f"{user_id}_{access_token[:20]}"
-        
-        if cache_key not in self._service_cache:
-            credentials = Credentials(token=access_token)
-            self._service_cache[cache_key] = build(
-                "gmail",
-                "v1",
-                credentials=credentials,
-                cache_discovery=False
-            )
-        
-        return self._service_cache[cache_key]
+        client, _ = await self._get_api()
+        return await client.as_user(
+            request,
+            user_creds=UserCreds(access_token=access_token),
+            timeout=GMAIL_REQUEST_TIMEOUT
+        )
+
+    async def close(self):
+        """Close the shared Gmail API session."""
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+            self._exit_stack = self._client = self._gmail = None
     
     async def list_emails(
         self,
@@ -81,7 +128,7 @@ class GmailService:
             return self._get_mock_emails(max_results)
         
         try:
-            service = await self._get_service(user_id, access_token)
+            _, gmail = await self._get_api()
             
             # Build request parameters
             params = {
@@ -96,20 +143,23 @@ class GmailService:
                 params["q"] = query
             
             # Fetch message list
-            response = service.users().messages().list(**params).execute()
+            response = await self._execute(
+                access_token,
+                gmail.users.messages.list(**params)
+            )
             
             messages = response.get("messages", [])
-            emails = []
             
-            # Fetch details for each message
-            for msg in messages:
-                email_data = await self._get_email_details(
-                    service,
-                    msg["id"],
-                    format="metadata"
-                )
-                if email_data:
-                    emails.append(email_data)
+            # Fetch metadata for all messages concurrently
+            details = await self._fetch_messages(
+                access_token,
+                [msg["id"] for msg in messages],
+                format="metadata"
+            )
+            emails = [
+                details[msg["id"]] for msg in messages
+                if details.get(msg["id"])
+            ]
             
             return {
                 "emails": emails,
@@ -118,7 +168,7 @@ class GmailService:
             }
             
         except Exception as e:
-            logger.error(f"Error listing emails: {e}")
+            logger.error("Error listing emails", error=str(e))
             raise ExternalServiceError(
                 message=f"Failed to list emails: {str(e)}",
                 service="gmail"
@@ -146,15 +196,14 @@ class GmailService:
             return self._get_mock_email_detail(email_id)
         
         try:
-            service = await self._get_service(user_id, access_token)
             return await self._get_email_details(
-                service,
+                access_token,
                 email_id,
                 format="full"
             )
             
         except Exception as e:
-            logger.error(f"Error fetching email {email_id}: {e}")
+            logger.error("Error fetching email", email_id=email_id, error=str(e))
             if "404" in str(e):
                 raise NotFoundError(
                     message="Email not found",
@@ -166,9 +215,69 @@ class GmailService:
                 service="gmail"
             )
     
+    async def get_emails_batch(
+        self,
+        user_id: str,
+        email_ids: list[str],
+        access_token: str = None
+    ) -> dict[str, dict[str, Any] | None]:
+        """
+        Get detailed content for several emails at once.
+
+        Messages are fetched concurrently, at most GMAIL_MAX_CONCURRENCY
+        at a time.
+
+        Args:
+            user_id: User ID
+            email_ids: Gmail message IDs
+            access_token: Google OAuth access token
+
+        Returns:
+            Dictionary mapping each email ID to its details (None if not found)
+        """
+        # For demo purposes, return mock data if no access token
+        if not access_token:
+            return {
+                email_id: self._get_mock_email_detail(email_id)
+                for email_id in email_ids
+            }
+
+        return await self._fetch_messages(access_token, email_ids, format="full")
+
+    async def _fetch_messages(
+        self,
+        access_token: str,
+        email_ids: list[str],
+        format: str = "full"
+    ) -> dict[str, dict[str, Any] | None]:
+        """
+        Fetch several messages concurrently.
+
+        Args:
+            access_token: Google OAuth access token
+            email_ids: Gmail message IDs
+            format: 'metadata' or 'full'
+
+        Returns:
+            Dictionary mapping each email ID to its details (None if not found)
+        """
+        unique_ids = list(dict.fromkeys(email_ids))
+        semaphore = asyncio.Semaphore(GMAIL_MAX_CONCURRENCY)
+
+        async def fetch_details(email_id: str):
+            async with semaphore:
+                return await self._get_email_details(
+                    access_token, email_id, format=format
+                )
+
+        details = await asyncio.gather(*[
+            fetch_details(email_id) for email_id in unique_ids
+        ])
+        return dict(zip(unique_ids, details))
+
     async def _get_email_details(
         self,
-        service,
+        access_token: str,
         message_id: str,
         format: str = "metadata"
     ) -> Optional[dict[str, Any]]:
@@ -176,7 +285,7 @@ class GmailService:
         Fetch email details from Gmail API.
         
         Args:
-            service: Gmail API service
+            access_token: Google OAuth access token
             message_id: Gmail message ID
             format: 'metadata' or 'full'
             
@@ -184,110 +293,148 @@ class GmailService:
             Parsed email data
         """
         try:
-            message = service.users().messages().get(
-                userId="me",
-                id=message_id,
-                format=format
-            ).execute()
-            
-            # Parse headers
-            headers = {
-                h["name"].lower(): h["value"]
-                for h in message.get("payload", {}).get("headers", [])
-            }
-            
-            # Parse body if full format
-            body_text = ""
-            body_html = ""
-            
-            if format == "full":
-                body_data = self._extract_body(message.get("payload", {}))
-                body_text = body_data.get("text", "")
-                body_html = body_data.get("html", "")
-            
-            # Parse date
-            received_at = None
-            if "date" in headers:
-                try:
-                    from email.utils import parsedate_to_datetime
-                    received_at = parsedate_to_datetime(headers["date"])
-                except Exception:
-                    pass
+            _, gmail = await self._get_api()
+            params = {"userId": "me", "id": message_id, "format": format}
+            if format == "metadata":
+                params["metadataHeaders"] = list(PARSED_HEADERS)
+            message = await self._execute(
+                access_token,
+                gmail.users.messages.get(**params)
+            )
             
-            return {
-                "id": message_id,
-                "thread_id": message.get("threadId"),
-                "subject": headers.get("subject", "(No Subject)"),
-                "sender": headers.get("from", ""),
-                "sender_name": self._parse_sender_name(headers.get("from", "")),
-                "recipients": self._parse_recipients(headers),
-                "received_at": received_at,
-                "snippet": message.get("snippet", ""),
-                "body": body_text or body_html,
-                "body_text": body_text,
-                "body_html": body_html,
-                "labels": message.get("labelIds", []),
-                "is_unread": "UNREAD" in message.get("labelIds", []),
-                "is_important": "IMPORTANT" in message.get("labelIds", [])
-            }
+            return self._parse_message(message, format=format)
             
         except Exception as e:
-            logger.warning(f"Error parsing email {message_id}: {e}")
+            logger.warning(
+                "Error parsing email", message_id=message_id, error=str(e)
+            )
             return None
     
-    def _extract_body(self, payload: dict) -> dict[str, str]:
-        """Extract text and HTML body from email payload."""
-        result = {"text": "", "html": ""}
+    def _parse_message(
+        self,
+        message: dict[str, Any],
+        format: str = "metadata"
+    ) -> dict[str, Any]:
+        """
+        Parse a raw Gmail API message resource.
+
+        Args:
+            message: Message resource returned by Gmail
+            format: 'metadata' or 'full'
+
+        Returns:
+            Parsed email data
+        """
+        message_id = message.get("id")
+
+        # Parse headers in one pass, stopping once every needed one is found
+        headers: dict[str, str] = {}
+        for header in message.get("payload", {}).get("headers", ()):
+            name = header["name"].lower()
+            if name in _PARSED_HEADER_KEYS and name not in headers:
+                headers[name] = header["value"]
+                if len(headers) == len(_PARSED_HEADER_KEYS):
+                    break
         
-        def extract_parts(parts):
-            for part in parts:
-                mime_type = part.get("mimeType", "")
-                body = part.get("body", {})
-                data = body.get("data", "")
-                
-                if data:
-                    decoded = base64.urlsafe_b64decode(data).decode("utf-8", errors="ignore")
-                    if mime_type == "text/plain":
-                        result["text"] = decoded
-                    elif mime_type == "text/html":
-                        result["html"] = decoded
-                
-                # Handle nested parts
-                if "parts" in part:
-                    extract_parts(part["parts"])
+        # Parse body if full format
+        body_text = ""
+        body_html = ""
+
+        if format == "full":
+            body_data = self._extract_body(message.get("payload", {}))
+            body_text = body_data.get("text", "")
+            body_html = body_data.get("html", "")
+
+        # Parse date
+        received_at = None
+        if "date" in headers:
+            try:
+                received_at = parsedate_to_datetime(headers["date"])
+            except Exception:
+                pass
+
+        return {
+            "id": message_id,
+            "thread_id": message.get("threadId"),
+            "subject": headers.get("subject", "(No Subject)"),
+            "sender": headers.get("from", ""),
+            "sender_name": self._parse_sender_name(headers.get("from", "")),
+            "recipients": self._parse_recipients(headers),
+            "received_at": received_at,
+            "snippet": message.get("snippet", ""),
+            "body": body_text or body_html,
+            "body_text": body_text,
+            "body_html": body_html,
+            "labels": message.get("labelIds", []),
+            "is_unread": "UNREAD" in message.get("labelIds", []),
+            "is_important": "IMPORTANT" in message.get("labelIds", [])
+        }
+
+    def _extract_body(self, payload: dict, prefer: str = "text") -> dict[str, str]:
+        """
+        Extract text and HTML body from email payload.
+
+        Walks the MIME tree depth-first in document order with an explicit
+        stack, collecting the raw data of the first text/plain and text/html
+        parts without decoding them. Only the preferred part is then decoded;
+        the other is decoded only when the preferred one is missing, so
+        multipart/alternative emails skip decoding their HTML copy.
+
+        Args:
+            payload: Message payload from the Gmail API
+            prefer: Body slot to decode first, "text" or "html"
+
+        Returns:
+            Dictionary with "text" and "html" bodies ("" when not decoded)
+        """
+        raw: dict[str, str | None] = {"text": None, "html": None}
         
         # Check if payload has direct body
-        if payload.get("body", {}).get("data"):
-            data = payload["body"]["data"]
-            decoded = base64.urlsafe_b64decode(data).decode("utf-8", errors="ignore")
-            mime_type = payload.get("mimeType", "text/plain")
-            if mime_type == "text/plain":
-                result["text"] = decoded
+        data = payload.get("body", {}).get("data")
+        if data:
+            if payload.get("mimeType", "text/plain") == "text/plain":
+                raw["text"] = data
             else:
-                result["html"] = decoded
+                raw["html"] = data
         
-        # Check for parts
-        if "parts" in payload:
-            extract_parts(payload["parts"])
+        # Walk nested parts
+        stack = deque(reversed(payload.get("parts", ())))
+        while stack and not (raw["text"] and raw["html"]):
+            part = stack.pop()
+            slot = MIME_BODY_SLOTS.get(part.get("mimeType", ""))
+
+            if slot and not raw[slot]:
+                raw[slot] = part.get("body", {}).get("data")
+
+            stack.extend(reversed(part.get("parts", ())))
         
+        other = "html" if prefer == "text" else "text"
+        result = {"text": "", "html": ""}
+        if raw[prefer]:
+            result[prefer] = self._decode_body_data(raw[prefer])
+        elif raw[other]:
+            result[other] = self._decode_body_data(raw[other])
         return result
     
+    @staticmethod
+    def _decode_body_data(data: str) -> str:
+        """Decode base64url body data, passing ASCII bytes to skip str validation."""
+        return base64.urlsafe_b64decode(data.encode("ascii")).decode(
+            "utf-8",
+            errors="ignore"
+        )
+
     def _parse_sender_name(self, sender: str) -> str:
         """Extract sender name from email address string."""
-        if "<" in sender:
-            return sender.split("<")[0].strip().strip('"')
-        return sender.split("@")[0]
+        name, address = parseaddr(sender)
+        return name or (address or sender).split("@", 1)[0]
     
     def _parse_recipients(self, headers: dict) -> list[str]:
-        """Parse recipients from email headers."""
-        recipients = []
-        for field in ["to", "cc", "bcc"]:
-            if field in headers:
-                recipients.extend([
-                    addr.strip()
-                    for addr in headers[field].split(",")
-                ])
-        return recipients
+        """Parse recipients from email headers, handling quoted names with commas."""
+        addresses = getaddresses([
+            headers[field] for field in ("to", "cc", "bcc") if field in headers
+        ])
+        return [formataddr(address) for address in addresses if address[1]]
     
     def _get_mock_emails(self, count: int = 10) -> dict[str, Any]:
         """Return mock email data for demo/testing."""
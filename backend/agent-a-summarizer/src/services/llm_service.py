@@ -5,18 +5,395 @@ LLM Service
 Integration with Anthropic Claude for email summarization.
 """
 
-import json
+import asyncio
+import re
 import time
-from typing import Any, Optional
+from typing import Any
+from collections.abc import AsyncIterator
 
 import anthropic
+import httpx
+import orjson
 
 from shared.config import settings
 from shared.utils import get_logger
 from shared.utils.exceptions import ExternalServiceError
 
+from .semantic_cache import SemanticCache
+from .summary_cache import SummaryCache, mark_cached
+from ..core.config import agent_settings
+
 logger = get_logger(__name__)
 
+# Input token budgets for email text sent to Claude. Claude has no local
+# tokenizer, so budgets are enforced in UTF-8 bytes at ~4 bytes per token,
+# which holds for English and over-counts (stays safe) for other scripts.
+EMAIL_BODY_TOKEN_BUDGET = 1000
+EXTRACTION_TEXT_TOKEN_BUDGET = 750
+BYTES_PER_TOKEN = 4
+
+# Markdown code fence Claude sometimes wraps JSON answers in
+_FENCE_RE = re.compile(r"^```(?:json)?\s*\n(.*?)\n?```$", re.DOTALL)
+
+SUMMARIZER_SYSTEM_PROMPT = """\
+You are an intelligent email assistant that summarizes emails,
+extracts action items, and detects calendar events. Always respond with
+valid JSON matching the requested structure."""
+
+
+def _worked_example(email: str, response: dict[str, Any]) -> str:
+    """Render one worked example: the email followed by its JSON response."""
+    rendered = orjson.dumps(response, option=orjson.OPT_INDENT_2).decode()
+    return f"{email}\nRESPONSE:\n{rendered}"
+
+
+# Worked examples kept in the cached system prefix. Together with the
+# instructions they push the static prefix past Anthropic's minimum
+# cacheable length, so only the per-email suffix is prefilled each call.
+SUMMARIZER_EXAMPLES = "\n\n".join([
+    _worked_example(
+        """EXAMPLE 1
+
+From: Priya Raman <priya.raman@northwind.io>
+Subject: Vendor review moved to Thursday
+
+BODY:
+Hi all,
+
+The quarterly vendor review with Contoso has been moved from Wednesday to
+Thursday, March 14 at 10:30 AM in the 4th floor boardroom. It should take
+about 90 minutes. Dana and Luis, please bring the updated cost comparison
+and the SLA breach report. I still need everyone's feedback on the renewal
+terms by Tuesday end of day so I can send a consolidated response.
+
+Thanks,
+Priya
+""",
+        {
+            "summary": (
+                "Priya moved the quarterly Contoso vendor review to Thursday, "
+                "March 14 at 10:30 AM in the 4th floor boardroom. Dana and Luis "
+                "must bring the cost comparison and SLA breach report, and "
+                "everyone owes feedback on the renewal terms by Tuesday."
+            ),
+            "key_points": [
+                "Vendor review rescheduled from Wednesday to Thursday, March 14",
+                "Meeting is at 10:30 AM in the 4th floor boardroom, about 90 minutes",
+                "Dana and Luis are bringing the cost comparison and SLA breach report",
+                "Renewal-term feedback is due Tuesday end of day"
+            ],
+            "sentiment": "neutral",
+            "priority": "high",
+            "action_items": [
+                {
+                    "title": "Send feedback on Contoso renewal terms",
+                    "deadline": "2024-03-12",
+                    "priority": "high",
+                    "assignee": None
+                },
+                {
+                    "title": "Bring updated cost comparison",
+                    "deadline": "2024-03-14",
+                    "priority": "medium",
+                    "assignee": "Dana"
+                },
+                {
+                    "title": "Bring SLA breach report",
+                    "deadline": "2024-03-14",
+                    "priority": "medium",
+                    "assignee": "Luis"
+                }
+            ],
+            "detected_events": [
+                {
+                    "title": "Quarterly vendor review with Contoso",
+                    "description": (
+                        "Review of vendor costs, SLA breaches, and renewal terms"
+                    ),
+                    "date": "2024-03-14",
+                    "time": "10:30",
+                    "duration_minutes": 90,
+                    "location": "4th floor boardroom",
+                    "attendees": ["priya.raman@northwind.io", "Dana", "Luis"],
+                    "confidence": 0.95
+                }
+            ]
+        }
+    ),
+    _worked_example(
+        """EXAMPLE 2
+
+From: The Weekly Build <newsletter@weeklybuild.dev>
+Subject: Issue #212: Faster CI pipelines
+
+BODY:
+This week: three teams share how they cut CI times in half by caching
+dependencies and splitting test suites. Plus, a roundup of new releases
+and a reader survey. Unsubscribe at any time from your account settings.
+""",
+        {
+            "summary": (
+                "A developer newsletter featuring case studies on halving CI "
+                "pipeline times through dependency caching and test splitting, "
+                "along with release notes and a reader survey."
+            ),
+            "key_points": [
+                "Three teams describe cutting CI times in half",
+                "Techniques covered: dependency caching and test suite splitting",
+                "Includes a release roundup and a reader survey"
+            ],
+            "sentiment": "positive",
+            "priority": "low",
+            "action_items": [],
+            "detected_events": []
+        }
+    )
+])
+
+
+ACTION_ITEMS_INSTRUCTIONS = """
+            - "action_items": Array of action items with:
+              - "title": Brief description of the action
+              - "deadline": Date if mentioned (YYYY-MM-DD format), null if not
+              - "priority": "low", "medium", "high", or "urgent"
+              - "assignee": Person responsible if mentioned, null if not"""
+
+EVENTS_INSTRUCTIONS = """
+            - "detected_events": Array of calendar events with:
+              - "title": Event title
+              - "description": Brief description
+              - "date": Event date (YYYY-MM-DD format)
+              - "time": Event time (HH:MM format, 24-hour)
+              - "duration_minutes": Estimated duration (default 60)
+              - "location": Location if mentioned
+              - "attendees": Array of attendee emails/names
+              - "confidence": 0.0-1.0 how confident you are this is a real event"""
+
+SYSTEM_PROMPT_TEMPLATE = """{system_prompt}
+
+For each email, produce a JSON object containing:
+- "summary": A concise 2-3 sentence summary of the email
+- "key_points": Array of 3-5 key points from the email
+- "sentiment": "positive", "negative", or "neutral"
+- "priority": "low", "medium", "high", or "urgent" based on content urgency
+{extraction_instructions}
+
+Omit fields that are not requested above. Respond ONLY with valid JSON,
+no additional text.
+
+{examples}"""
+
+SUMMARY_PROMPT_TEMPLATE = """\
+Analyze the following email and respond with a single JSON object.
+
+EMAIL DETAILS:
+From: {sender}
+Subject: {subject}
+
+BODY:
+{body}"""
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate text to an approximate input token budget.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+
+    Returns:
+        Text cut at a UTF-8 byte budget, never splitting a character
+    """
+    max_bytes = max_tokens * BYTES_PER_TOKEN
+    if len(text) <= max_bytes // 4:
+        return text
+    if text.isascii():
+        return text[:max_bytes]
+    return text.encode("utf-8")[:max_bytes].decode("utf-8", errors="ignore")
+
+
+def _strip_code_fence(content: str) -> str:
+    """Return the JSON inside a markdown code fence, or the stripped content as is."""
+    match = _FENCE_RE.match(content)
+    return match.group(1) if match else content
+
+
+def _build_system_prompt_block(
+    include_action_items: bool,
+    include_events: bool
+) -> list[dict[str, Any]]:
+    """Render the system prompt for one combination of extraction flags."""
+    extraction_instructions = (
+        (ACTION_ITEMS_INSTRUCTIONS if include_action_items else "")
+        + (EVENTS_INSTRUCTIONS if include_events else "")
+    )
+    return [
+        {
+            "type": "text",
+            "text": SYSTEM_PROMPT_TEMPLATE.format(
+                system_prompt=SUMMARIZER_SYSTEM_PROMPT,
+                extraction_instructions=extraction_instructions,
+                examples=SUMMARIZER_EXAMPLES
+            ),
+            "cache_control": {"type": "ephemeral"}
+        }
+    ]
+
+
+# Byte-identical system prompts per flag combination, so prompt caching hits
+SYSTEM_PROMPT_BLOCKS = {
+    (include_action_items, include_events): _build_system_prompt_block(
+        include_action_items,
+        include_events
+    )
+    for include_action_items in (True, False)
+    for include_events in (True, False)
+}
+
+
+class JSONArrayStreamParser:
+    """
+    Incrementally split a streamed JSON array into its top-level elements.
+
+    Text is fed as it arrives from the model; each element object is
+    decoded and returned as soon as its closing brace is seen. Text
+    outside the array, such as markdown code fences, is ignored.
+    """
+
+    def __init__(self):
+        self.object_count = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._buffer: list[str] = []
+
+    def feed(self, text: str) -> list[Any]:
+        """
+        Consume the next piece of streamed text.
+
+        Args:
+            text: Newly received text
+
+        Returns:
+            Elements completed by this piece of text
+        """
+        completed = []
+
+        for char in text:
+            if self._depth >= 2:
+                self._buffer.append(char)
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = self._depth >= 1
+            elif char in "[{":
+                self._depth += 1
+                if self._depth == 2:
+                    self._buffer = [char]
+            elif char in "]}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 1:
+                    self.object_count += 1
+                    try:
+                        completed.append(orjson.loads("".join(self._buffer)))
+                    except orjson.JSONDecodeError:
+                        logger.warning(
+                            "Skipping unparseable element in streamed LLM response"
+                        )
+                    self._buffer = []
+
+        return completed
+
+
+class JSONObjectStreamParser:
+    """
+    Incrementally split a streamed JSON object into its top-level fields.
+
+    Each (key, value) pair is decoded and returned as soon as the comma
+    or closing brace after its value is seen, so early fields such as
+    "summary" are available while later ones are still generating.
+    Text outside the object, such as markdown code fences, is ignored.
+    `complete` is only set once the closing brace is seen and every field
+    decoded, so a truncated or partly malformed response can be told apart.
+    """
+
+    def __init__(self):
+        self.fields: dict[str, Any] = {}
+        self.complete = False
+        self._skipped = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._member: list[str] = []
+
+    def feed(self, text: str) -> list[tuple[str, Any]]:
+        """
+        Consume the next piece of streamed text.
+
+        Args:
+            text: Newly received text
+
+        Returns:
+            Fields completed by this piece of text
+        """
+        completed = []
+
+        for char in text:
+            if self._in_string:
+                self._member.append(char)
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == "," and self._depth == 1:
+                completed.extend(self._finish_member())
+            elif char in "]}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    completed.extend(self._finish_member())
+                    self.complete = not self._skipped
+                else:
+                    self._member.append(char)
+            elif char in "[{":
+                if self._depth >= 1:
+                    self._member.append(char)
+                self._depth += 1
+            elif self._depth >= 1:
+                self._member.append(char)
+                self._in_string = char == '"'
+
+        return completed
+
+    def _finish_member(self) -> list[tuple[str, Any]]:
+        """Decode the buffered `"key": value` member, if any."""
+        member = "".join(self._member).strip()
+        self._member = []
+        if not member:
+            return []
+
+        try:
+            key, value = next(iter(orjson.loads("{" + member + "}").items()))
+        except (orjson.JSONDecodeError, StopIteration):
+            logger.warning("Skipping unparseable field in streamed LLM response")
+            self._skipped = True
+            return []
+
+        self.fields[key] = value
+        return [(key, value)]
+
 
 class LLMService:
     """
@@ -25,13 +402,50 @@ class LLMService:
     Handles prompt construction, API calls, and response parsing.
     """
     
-    def __init__(self):
-        """Initialize LLM service with Anthropic client."""
-        self.client = anthropic.Anthropic(
-            api_key=settings.anthropic.api_key
+    def __init__(
+        self,
+        cache: SummaryCache | None = None,
+        semantic_cache: SemanticCache | None = None
+    ):
+        """
+        Initialize LLM service with an async Anthropic client.
+
+        Args:
+            cache: Summary cache (default: Redis cache from settings)
+            semantic_cache: Near-duplicate cache consulted on exact misses
+                (default: embedding cache from settings)
+        """
+        self.client = anthropic.AsyncAnthropic(
+            api_key=settings.anthropic.api_key,
+            max_retries=2,
+            timeout=httpx.Timeout(60.0, connect=5.0)
         )
         self.model = settings.anthropic.model
         self.max_tokens = settings.anthropic.max_tokens
+        self.cache = cache or SummaryCache(
+            redis_url=settings.redis.redis_url,
+            ttl_seconds=agent_settings.summary_cache_ttl_seconds
+        )
+        self.semantic_cache = semantic_cache or SemanticCache(
+            model_name=agent_settings.semantic_cache_model,
+            threshold=agent_settings.semantic_cache_threshold,
+            enabled=agent_settings.semantic_cache_enabled
+        )
+        # Summaries currently being generated, keyed by cache key
+        self._inflight: dict[str, asyncio.Future] = {}
+        # Single-email requests waiting to be coalesced, keyed by extraction flags
+        self._pending: dict[
+            tuple[bool, bool], list[tuple[dict[str, Any], asyncio.Future]]
+        ] = {}
+        self._flush_handles: dict[tuple[bool, bool], asyncio.TimerHandle] = {}
+        self._batch_tasks: set[asyncio.Task] = set()
+        # Background refreshes of aging cache entries, keyed by cache key
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
+
+    async def close(self):
+        """Close the Anthropic client and summary cache connections."""
+        await self.client.close()
+        await self.cache.close()
     
     async def summarize_email(
         self,
@@ -39,35 +453,263 @@ class LLMService:
         body: str,
         sender: str,
         include_action_items: bool = True,
-        include_events: bool = True
+        include_events: bool = True,
+        user_id: str | None = None
     ) -> dict[str, Any]:
         """
         Generate an AI summary of an email.
         
+        Concurrent calls for the same email share a single Claude request.
+
         Args:
             subject: Email subject
             body: Email body content
             sender: Sender's email/name
             include_action_items: Extract action items
             include_events: Detect calendar events
+            user_id: Owner of the email; the semantic cache is only
+                consulted when it is given
             
         Returns:
             Dictionary with summary, action items, and events
         """
+        cache_key = SummaryCache.make_key(
+            subject=subject,
+            body=body,
+            sender=sender,
+            include_action_items=include_action_items,
+            include_events=include_events,
+            model=self.model
+        )
+        cached = await self._get_cached(
+            cache_key,
+            email={"subject": subject, "body": body, "sender": sender},
+            include_action_items=include_action_items,
+            include_events=include_events
+        )
+        if cached is not None:
+            logger.debug("Summary cache hit")
+            return cached
+
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            return mark_cached(await asyncio.shield(inflight))
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            result = await self._summarize_and_cache(
+                cache_key=cache_key,
+                subject=subject,
+                body=body,
+                sender=sender,
+                include_action_items=include_action_items,
+                include_events=include_events,
+                user_id=user_id
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unshared failure is not logged again
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[cache_key]
+
+    async def _get_cached(
+        self,
+        cache_key: str,
+        email: dict[str, Any],
+        include_action_items: bool,
+        include_events: bool
+    ) -> dict[str, Any] | None:
+        """
+        Look up a cached summary, refreshing it in the background near expiry.
+
+        Keys are content hashes, so an entry never goes stale; it is only
+        refreshed within summary_cache_refresh_window_seconds of its hard
+        TTL, so a hot email is not left to expire and then block a reader
+        on Claude. Such entries are still returned immediately, and a single
+        background task per key regenerates them.
+        """
+        entry = await self.cache.get_entry(cache_key)
+        if entry is None:
+            return None
+
+        summary, age = entry
+        refresh_after = (
+            self.cache.ttl_seconds - agent_settings.summary_cache_refresh_window_seconds
+        )
+        if (
+            age >= refresh_after
+            and cache_key not in self._refresh_tasks
+            and cache_key not in self._inflight
+        ):
+            task = asyncio.ensure_future(self._refresh_cached(
+                cache_key,
+                email=email,
+                include_action_items=include_action_items,
+                include_events=include_events
+            ))
+            self._refresh_tasks[cache_key] = task
+            task.add_done_callback(lambda _: self._refresh_tasks.pop(cache_key, None))
+        return summary
+
+    async def _refresh_cached(
+        self,
+        cache_key: str,
+        email: dict[str, Any],
+        include_action_items: bool,
+        include_events: bool
+    ) -> None:
+        """Regenerate a cached summary and swap it in; keep the old one on failure."""
+        try:
+            result = await self._summarize_coalesced(
+                email=email,
+                include_action_items=include_action_items,
+                include_events=include_events
+            )
+            await self.cache.set(cache_key, result)
+        except Exception as e:
+            logger.warning("Background summary refresh failed", error=str(e))
+
+    async def _summarize_and_cache(
+        self,
+        cache_key: str,
+        subject: str,
+        body: str,
+        sender: str,
+        include_action_items: bool,
+        include_events: bool,
+        user_id: str | None
+    ) -> dict[str, Any]:
+        """Summarize an exact-cache miss, trying the user's semantic cache first."""
+        embeddings = None
+        if user_id is not None:
+            embeddings = await self.semantic_cache.embed(
+                [SemanticCache.embedding_text(subject, body, sender)]
+            )
+        if embeddings is not None:
+            similar = self.semantic_cache.search(
+                embeddings[0],
+                user_id=user_id,
+                include_action_items=include_action_items,
+                include_events=include_events
+            )
+            if similar is not None:
+                await self.cache.set(cache_key, similar)
+                return mark_cached(similar)
+
+        result = await self._summarize_coalesced(
+            email={"subject": subject, "body": body, "sender": sender},
+            include_action_items=include_action_items,
+            include_events=include_events
+        )
+        await self.cache.set(cache_key, result)
+        if embeddings is not None:
+            self.semantic_cache.add(embeddings[0], user_id=user_id, summary=result)
+        return result
+
+    async def _summarize_coalesced(
+        self,
+        email: dict[str, Any],
+        include_action_items: bool,
+        include_events: bool
+    ) -> dict[str, Any]:
+        """
+        Summarize one email, coalescing it with concurrent single-email calls.
+
+        Requests with the same extraction flags are held for up to
+        llm_coalesce_wait_ms, or until email_batch_size of them are
+        waiting, and then sent to Claude as one batch request.
+        """
+        wait_ms = agent_settings.llm_coalesce_wait_ms
+        if wait_ms <= 0:
+            return await self._summarize_uncached(
+                subject=email.get("subject", ""),
+                body=email.get("body", ""),
+                sender=email.get("sender", ""),
+                include_action_items=include_action_items,
+                include_events=include_events
+            )
+
+        loop = asyncio.get_running_loop()
+        flags = (include_action_items, include_events)
+        future = loop.create_future()
+
+        pending = self._pending.setdefault(flags, [])
+        pending.append((email, future))
+        if len(pending) >= agent_settings.email_batch_size:
+            self._flush_pending(flags)
+        elif len(pending) == 1:
+            self._flush_handles[flags] = loop.call_later(
+                wait_ms / 1000,
+                self._flush_pending,
+                flags
+            )
+
+        return await future
+
+    def _flush_pending(self, flags: tuple[bool, bool]) -> None:
+        """Send the coalesced requests waiting for one flag combination."""
+        handle = self._flush_handles.pop(flags, None)
+        if handle is not None:
+            handle.cancel()
+
+        batch = self._pending.pop(flags, [])
+        if batch:
+            task = asyncio.ensure_future(self._run_coalesced_batch(batch, flags))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_coalesced_batch(
+        self,
+        batch: list[tuple[dict[str, Any], asyncio.Future]],
+        flags: tuple[bool, bool]
+    ) -> None:
+        """Summarize a coalesced batch and resolve each caller's future."""
+        include_action_items, include_events = flags
+        try:
+            async for index, summary in self._stream_uncached_batch(
+                emails=[email for email, _ in batch],
+                include_action_items=include_action_items,
+                include_events=include_events
+            ):
+                future = batch[index][1]
+                if not future.done():
+                    future.set_result(summary)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def _summarize_uncached(
+        self,
+        subject: str,
+        body: str,
+        sender: str,
+        include_action_items: bool,
+        include_events: bool
+    ) -> dict[str, Any]:
+        """Summarize a single email with Claude, bypassing the cache."""
         start_time = time.time()
         
         # Build the prompt
         prompt = self._build_summary_prompt(
             subject=subject,
             body=body,
-            sender=sender,
+            sender=sender
+        )
+        system = self._build_system_prompt(
             include_action_items=include_action_items,
             include_events=include_events
         )
         
         try:
             # Call Claude API
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=self.model,
                 max_tokens=self.max_tokens,
                 messages=[
@@ -76,9 +718,7 @@ class LLMService:
                         "content": prompt
                     }
                 ],
-                system="""You are an intelligent email assistant that summarizes emails,
-                extracts action items, and detects calendar events. Always respond with
-                valid JSON matching the requested structure."""
+                system=system
             )
             
             # Parse response
@@ -94,88 +734,444 @@ class LLMService:
             logger.info(
                 "Email summarized successfully",
                 tokens_used=result["tokens_used"],
+                cache_read_tokens=getattr(
+                    response.usage, "cache_read_input_tokens", None
+                ),
                 processing_time_ms=processing_time
             )
             
             return result
             
         except anthropic.APIError as e:
-            logger.error(f"Claude API error: {e}")
+            logger.error("Claude API error", error=str(e))
             raise ExternalServiceError(
                 message=f"LLM service error: {str(e)}",
                 service="anthropic"
             )
         except Exception as e:
-            logger.error(f"Error summarizing email: {e}")
+            logger.error("Error summarizing email", error=str(e))
             raise ExternalServiceError(
                 message=f"Failed to summarize email: {str(e)}",
                 service="llm"
             )
     
-    def _build_summary_prompt(
+    async def stream_email_summary(
         self,
         subject: str,
         body: str,
         sender: str,
+        include_action_items: bool = True,
+        include_events: bool = True
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Summarize an email, yielding each summary field as soon as it is generated.
+
+        Cached summaries are yielded immediately. Otherwise Claude's response
+        is streamed and parsed incrementally, so "summary" arrives well before
+        the action item and event arrays finish generating. Usage metadata
+        fields are yielded last.
+
+        Args:
+            subject: Email subject
+            body: Email body content
+            sender: Sender's email/name
+            include_action_items: Extract action items
+            include_events: Detect calendar events
+
+        Yields:
+            (field name, value) pairs
+        """
+        cache_key = SummaryCache.make_key(
+            subject=subject,
+            body=body,
+            sender=sender,
+            include_action_items=include_action_items,
+            include_events=include_events,
+            model=self.model
+        )
+        cached = await self._get_cached(
+            cache_key,
+            email={"subject": subject, "body": body, "sender": sender},
+            include_action_items=include_action_items,
+            include_events=include_events
+        )
+        if cached is not None:
+            for field in cached.items():
+                yield field
+            return
+
+        start_time = time.time()
+        parser = JSONObjectStreamParser()
+
+        try:
+            async with self.client.messages.stream(
+                model=self.model,
+                max_tokens=self.max_tokens,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": self._build_summary_prompt(
+                            subject=subject,
+                            body=body,
+                            sender=sender
+                        )
+                    }
+                ],
+                system=self._build_system_prompt(
+                    include_action_items=include_action_items,
+                    include_events=include_events
+                )
+            ) as stream:
+                async for text in stream.text_stream:
+                    for field in parser.feed(text):
+                        yield field
+
+                final_message = await stream.get_final_message()
+
+        except anthropic.APIError as e:
+            logger.error("Claude API error", error=str(e))
+            raise ExternalServiceError(
+                message=f"LLM service error: {str(e)}",
+                service="anthropic"
+            )
+        except Exception as e:
+            logger.error("Error streaming email summary", error=str(e))
+            raise ExternalServiceError(
+                message=f"Failed to summarize email: {str(e)}",
+                service="llm"
+            )
+
+        result = parser.fields
+        if not result:
+            # The response was not a JSON object; fall back to the tolerant parser
+            result = self._parse_response(final_message.content[0].text)
+            for field in result.items():
+                yield field
+
+        usage = final_message.usage
+        metadata = {
+            "tokens_used": usage.input_tokens + usage.output_tokens,
+            "processing_time_ms": int((time.time() - start_time) * 1000),
+            "model_used": self.model
+        }
+        for field in metadata.items():
+            yield field
+
+        # A truncated or partly unparseable response must not be served again
+        if parser.complete:
+            await self.cache.set(cache_key, result | metadata)
+        else:
+            logger.warning("Not caching incomplete streamed summary")
+
+    async def summarize_emails_batch(
+        self,
+        emails: list[dict[str, Any]],
+        include_action_items: bool = True,
+        include_events: bool = True,
+        user_id: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Generate AI summaries for several emails in a single Claude call.
+
+        Sharing one request across the batch avoids paying the system
+        prompt and instructions prefill once per email.
+
+        Args:
+            emails: Emails with subject, body, and sender keys
+            include_action_items: Extract action items
+            include_events: Detect calendar events
+            user_id: Owner of the emails; the semantic cache is only
+                consulted when it is given
+
+        Returns:
+            One summary dictionary per input email, in input order
+        """
+        summaries: list[dict[str, Any] | None] = [None] * len(emails)
+
+        async for index, summary in self.stream_emails_batch(
+            emails=emails,
+            include_action_items=include_action_items,
+            include_events=include_events,
+            user_id=user_id
+        ):
+            summaries[index] = summary
+
+        return summaries
+
+    async def stream_emails_batch(
+        self,
+        emails: list[dict[str, Any]],
+        include_action_items: bool = True,
+        include_events: bool = True,
+        user_id: str | None = None
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        """
+        Summarize several emails, yielding each summary as soon as it is ready.
+
+        Exact and near-duplicate cached summaries are yielded first. The
+        remaining emails are sent to Claude in one streamed request, and each
+        email's summary is yielded when its JSON object closes in the stream.
+
+        Args:
+            emails: Emails with subject, body, and sender keys
+            include_action_items: Extract action items
+            include_events: Detect calendar events
+            user_id: Owner of the emails; the semantic cache is only
+                consulted when it is given
+
+        Yields:
+            (index into emails, summary dictionary) pairs, once per email
+        """
+        if not emails:
+            return
+
+        # Serve cached summaries and only send the misses to Claude
+        cache_keys = [
+            SummaryCache.make_key(
+                subject=email.get("subject", ""),
+                body=email.get("body", ""),
+                sender=email.get("sender", ""),
+                include_action_items=include_action_items,
+                include_events=include_events,
+                model=self.model
+            )
+            for email in emails
+        ]
+        missing = []
+        for index, key in enumerate(cache_keys):
+            cached = await self._get_cached(
+                key,
+                email=emails[index],
+                include_action_items=include_action_items,
+                include_events=include_events
+            )
+            if cached is None:
+                missing.append(index)
+            else:
+                yield index, cached
+
+        if not missing:
+            return
+
+        # Reuse summaries of the user's near-duplicate emails before calling Claude
+        embeddings = None
+        if user_id is not None:
+            embeddings = await self.semantic_cache.embed([
+                SemanticCache.embedding_text(
+                    emails[index].get("subject", ""),
+                    emails[index].get("body", ""),
+                    emails[index].get("sender", "")
+                )
+                for index in missing
+            ])
+        if embeddings is not None:
+            unmatched = []
+            for position, index in enumerate(missing):
+                similar = self.semantic_cache.search(
+                    embeddings[position],
+                    user_id=user_id,
+                    include_action_items=include_action_items,
+                    include_events=include_events
+                )
+                if similar is None:
+                    unmatched.append(position)
+                else:
+                    await self.cache.set(cache_keys[index], similar)
+                    yield index, mark_cached(similar)
+            missing = [missing[position] for position in unmatched]
+            embeddings = embeddings[unmatched]
+
+            if not missing:
+                return
+
+        async for position, summary in self._stream_uncached_batch(
+            emails=[emails[index] for index in missing],
+            include_action_items=include_action_items,
+            include_events=include_events
+        ):
+            index = missing[position]
+            await self.cache.set(cache_keys[index], summary)
+            if embeddings is not None:
+                self.semantic_cache.add(
+                    embeddings[position],
+                    user_id=user_id,
+                    summary=summary
+                )
+            yield index, summary
+
+    async def _stream_uncached_batch(
+        self,
+        emails: list[dict[str, Any]],
         include_action_items: bool,
         include_events: bool
-    ) -> str:
-        """Build the prompt for email summarization."""
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        """Stream summaries for a batch of emails from Claude, bypassing the cache."""
+        if len(emails) == 1:
+            email = emails[0]
+            yield 0, await self._summarize_uncached(
+                subject=email.get("subject", ""),
+                body=email.get("body", ""),
+                sender=email.get("sender", ""),
+                include_action_items=include_action_items,
+                include_events=include_events
+            )
+            return
         
-        extraction_instructions = []
+        start_time = time.time()
         
-        if include_action_items:
-            extraction_instructions.append("""
-            - "action_items": Array of action items with:
-              - "title": Brief description of the action
-              - "deadline": Date if mentioned (YYYY-MM-DD format), null if not
-              - "priority": "low", "medium", "high", or "urgent"
-              - "assignee": Person responsible if mentioned, null if not""")
+        prompt = self._build_batch_summary_prompt(emails)
+        system = self._build_system_prompt(
+            include_action_items=include_action_items,
+            include_events=include_events
+        )
         
-        if include_events:
-            extraction_instructions.append("""
-            - "detected_events": Array of calendar events with:
-              - "title": Event title
-              - "description": Brief description
-              - "date": Event date (YYYY-MM-DD format)
-              - "time": Event time (HH:MM format, 24-hour)
-              - "duration_minutes": Estimated duration (default 60)
-              - "location": Location if mentioned
-              - "attendees": Array of attendee emails/names
-              - "confidence": 0.0-1.0 how confident you are this is a real event""")
+        parser = JSONArrayStreamParser()
+        received: set[int] = set()
         
-        prompt = f"""Analyze the following email and provide a structured summary.
+        try:
+            async with self.client.messages.stream(
+                model=self.model,
+                # Each email needs its own output budget
+                max_tokens=min(
+                    self.max_tokens * len(emails),
+                    agent_settings.llm_batch_max_tokens
+                ),
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                system=system
+            ) as stream:
+                async for text in stream.text_stream:
+                    for item in parser.feed(text):
+                        index = self._claim_batch_item(
+                            item,
+                            position=parser.object_count - 1,
+                            expected_count=len(emails),
+                            received=received
+                        )
+                        if index is None:
+                            continue
+                        elapsed = time.time() - start_time
+                        item["processing_time_ms"] = int(elapsed * 1000)
+                        item["model_used"] = self.model
+                        yield index, item
 
-EMAIL DETAILS:
-From: {sender}
-Subject: {subject}
+                usage = (await stream.get_final_message()).usage
+
+        except anthropic.APIError as e:
+            logger.error("Claude API error", error=str(e))
+            raise ExternalServiceError(
+                message=f"LLM service error: {str(e)}",
+                service="anthropic"
+            )
+        except Exception as e:
+            logger.error("Error summarizing email batch", error=str(e))
+            raise ExternalServiceError(
+                message=f"Failed to summarize emails: {str(e)}",
+                service="llm"
+            )
+
+        logger.info(
+            "Email batch summarized successfully",
+            email_count=len(emails),
+            tokens_used=usage.input_tokens + usage.output_tokens,
+            processing_time_ms=int((time.time() - start_time) * 1000)
+        )
+
+        # Fall back to single-email calls for anything the batch missed
+        for index, email in enumerate(emails):
+            if index not in received:
+                yield index, await self._summarize_uncached(
+                    subject=email.get("subject", ""),
+                    body=email.get("body", ""),
+                    sender=email.get("sender", ""),
+                    include_action_items=include_action_items,
+                    include_events=include_events
+                )
+
+    def _claim_batch_item(
+        self,
+        item: Any,
+        position: int,
+        expected_count: int,
+        received: set[int]
+    ) -> int | None:
+        """
+        Validate one object from a batched response and claim its email index.
+
+        Returns the email index the item belongs to, or None if the item is
+        malformed, out of range, or a duplicate.
+        """
+        if not isinstance(item, dict) or "summary" not in item:
+            return None
+
+        index = item.pop("index", position)
+        if not isinstance(index, int) or not 0 <= index < expected_count:
+            return None
+        if index in received:
+            return None
+
+        item.setdefault("key_points", [])
+        received.add(index)
+        return index
+
+    def _build_system_prompt(
+        self,
+        include_action_items: bool,
+        include_events: bool
+    ) -> list[dict[str, Any]]:
+        """
+        Get the static system prompt as a cacheable content block.
+
+        Everything that does not depend on the email itself lives here so
+        Anthropic prompt caching can reuse it across calls. The blocks are
+        built once per flag combination at import time.
+        """
+        return SYSTEM_PROMPT_BLOCKS[(include_action_items, include_events)]
+
+    def _build_summary_prompt(
+        self,
+        subject: str,
+        body: str,
+        sender: str
+    ) -> str:
+        """Build the per-email prompt for email summarization."""
+        return SUMMARY_PROMPT_TEMPLATE.format(
+            sender=sender,
+            subject=subject,
+            body=_truncate_to_tokens(body, EMAIL_BODY_TOKEN_BUDGET)
+        )
+
+    def _build_batch_summary_prompt(self, emails: list[dict[str, Any]]) -> str:
+        """Build a single prompt that summarizes several emails at once."""
+
+        email_sections = "\n\n".join(
+            f"""EMAIL {index}:
+From: {email.get("sender", "")}
+Subject: {email.get("subject", "")}
 
 BODY:
-{body[:4000]}  # Truncate very long emails
+{_truncate_to_tokens(email.get("body", ""), EMAIL_BODY_TOKEN_BUDGET)}"""
+            for index, email in enumerate(emails)
+        )
 
-Please respond with a JSON object containing:
-- "summary": A concise 2-3 sentence summary of the email
-- "key_points": Array of 3-5 key points from the email
-- "sentiment": "positive", "negative", or "neutral"
-- "priority": "low", "medium", "high", or "urgent" based on content urgency
-{"".join(extraction_instructions)}
+        prompt = f"""Analyze each of the following {len(emails)} emails.
 
-IMPORTANT: Respond ONLY with valid JSON, no additional text."""
+{email_sections}
+
+Respond with a JSON array containing exactly one object per email, in the same order.
+Each object must include an "index" field with the EMAIL number it refers to."""
 
         return prompt
     
     def _parse_response(self, content: str) -> dict[str, Any]:
         """Parse LLM response into structured data."""
         try:
-            # Try to extract JSON from the response
             content = content.strip()
-            
-            # Handle markdown code blocks
-            if content.startswith("```"):
-                lines = content.split("\n")
-                content = "\n".join(lines[1:-1])
-            
-            result = json.loads(content)
+            result = orjson.loads(_strip_code_fence(content))
             
             # Ensure required fields
             if "summary" not in result:
@@ -185,7 +1181,7 @@ IMPORTANT: Respond ONLY with valid JSON, no additional text."""
             
             return result
             
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning("Failed to parse LLM response as JSON")
             return {
                 "summary": content[:500] if content else "Unable to generate summary",
@@ -213,26 +1209,21 @@ Return a JSON array where each item has:
 - "priority": "low", "medium", "high", or "urgent"
 
 Text:
-{text[:3000]}
+{_truncate_to_tokens(text, EXTRACTION_TEXT_TOKEN_BUDGET)}
 
 Respond with ONLY the JSON array."""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=self.model,
                 max_tokens=1000,
                 messages=[{"role": "user", "content": prompt}]
             )
             
-            content = response.content[0].text.strip()
-            if content.startswith("```"):
-                lines = content.split("\n")
-                content = "\n".join(lines[1:-1])
-            
-            return json.loads(content)
+            return orjson.loads(_strip_code_fence(response.content[0].text.strip()))
             
         except Exception as e:
-            logger.error(f"Error extracting action items: {e}")
+            logger.error("Error extracting action items", error=str(e))
             return []
     
     async def detect_events(self, text: str) -> list[dict[str, Any]]:
@@ -257,24 +1248,19 @@ Return a JSON array where each event has:
 - "confidence": 0.0-1.0 how confident you are
 
 Text:
-{text[:3000]}
+{_truncate_to_tokens(text, EXTRACTION_TEXT_TOKEN_BUDGET)}
 
 Respond with ONLY the JSON array. Return [] if no events found."""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=self.model,
                 max_tokens=1000,
                 messages=[{"role": "user", "content": prompt}]
             )
             
-            content = response.content[0].text.strip()
-            if content.startswith("```"):
-                lines = content.split("\n")
-                content = "\n".join(lines[1:-1])
-            
-            return json.loads(content)
+            return orjson.loads(_strip_code_fence(response.content[0].text.strip()))
             
         except Exception as e:
-            logger.error(f"Error detecting events: {e}")
+            logger.error("Error detecting events", error=str(e))
             return []
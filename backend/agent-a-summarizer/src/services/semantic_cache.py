@@ -0,0 +1,253 @@
+"""
+Semantic Cache
+==============
+
+Near-duplicate cache for LLM email summaries using sentence embeddings.
+
+Threads, replies, and templated emails often differ only by a signature
+or a quoted line, so they miss the exact-hash cache. This cache embeds
+each email and reuses a stored summary when a previous email is similar
+enough.
+
+Entries are partitioned per user, so a summary is only ever reused for
+the same user's mail. Action items and detected events are never reused:
+they carry dates, amounts and names that a near-duplicate may not share,
+so entries are stored without them and only serve requests that do not
+ask for extraction.
+"""
+
+import asyncio
+from collections import OrderedDict
+from typing import Any
+
+from shared.utils import get_logger
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # pragma: no cover - optional dependency
+    SentenceTransformer = None
+
+logger = get_logger(__name__)
+
+# Characters of body text used for the embedding (roughly the prompt budget)
+EMBEDDING_BODY_CHARS = 4000
+
+# Extraction results that are specific to the exact email content
+_CONTENT_SPECIFIC_FIELDS = ("action_items", "detected_events")
+
+
+class _VectorIndex:
+    """
+    Fixed-capacity inner-product index with LRU eviction.
+
+    Vectors are L2-normalized, so the inner product is cosine similarity.
+    The matrix grows geometrically up to capacity, after which evicted
+    slots are overwritten in place to keep it contiguous.
+    """
+
+    def __init__(self, capacity: int, dim: int):
+        self.capacity = capacity
+        self._vectors = np.zeros((min(capacity, 64), dim), dtype=np.float32)
+        self._payloads: list[dict[str, Any] | None] = []
+        self._lru: OrderedDict[int, None] = OrderedDict()
+
+    def search(self, vector: Any) -> tuple[int | None, float]:
+        """Return the most similar slot and its score."""
+        size = len(self._payloads)
+        if size == 0:
+            return None, 0.0
+
+        scores = self._vectors[:size] @ vector
+        slot = int(np.argmax(scores))
+        return slot, float(scores[slot])
+
+    def get(self, slot: int) -> dict[str, Any]:
+        """Return a slot's payload and mark it recently used."""
+        self._lru.move_to_end(slot)
+        return self._payloads[slot]
+
+    def add(self, vector: Any, payload: dict[str, Any]) -> None:
+        """Insert a vector, evicting the least recently used one when full."""
+        if len(self._payloads) < self.capacity:
+            slot = len(self._payloads)
+            self._payloads.append(payload)
+            if slot >= len(self._vectors):
+                rows = min(self.capacity, len(self._vectors) * 2)
+                grown = np.zeros((rows, self._vectors.shape[1]), dtype=np.float32)
+                grown[:slot] = self._vectors
+                self._vectors = grown
+        else:
+            slot, _ = self._lru.popitem(last=False)
+            self._payloads[slot] = payload
+
+        self._vectors[slot] = vector
+        self._lru[slot] = None
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+
+class SemanticCache:
+    """
+    In-process nearest-neighbour cache of email summaries.
+
+    Each user has a separate index, and the least recently used user
+    indexes are dropped beyond max_users. Only requests that extract
+    neither action items nor events are served from the cache. The
+    cache disables itself when the embedding dependencies are not
+    installed or the model fails to load.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        threshold: float = 0.93,
+        capacity: int = 1000,
+        max_users: int = 10000,
+        enabled: bool = False
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            model_name: Sentence-transformers model used for embeddings
+            threshold: Minimum cosine similarity for a cache hit
+            capacity: Maximum entries per user
+            max_users: Maximum number of per-user indexes kept
+            enabled: Whether semantic lookups are performed
+        """
+        self.model_name = model_name
+        self.threshold = threshold
+        self.capacity = capacity
+        self.max_users = max_users
+        self.enabled = enabled and SentenceTransformer is not None
+        self.hits = 0
+        self.misses = 0
+        self._model: Any | None = None
+        self._indexes: OrderedDict[str, _VectorIndex] = OrderedDict()
+
+        if enabled and not self.enabled:
+            logger.warning(
+                "Semantic cache disabled: sentence-transformers is not installed"
+            )
+
+    @staticmethod
+    def serves(include_action_items: bool, include_events: bool) -> bool:
+        """Whether a request with these extraction flags may use the cache."""
+        return not (include_action_items or include_events)
+
+    @staticmethod
+    def embedding_text(subject: str, body: str, sender: str) -> str:
+        """Build the text that represents an email in embedding space."""
+        return f"From: {sender}\nSubject: {subject}\n\n{body[:EMBEDDING_BODY_CHARS]}"
+
+    async def embed(self, texts: list[str]) -> Any | None:
+        """
+        Embed texts off the event loop.
+
+        Args:
+            texts: Texts from embedding_text
+
+        Returns:
+            Normalized embedding matrix, or None if the cache is disabled
+        """
+        if not self.enabled or not texts:
+            return None
+
+        try:
+            if self._model is None:
+                self._model = await asyncio.to_thread(
+                    SentenceTransformer, self.model_name
+                )
+            return await asyncio.to_thread(
+                self._model.encode,
+                texts,
+                normalize_embeddings=True,
+                convert_to_numpy=True
+            )
+        except Exception as e:
+            logger.warning(
+                "Semantic cache disabled after embedding failure", error=str(e)
+            )
+            self.enabled = False
+            return None
+
+    def search(
+        self,
+        embedding: Any,
+        user_id: str,
+        include_action_items: bool,
+        include_events: bool
+    ) -> dict[str, Any] | None:
+        """
+        Find a cached summary for a near-duplicate of one of the user's emails.
+
+        Args:
+            embedding: Normalized embedding of the email
+            user_id: Owner of the email; only their entries are searched
+            include_action_items: Extraction flag of the request
+            include_events: Extraction flag of the request
+
+        Returns:
+            Cached summary (without action items or events) or None on miss
+        """
+        if not self.serves(include_action_items, include_events):
+            return None
+
+        index = self._indexes.get(user_id)
+        if index is None:
+            self.misses += 1
+            return None
+        self._indexes.move_to_end(user_id)
+
+        slot, score = index.search(embedding)
+        if slot is None or score < self.threshold:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.debug("Semantic cache hit", similarity=round(score, 4))
+        return index.get(slot)
+
+    def add(
+        self,
+        embedding: Any,
+        user_id: str,
+        summary: dict[str, Any]
+    ) -> None:
+        """
+        Store a summary under an email embedding in the user's index.
+
+        Action items and detected events are dropped before storing.
+
+        Args:
+            embedding: Normalized embedding of the email
+            user_id: Owner of the email
+            summary: Summary to cache
+        """
+        index = self._indexes.get(user_id)
+        if index is None:
+            index = _VectorIndex(self.capacity, embedding.shape[-1])
+            self._indexes[user_id] = index
+            if len(self._indexes) > self.max_users:
+                self._indexes.popitem(last=False)
+        else:
+            self._indexes.move_to_end(user_id)
+        stripped = {field: [] for field in _CONTENT_SPECIFIC_FIELDS}
+        index.add(embedding, summary | stripped)
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache hit/miss counters."""
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "entries": sum(len(index) for index in self._indexes.values())
+        }
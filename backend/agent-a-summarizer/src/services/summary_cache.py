@@ -0,0 +1,215 @@
+"""
+Summary Cache
+=============
+
+Exact-match cache for LLM email summaries: a small in-process TTL cache
+in front of Redis.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+import redis.asyncio as redis
+
+from shared.utils import get_logger
+
+logger = get_logger(__name__)
+
+# Usage metadata reported for summaries served from a cache
+CACHE_HIT_METADATA = {"tokens_used": 0, "processing_time_ms": 0, "cache_hit": True}
+
+# Field stored alongside each cached summary recording when it was written
+CACHED_AT_FIELD = "_cached_at"
+
+
+def mark_cached(summary: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return a copy of a cached summary with its usage metadata reset.
+
+    A cache hit costs no tokens, so the copy reports zero usage and
+    sets cache_hit. The copy also keeps callers from mutating the
+    cached entry.
+    """
+    return orjson.loads(orjson.dumps(summary, default=str)) | CACHE_HIT_METADATA
+
+
+class SummaryCache:
+    """
+    Cache of email summaries keyed by a hash of the email content.
+
+    Lookups check a bounded in-process TTL cache before Redis, so hot
+    summaries skip the network round trip. Redis failures are logged and
+    treated as misses so that an unavailable Redis never breaks
+    summarization.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        ttl_seconds: int = 3600,
+        key_prefix: str = "agent-a:summary:",
+        local_maxsize: int = 10_000,
+        local_ttl_seconds: int = 3600
+    ):
+        """
+        Initialize summary cache.
+
+        Args:
+            redis_url: Redis connection URL
+            ttl_seconds: Default time-to-live for cached summaries
+            key_prefix: Prefix applied to every Redis key
+            local_maxsize: Maximum entries in the in-process cache
+            local_ttl_seconds: Time-to-live for in-process entries
+        """
+        self.redis_url = redis_url
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self.local_maxsize = local_maxsize
+        self.local_ttl_seconds = min(local_ttl_seconds, ttl_seconds)
+        self.hits = 0
+        self.local_hits = 0
+        self.misses = 0
+        self._client: redis.Redis | None = None
+        # key -> (expires_at, serialized summary), least recently used first
+        self._local: OrderedDict[str, tuple[float, bytes | str]] = OrderedDict()
+
+    @property
+    def client(self) -> redis.Redis:
+        """Get or create Redis client."""
+        if self._client is None:
+            self._client = redis.from_url(self.redis_url, decode_responses=True)
+        return self._client
+
+    async def close(self):
+        """Close Redis connections."""
+        if self._client:
+            await self._client.aclose()
+
+    @staticmethod
+    def make_key(
+        subject: str,
+        body: str,
+        sender: str,
+        include_action_items: bool,
+        include_events: bool,
+        model: str = ""
+    ) -> str:
+        """Build a cache key from the model, email content, and extraction flags."""
+        content = (
+            f"{model}\0{subject}\0{sender}\0{body}"
+            f"\0{include_action_items}\0{include_events}"
+        )
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Get a cached summary.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached summary (see mark_cached) or None on miss
+        """
+        entry = await self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    async def get_entry(self, key: str) -> tuple[dict[str, Any], float] | None:
+        """
+        Get a cached summary together with its age.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            (cached summary, age in seconds) or None on miss. Entries
+            written before ages were recorded report an age of 0.
+        """
+        value = self._get_local(key)
+        if value is not None:
+            self.hits += 1
+            self.local_hits += 1
+            return self._decode_hit(value)
+
+        try:
+            value = await self.client.get(self.key_prefix + key)
+        except Exception as e:
+            logger.warning("Summary cache read failed", error=str(e))
+            value = None
+
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._set_local(key, value)
+        return self._decode_hit(value)
+
+    async def set(
+        self,
+        key: str,
+        value: dict[str, Any],
+        ttl: int | None = None
+    ) -> None:
+        """
+        Store a summary in the cache.
+
+        Args:
+            key: Cache key from make_key
+            value: Summary to cache
+            ttl: Time-to-live in seconds (default: ttl_seconds)
+        """
+        serialized = orjson.dumps(value | {CACHED_AT_FIELD: time.time()}, default=str)
+        self._set_local(key, serialized)
+
+        try:
+            await self.client.set(
+                self.key_prefix + key,
+                serialized,
+                ex=ttl or self.ttl_seconds
+            )
+        except Exception as e:
+            logger.warning("Summary cache write failed", error=str(e))
+
+    def _get_local(self, key: str) -> bytes | str | None:
+        """Read an unexpired entry from the in-process cache."""
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._local[key]
+            return None
+
+        self._local.move_to_end(key)
+        return value
+
+    def _set_local(self, key: str, value: bytes | str) -> None:
+        """Write an entry to the in-process cache, evicting the oldest when full."""
+        self._local[key] = (time.monotonic() + self.local_ttl_seconds, value)
+        self._local.move_to_end(key)
+        if len(self._local) > self.local_maxsize:
+            self._local.popitem(last=False)
+
+    @staticmethod
+    def _decode_hit(value: bytes | str) -> tuple[dict[str, Any], float]:
+        """Decode a cached summary, reset its usage metadata, and compute its age."""
+        summary = orjson.loads(value)
+        cached_at = summary.pop(CACHED_AT_FIELD, None)
+        age = max(time.time() - cached_at, 0.0) if cached_at else 0.0
+        return summary | CACHE_HIT_METADATA, age
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache hit/miss counters."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "local_hits": self.local_hits,
+            "misses": self.misses,
+            "local_entries": len(self._local),
+            "hit_rate": round(self.hits / total, 4) if total else 0.0
+        }
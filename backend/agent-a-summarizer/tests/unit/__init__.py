@@ -0,0 +1 @@
+"""Agent A Unit Tests"""
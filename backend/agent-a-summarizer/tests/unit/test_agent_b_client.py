@@ -0,0 +1,221 @@
+"""
+Agent B Client Tests
+====================
+
+Delegated token caching, the Agent B circuit breaker, and bulk event
+creation including chunking and the per-event fallback.
+"""
+
+import asyncio
+import time
+
+import httpx
+import jwt
+import pytest
+from shared.auth import TokenClaims
+from shared.utils.exceptions import AgentCommunicationError
+from src.services import agent_b_client
+from src.services.agent_b_client import BULK_CREATE_MAX_EVENTS, AgentBClient
+
+
+def _claims(user_id: str = "user_1") -> TokenClaims:
+    now = int(time.time())
+    return TokenClaims(sub=user_id, iss="descope", exp=now + 3600, iat=now)
+
+
+def _jwt(expires_in: float, serial: int) -> str:
+    return jwt.encode(
+        {"exp": int(time.time() + expires_in), "jti": str(serial)},
+        "unit-test-signing-key-of-32-bytes",
+        algorithm="HS256"
+    )
+
+
+class FakeDescope:
+    """Hands out delegated tokens and counts how many were created."""
+
+    def __init__(self, expires_in: float = 3600):
+        self.expires_in = expires_in
+        self.created = 0
+
+    async def create_delegated_token(self, user_id, target_agent, scopes, **kwargs):
+        self.created += 1
+        # Let concurrent callers pile up on the lock
+        await asyncio.sleep(0)
+        return _jwt(self.expires_in, self.created)
+
+
+class FailingHTTPClient:
+    """Answers every request with a connection error or a fixed status."""
+
+    def __init__(self, status_code: int | None = None):
+        self.status_code = status_code
+        self.calls = 0
+
+    async def request(self, method, url, **kwargs):
+        self.calls += 1
+        if self.status_code is None:
+            raise httpx.ConnectError("connection refused")
+        return httpx.Response(self.status_code)
+
+
+def _events(count: int) -> list[dict]:
+    return [{"title": f"Event {index}"} for index in range(count)]
+
+
+class FakeAgentB:
+    """Records requests sent through AgentBClient._send and answers them."""
+
+    def __init__(self, bulk_status: int = 201):
+        self.bulk_status = bulk_status
+        self.bulk_sizes: list[int] = []
+        self.single_calls = 0
+
+    async def send(self, method, url, **kwargs):
+        if url.endswith("/events/bulk"):
+            events = kwargs["json"]["events"]
+            self.bulk_sizes.append(len(events))
+            if self.bulk_status != 201:
+                return httpx.Response(self.bulk_status)
+            return httpx.Response(201, json={
+                "events": [{"id": event["title"]} for event in events],
+                "created_count": len(events),
+                "failed_count": 0
+            })
+        self.single_calls += 1
+        return httpx.Response(201, json={"id": kwargs["json"]["title"]})
+
+
+@pytest.fixture
+def agent_b():
+    return FakeAgentB()
+
+
+@pytest.fixture
+def descope():
+    return FakeDescope()
+
+
+@pytest.fixture
+def client(agent_b, descope):
+    client = AgentBClient()
+    client._send = agent_b.send
+    client._descope_client = descope
+    return client
+
+
+async def test_token_is_reused_for_same_user_and_scopes(client, descope):
+    first = await client.get_delegated_token(_claims(), ["b", "a"])
+    second = await client.get_delegated_token(_claims(), ["a", "b"])
+
+    assert first == second
+    assert descope.created == 1
+
+
+async def test_concurrent_requests_share_one_delegation(client, descope):
+    tokens = await asyncio.gather(
+        *(client.get_delegated_token(_claims(), ["a"]) for _ in range(5))
+    )
+
+    assert len(set(tokens)) == 1
+    assert descope.created == 1
+
+
+async def test_token_near_expiry_is_refreshed(client, descope):
+    descope.expires_in = agent_b_client.TOKEN_REFRESH_MARGIN_SECONDS / 2
+
+    await client.get_delegated_token(_claims(), ["a"])
+    await client.get_delegated_token(_claims(), ["a"])
+
+    assert descope.created == 2
+
+
+async def test_rejected_token_is_not_reused(client, descope):
+    token = await client.get_delegated_token(_claims(), ["a"])
+
+    client._invalidate_token(token)
+
+    assert await client.get_delegated_token(_claims(), ["a"]) != token
+    assert descope.created == 2
+
+
+async def test_token_cache_evicts_least_recently_used(client, monkeypatch):
+    monkeypatch.setattr(agent_b_client, "TOKEN_CACHE_SIZE", 2)
+
+    await client.get_delegated_token(_claims("user_1"), ["a"])
+    await client.get_delegated_token(_claims("user_2"), ["a"])
+    await client.get_delegated_token(_claims("user_1"), ["a"])
+    await client.get_delegated_token(_claims("user_3"), ["a"])
+
+    assert [user for user, _ in client._token_cache] == ["user_1", "user_3"]
+    assert ("user_2", ("a",)) not in client._token_locks
+
+
+async def test_bulk_requests_are_chunked_to_agent_b_limit(client, agent_b):
+    events = _events(2 * BULK_CREATE_MAX_EVENTS + 5)
+
+    created = await client.create_events_bulk(token="t", events=events)
+
+    assert agent_b.bulk_sizes == [BULK_CREATE_MAX_EVENTS, BULK_CREATE_MAX_EVENTS, 5]
+    assert [event["id"] for event in created] == [event["title"] for event in events]
+    assert agent_b.single_calls == 0
+
+
+async def test_no_request_for_no_events(client, agent_b):
+    assert await client.create_events_bulk(token="t", events=[]) == []
+    assert agent_b.bulk_sizes == []
+
+
+@pytest.mark.parametrize("status_code", [404, 405])
+async def test_falls_back_to_single_creates_without_bulk_endpoint(
+    client, agent_b, status_code
+):
+    agent_b.bulk_status = status_code
+
+    created = await client.create_events_bulk(token="t", events=_events(3))
+
+    assert len(created) == 3
+    assert agent_b.single_calls == 3
+    # Remembered, so the next call goes straight to the fallback
+    await client.create_events_bulk(token="t", events=_events(2))
+    assert agent_b.bulk_sizes == [3]
+    assert agent_b.single_calls == 5
+
+
+async def test_fallback_covers_chunks_not_yet_sent(client, agent_b):
+    agent_b.bulk_status = 404
+
+    created = await client.create_events_bulk(
+        token="t", events=_events(BULK_CREATE_MAX_EVENTS + 1)
+    )
+
+    assert agent_b.bulk_sizes == [BULK_CREATE_MAX_EVENTS]
+    assert len(created) == BULK_CREATE_MAX_EVENTS + 1
+
+
+@pytest.mark.parametrize("status_code", [None, 503])
+async def test_breaker_fails_fast_after_repeated_failures(monkeypatch, status_code):
+    http = FailingHTTPClient(status_code)
+    monkeypatch.setattr(agent_b_client, "get_client", lambda: http)
+    client = AgentBClient()
+
+    for _ in range(client._breaker.fail_max):
+        try:
+            await client._send("GET", "http://agent-b/api/v1/events")
+        except AgentCommunicationError:
+            pass
+
+    with pytest.raises(AgentCommunicationError, match="circuit open"):
+        await client._send("GET", "http://agent-b/api/v1/events")
+    assert http.calls == client._breaker.fail_max
+
+
+async def test_client_errors_do_not_open_the_breaker(monkeypatch):
+    http = FailingHTTPClient(404)
+    monkeypatch.setattr(agent_b_client, "get_client", lambda: http)
+    client = AgentBClient()
+
+    for _ in range(client._breaker.fail_max + 1):
+        await client._send("GET", "http://agent-b/api/v1/events")
+
+    assert http.calls == client._breaker.fail_max + 1
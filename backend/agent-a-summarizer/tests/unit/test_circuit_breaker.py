@@ -0,0 +1,114 @@
+"""
+Circuit Breaker Tests
+=====================
+
+State transitions of the shared circuit breaker used for Agent B calls.
+"""
+
+import asyncio
+
+import pytest
+from shared.utils import CircuitBreaker
+from shared.utils.exceptions import CircuitOpenError
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.fail_max):
+        breaker.before_call()
+        breaker.record_failure()
+
+
+def test_opens_after_fail_max_consecutive_failures():
+    breaker = CircuitBreaker("test", fail_max=3, reset_timeout=60)
+
+    _open(breaker)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError) as raised:
+        breaker.before_call()
+    assert raised.value.details["circuit"] == "test"
+    assert 0 < raised.value.details["retry_after_seconds"] <= 60
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker("test", fail_max=3, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_allows_a_single_trial_call():
+    breaker = CircuitBreaker("test", fail_max=1, reset_timeout=0)
+    _open(breaker)
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_successful_trial_closes_the_breaker():
+    breaker = CircuitBreaker("test", fail_max=1, reset_timeout=0)
+    _open(breaker)
+
+    breaker.before_call()
+    breaker.record_success()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failed_trial_reopens_the_breaker():
+    breaker = CircuitBreaker("test", fail_max=5, reset_timeout=0)
+    _open(breaker)
+    breaker.before_call()
+    breaker.reset_timeout = 60
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_released_trial_frees_the_slot():
+    breaker = CircuitBreaker("test", fail_max=1, reset_timeout=0)
+    _open(breaker)
+
+    breaker.before_call()
+    breaker.release()
+
+    breaker.before_call()
+
+
+async def test_context_manager_counts_exceptions_as_failures():
+    breaker = CircuitBreaker("test", fail_max=1, reset_timeout=60)
+
+    with pytest.raises(ValueError):
+        async with breaker:
+            raise ValueError("boom")
+
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+async def test_context_manager_ignores_excluded_exceptions():
+    breaker = CircuitBreaker(
+        "test", fail_max=1, reset_timeout=60, exclude=(KeyError,)
+    )
+
+    with pytest.raises(KeyError):
+        async with breaker:
+            raise KeyError("missing")
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+async def test_cancellation_does_not_count_as_failure():
+    breaker = CircuitBreaker("test", fail_max=1, reset_timeout=60)
+
+    with pytest.raises(asyncio.CancelledError):
+        async with breaker:
+            raise asyncio.CancelledError()
+
+    assert breaker.failure_count == 0
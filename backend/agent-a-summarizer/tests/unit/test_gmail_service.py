@@ -0,0 +1,162 @@
+"""
+Gmail Service Tests
+===================
+
+Fetching messages through the shared aiogoogle client.
+"""
+
+import asyncio
+import base64
+
+import pytest
+from src.services import gmail_service
+from src.services.gmail_service import (
+    GMAIL_MAX_CONCURRENCY,
+    PARSED_HEADERS,
+    GmailService,
+)
+
+
+def _message(message_id: str, body: str = "") -> dict:
+    return {
+        "id": message_id,
+        "threadId": f"thread_{message_id}",
+        "labelIds": ["UNREAD"],
+        "payload": {
+            "mimeType": "multipart/alternative",
+            "headers": [
+                {"name": "Subject", "value": f"Subject {message_id}"},
+                {"name": "From", "value": "Ada Lovelace <ada@example.com>"}
+            ],
+            "parts": [
+                {
+                    "mimeType": "text/plain",
+                    "body": {"data": base64.urlsafe_b64encode(body.encode()).decode()}
+                }
+            ]
+        }
+    }
+
+
+class FakeMessages:
+    """Builds request descriptors in place of aiogoogle requests."""
+
+    def list(self, **params):
+        return ("list", params)
+
+    def get(self, **params):
+        return ("get", params)
+
+
+class FakeGmail:
+    """Stands in for the discovered Gmail v1 resource."""
+
+    def __init__(self):
+        self.users = type("Users", (), {"messages": FakeMessages()})()
+
+
+class FakeAiogoogle:
+    """Answers Gmail requests from a dict of messages."""
+
+    discoveries = 0
+
+    def __init__(self):
+        self.messages: dict[str, dict] = {}
+        self.requests: list[tuple[str, dict]] = []
+        self.tokens: set[str] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def discover(self, api_name, version):
+        FakeAiogoogle.discoveries += 1
+        await asyncio.sleep(0)
+        return FakeGmail()
+
+    async def as_user(self, request, user_creds, timeout):
+        kind, params = request
+        self.requests.append(request)
+        self.tokens.add(user_creds.access_token)
+        if kind == "list":
+            return {"messages": [{"id": key} for key in self.messages]}
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if params["id"] not in self.messages:
+            raise RuntimeError("HTTP 404 Not Found")
+        return self.messages[params["id"]]
+
+
+@pytest.fixture
+def google():
+    return FakeAiogoogle()
+
+
+@pytest.fixture
+def service(google):
+    service = GmailService()
+    service._client = google
+    service._gmail = FakeGmail()
+    return service
+
+
+async def test_list_requests_only_parsed_headers(service, google):
+    google.messages = {"m1": _message("m1"), "m2": _message("m2")}
+
+    result = await service.list_emails("user_1", access_token="token")
+
+    assert [email["id"] for email in result["emails"]] == ["m1", "m2"]
+    gets = [params for kind, params in google.requests if kind == "get"]
+    assert {params["format"] for params in gets} == {"metadata"}
+    assert all(params["metadataHeaders"] == list(PARSED_HEADERS) for params in gets)
+    assert google.tokens == {"token"}
+
+
+async def test_batch_fetch_is_deduplicated_and_bounded(service, google):
+    ids = [f"m{index}" for index in range(3 * GMAIL_MAX_CONCURRENCY)]
+    google.messages = {email_id: _message(email_id) for email_id in ids}
+
+    details = await service.get_emails_batch("user_1", ids + ids[:5], "token")
+
+    assert list(details) == ids
+    assert len(google.requests) == len(ids)
+    assert google.max_in_flight <= GMAIL_MAX_CONCURRENCY
+
+
+async def test_missing_message_in_batch_is_none(service, google):
+    google.messages = {"m1": _message("m1")}
+
+    details = await service.get_emails_batch("user_1", ["m1", "gone"], "token")
+
+    assert details["m1"]["id"] == "m1"
+    assert details["gone"] is None
+
+
+async def test_full_message_body_is_decoded(service, google):
+    google.messages = {"m1": _message("m1", body="Lunch at noon?")}
+
+    email = await service.get_email("user_1", "m1", access_token="token")
+
+    assert email["body"] == "Lunch at noon?"
+    assert email["sender_name"] == "Ada Lovelace"
+    assert email["is_unread"] is True
+
+
+async def test_discovery_runs_once_for_concurrent_callers(monkeypatch):
+    monkeypatch.setattr(gmail_service, "Aiogoogle", FakeAiogoogle)
+    FakeAiogoogle.discoveries = 0
+    service = GmailService()
+
+    apis = await asyncio.gather(*(service._get_api() for _ in range(5)))
+
+    assert FakeAiogoogle.discoveries == 1
+    assert len({id(gmail) for _, gmail in apis}) == 1
+    await service.close()
+    assert service._client is None
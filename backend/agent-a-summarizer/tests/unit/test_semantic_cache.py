@@ -0,0 +1,135 @@
+"""
+Semantic Cache Tests
+====================
+
+Per-user isolation and extraction safety of the near-duplicate cache.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.services.semantic_cache import SemanticCache
+
+
+def _unit(*values: float):
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+SUMMARY = {
+    "summary": "Quarterly planning meeting with the finance team.",
+    "key_points": ["Budget review"],
+    "action_items": [{"title": "Send Q3 numbers"}],
+    "detected_events": [{"title": "Planning", "date": "2024-01-16", "time": "15:00"}],
+    "sentiment": "neutral",
+    "priority": "medium"
+}
+
+
+@pytest.fixture
+def cache():
+    """Semantic cache with a fixed threshold; search/add need no model."""
+    return SemanticCache(threshold=0.9)
+
+
+def test_hit_for_same_user(cache):
+    cache.add(_unit(1, 0, 0), user_id="user_1", summary=SUMMARY)
+
+    hit = cache.search(
+        _unit(1, 0.05, 0),
+        user_id="user_1",
+        include_action_items=False,
+        include_events=False
+    )
+
+    assert hit is not None
+    assert hit["summary"] == SUMMARY["summary"]
+
+
+def test_never_served_to_another_user(cache):
+    cache.add(_unit(1, 0, 0), user_id="user_1", summary=SUMMARY)
+
+    # Identical embedding, different owner
+    hit = cache.search(
+        _unit(1, 0, 0),
+        user_id="user_2",
+        include_action_items=False,
+        include_events=False
+    )
+
+    assert hit is None
+
+
+def test_other_users_entries_do_not_shadow_own(cache):
+    cache.add(_unit(1, 0, 0), user_id="user_1", summary=SUMMARY)
+    cache.add(_unit(0, 1, 0), user_id="user_2", summary=SUMMARY | {"summary": "Other"})
+
+    hit = cache.search(
+        _unit(0, 1, 0),
+        user_id="user_1",
+        include_action_items=False,
+        include_events=False
+    )
+
+    assert hit is None
+
+
+def test_extraction_fields_are_not_stored(cache):
+    cache.add(_unit(1, 0, 0), user_id="user_1", summary=SUMMARY)
+
+    hit = cache.search(
+        _unit(1, 0, 0),
+        user_id="user_1",
+        include_action_items=False,
+        include_events=False
+    )
+
+    assert hit["action_items"] == []
+    assert hit["detected_events"] == []
+    # The caller's summary is left untouched
+    assert SUMMARY["detected_events"]
+
+
+@pytest.mark.parametrize(
+    ("include_action_items", "include_events"),
+    [(True, False), (False, True), (True, True)]
+)
+def test_extraction_requests_bypass_cache(cache, include_action_items, include_events):
+    cache.add(_unit(1, 0, 0), user_id="user_1", summary=SUMMARY)
+
+    hit = cache.search(
+        _unit(1, 0, 0),
+        user_id="user_1",
+        include_action_items=include_action_items,
+        include_events=include_events
+    )
+
+    assert hit is None
+
+
+def test_below_threshold_misses(cache):
+    cache.add(_unit(1, 0, 0), user_id="user_1", summary=SUMMARY)
+
+    hit = cache.search(
+        _unit(1, 1, 0),
+        user_id="user_1",
+        include_action_items=False,
+        include_events=False
+    )
+
+    assert hit is None
+
+
+def test_least_recently_used_user_is_evicted():
+    cache = SemanticCache(threshold=0.9, max_users=2)
+    cache.add(_unit(1, 0, 0), user_id="user_1", summary=SUMMARY)
+    cache.add(_unit(1, 0, 0), user_id="user_2", summary=SUMMARY)
+    cache.add(_unit(1, 0, 0), user_id="user_3", summary=SUMMARY)
+
+    assert cache.search(_unit(1, 0, 0), "user_1", False, False) is None
+    assert cache.search(_unit(1, 0, 0), "user_3", False, False) is not None
+
+
+def test_disabled_by_default():
+    assert SemanticCache().enabled is False
@@ -0,0 +1,102 @@
+"""
+Stream Parser Tests
+===================
+
+Incremental splitting of streamed LLM JSON output.
+"""
+
+import orjson
+import pytest
+from src.services.llm_service import JSONArrayStreamParser, JSONObjectStreamParser
+
+SUMMARIES = [
+    {"index": 0, "summary": "Budget {draft} attached", "key_points": ["a", "b"]},
+    {"index": 1, "summary": 'He said "ship it" [today]', "detected_events": []},
+    {"index": 2, "summary": "Path C:\\temp\\ and a trailing \\"},
+]
+
+
+def _feed_in_pieces(parser, text: str, size: int) -> list:
+    completed = []
+    for start in range(0, len(text), size):
+        completed.extend(parser.feed(text[start:start + size]))
+    return completed
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1000])
+def test_array_elements_survive_any_chunking(size):
+    text = orjson.dumps(SUMMARIES).decode()
+
+    parser = JSONArrayStreamParser()
+
+    assert _feed_in_pieces(parser, text, size) == SUMMARIES
+    assert parser.object_count == len(SUMMARIES)
+
+
+def test_array_element_returned_when_its_brace_closes():
+    parser = JSONArrayStreamParser()
+
+    assert parser.feed('[{"index": 0, "summary": "done"}, {"index": 1, ') == [
+        {"index": 0, "summary": "done"}
+    ]
+    assert parser.feed('"summary": "next"}]') == [{"index": 1, "summary": "next"}]
+
+
+def test_array_ignores_code_fence():
+    text = "```json\n" + orjson.dumps(SUMMARIES[:1]).decode() + "\n```"
+
+    assert JSONArrayStreamParser().feed(text) == SUMMARIES[:1]
+
+
+def test_array_skips_unparseable_element():
+    parser = JSONArrayStreamParser()
+
+    completed = parser.feed('[{"index": 0, "summary": oops}, {"index": 1}]')
+
+    assert completed == [{"index": 1}]
+    # Still counted, so callers can tell the model produced it
+    assert parser.object_count == 2
+
+
+@pytest.mark.parametrize("size", [1, 4, 1000])
+def test_object_fields_survive_any_chunking(size):
+    summary = {
+        "summary": "Lunch, then {review}",
+        "key_points": ["one, two", "three"],
+        "detected_events": [{"title": "Review", "attendees": ["a", "b"]}],
+        "priority": "high",
+    }
+    text = orjson.dumps(summary).decode()
+
+    parser = JSONObjectStreamParser()
+
+    assert _feed_in_pieces(parser, text, size) == list(summary.items())
+    assert parser.fields == summary
+    assert parser.complete is True
+
+
+def test_object_field_returned_before_the_rest_is_generated():
+    parser = JSONObjectStreamParser()
+
+    assert parser.feed('{"summary": "Quarterly review", "key_points": ["a"') == [
+        ("summary", "Quarterly review")
+    ]
+    assert parser.feed(', "b"]}') == [("key_points", ["a", "b"])]
+
+
+def test_object_skips_unparseable_field():
+    parser = JSONObjectStreamParser()
+
+    completed = parser.feed('{"summary": nope, "priority": "low"}')
+
+    assert completed == [("priority", "low")]
+    assert parser.complete is False
+
+
+def test_object_truncated_stream_is_not_complete():
+    parser = JSONObjectStreamParser()
+
+    parser.feed('{"summary": "Quarterly review", "key_points": ["a"')
+
+    assert parser.fields == {"summary": "Quarterly review"}
+    assert parser.complete is False
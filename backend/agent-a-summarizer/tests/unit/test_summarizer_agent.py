@@ -0,0 +1,32 @@
+"""
+Summarizer Agent Tests
+======================
+
+Routing decisions of the LangGraph summarizer workflow.
+"""
+
+from langgraph.graph import END
+from src.agents.summarizer import SummarizerAgent
+
+EVENT = {"title": "Planning", "confidence": 0.95}
+
+
+def test_routes_to_event_creation_with_token_and_confident_event():
+    state = {"delegated_token": "token", "detected_events": [EVENT]}
+
+    assert SummarizerAgent.should_create_events(state) == "create_events"
+
+
+def test_skips_event_creation_without_delegated_token():
+    state = {"delegated_token": None, "detected_events": [EVENT]}
+
+    assert SummarizerAgent.should_create_events(state) == END
+
+
+def test_skips_event_creation_for_low_confidence_events():
+    state = {
+        "delegated_token": "token",
+        "detected_events": [EVENT | {"confidence": 0.1}]
+    }
+
+    assert SummarizerAgent.should_create_events(state) == END
@@ -0,0 +1,130 @@
+"""
+Summary Cache Tests
+===================
+
+In-process tier, Redis fallback and failure handling of the exact-match
+summary cache.
+"""
+
+import time
+
+import orjson
+import pytest
+from src.services.summary_cache import CACHED_AT_FIELD, SummaryCache, mark_cached
+
+SUMMARY = {
+    "summary": "Quarterly planning meeting with the finance team.",
+    "key_points": ["Budget review"],
+    "tokens_used": 812,
+    "processing_time_ms": 1400
+}
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the async Redis client."""
+
+    def __init__(self, fail: bool = False):
+        self.data: dict[str, str] = {}
+        self.fail = fail
+        self.gets = 0
+
+    async def get(self, key):
+        self.gets += 1
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data[key] = value.decode() if isinstance(value, bytes) else value
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(redis_client):
+    cache = SummaryCache(redis_url="redis://unused")
+    cache._client = redis_client
+    return cache
+
+
+def test_mark_cached_returns_independent_copy():
+    cached = mark_cached(SUMMARY)
+    cached["key_points"].append("mutated")
+
+    assert SUMMARY["key_points"] == ["Budget review"]
+    assert cached["tokens_used"] == 0
+    assert cached["cache_hit"] is True
+
+
+def test_key_depends_on_extraction_flags():
+    with_events = SummaryCache.make_key("s", "b", "f", False, True)
+    without_events = SummaryCache.make_key("s", "b", "f", False, False)
+
+    assert with_events != without_events
+
+
+async def test_hit_is_served_from_process_without_redis(cache, redis_client):
+    await cache.set("k", SUMMARY)
+
+    hit = await cache.get("k")
+
+    assert hit["summary"] == SUMMARY["summary"]
+    assert hit["tokens_used"] == 0
+    assert redis_client.gets == 0
+    assert cache.stats()["local_hits"] == 1
+
+
+async def test_expired_local_entry_falls_back_to_redis(cache, redis_client):
+    cache.local_ttl_seconds = 0
+    await cache.set("k", SUMMARY)
+
+    hit = await cache.get("k")
+
+    assert hit["summary"] == SUMMARY["summary"]
+    assert redis_client.gets == 1
+
+
+async def test_entry_age_is_reported(cache, redis_client):
+    written = time.time() - 120
+    redis_client.data[cache.key_prefix + "k"] = orjson.dumps(
+        SUMMARY | {CACHED_AT_FIELD: written}
+    ).decode()
+
+    _, age = await cache.get_entry("k")
+
+    assert 119 <= age <= 130
+
+
+async def test_cached_at_field_not_exposed(cache):
+    await cache.set("k", SUMMARY)
+
+    hit = await cache.get("k")
+
+    assert CACHED_AT_FIELD not in hit
+
+
+async def test_redis_failure_is_a_miss():
+    cache = SummaryCache(redis_url="redis://unused")
+    cache._client = FakeRedis(fail=True)
+
+    # Neither call raises; the write still lands in the process tier
+    assert await cache.get("missing") is None
+    await cache.set("k", SUMMARY)
+
+    assert (await cache.get("k"))["summary"] == SUMMARY["summary"]
+    assert cache.stats()["misses"] == 1
+
+
+async def test_local_tier_evicts_least_recently_used(cache, redis_client):
+    cache.local_maxsize = 2
+    await cache.set("a", SUMMARY)
+    await cache.set("b", SUMMARY)
+    await cache.get("a")
+    await cache.set("c", SUMMARY)
+
+    assert set(cache._local) == {"a", "c"}
@@ -5,13 +5,24 @@ FastAPI Dependencies
 Dependency injection for Agent B services.
 """
 
-from functools import lru_cache
-
 from ..services.calendar_service import CalendarService
 from ..core.config import agent_settings
 
+# Process-wide calendar service, created on first use
+_calendar_service: CalendarService | None = None
+
 
-@lru_cache
-def get_calendar_service() -> CalendarService:
+async def get_calendar_service() -> CalendarService:
     """Get Calendar service instance."""
-    return CalendarService()
+    global _calendar_service
+    if _calendar_service is None:
+        _calendar_service = CalendarService()
+    return _calendar_service
+
+
+async def close_calendar_service() -> None:
+    """Close the Calendar service if it was created."""
+    global _calendar_service
+    if _calendar_service is not None:
+        await _calendar_service.close()
+        _calendar_service = None
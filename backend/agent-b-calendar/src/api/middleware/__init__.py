@@ -1,5 +1,6 @@
 """Agent B Middleware Package"""
 
 from .auth_middleware import TokenValidationMiddleware
+from .profiler_middleware import ProfilerMiddleware
 
-__all__ = ["TokenValidationMiddleware"]
+__all__ = ["TokenValidationMiddleware", "ProfilerMiddleware"]
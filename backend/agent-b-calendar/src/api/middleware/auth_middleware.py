@@ -5,97 +5,118 @@ Authentication Middleware
 Middleware for validating tokens and enforcing authentication.
 """
 
+import itertools
 import time
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from shared.utils import get_logger
 
+from ...core.config import agent_settings
+
 logger = get_logger(__name__)
 
+# Paths that don't require authentication
+PUBLIC_PATHS: frozenset[str] = frozenset({
+    "/",
+    "/health",
+    "/ready",
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+})
+
+# Orchestrator probes, passed through without timing or logging
+PROBE_PATHS: frozenset[str] = frozenset({"/health", "/ready"})
+
 
-class TokenValidationMiddleware(BaseHTTPMiddleware):
+class TokenValidationMiddleware:
     """
     Middleware that logs requests and validates token presence.
     
-    Note: Actual token validation is done by the `validate_token` dependency.
-    This middleware provides logging and can enforce token presence for
-    non-public endpoints.
+    Note: Actual token validation is done by the `validate_token` dependency,
+    which also rejects and logs requests without a token. This middleware
+    emits one combined log record per request at response time. Error
+    responses (4xx and 5xx) are always logged; successful ones are sampled
+    to one in `request_log_sample_rate`.
+    Health and readiness probes bypass the middleware entirely.
+    
+    Implemented as pure ASGI middleware: it reads the path and headers
+    straight from the connection scope and adds the timing header by
+    wrapping `send`, so no Request/Response objects or extra task are
+    created per request.
     """
     
-    # Paths that don't require authentication
-    PUBLIC_PATHS = {
-        "/",
-        "/health",
-        "/ready",
-        "/docs",
-        "/redoc",
-        "/openapi.json",
-        "/api/v1/health",
-        "/api/v1/ready",
-    }
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._sample_rate = max(agent_settings.request_log_sample_rate, 1)
+        self._request_counter = itertools.count()
     
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Response]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and log authentication info."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        start_time = time.time()
-        path = request.url.path
-        method = request.method
+        path = scope["path"]
+        if path in PROBE_PATHS:
+            await self.app(scope, receive, send)
+            return
         
-        # Extract client info
-        client_host = request.client.host if request.client else "unknown"
-        source_agent = request.headers.get("X-Source-Agent", "direct")
-        is_delegation = request.headers.get("X-Delegation", "false") == "true"
+        start_time = time.perf_counter()
+        method = scope["method"]
         
-        # Check for auth header
-        auth_header = request.headers.get("Authorization", "")
-        has_token = auth_header.startswith("Bearer ")
+        # Scan raw header bytes once; ASGI header names are lowercase
+        source_agent = b"direct"
+        is_delegation = False
+        has_token = False
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                has_token = value[:7] == b"Bearer "
+            elif name == b"x-source-agent":
+                source_agent = value
+            elif name == b"x-delegation":
+                is_delegation = value == b"true"
         
-        # Log request
-        logger.info(
-            "Incoming request",
-            method=method,
-            path=path,
-            client=client_host,
-            source_agent=source_agent,
-            is_delegation=is_delegation,
-            has_auth=has_token
-        )
+        response_started = False
         
-        # Check if path requires auth
-        if path not in self.PUBLIC_PATHS and not has_token:
-            # Let the endpoint's Depends handle the actual error
-            # This is just for logging purposes
-            logger.warning(
-                "Request without auth token to protected path",
-                path=path
-            )
+        async def send_with_timing(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                duration = (time.perf_counter() - start_time) * 1000
+                
+                # Log request and response as one record
+                status_code = message["status"]
+                if (
+                    status_code >= 400
+                    or next(self._request_counter) % self._sample_rate == 0
+                ):
+                    client = scope.get("client")
+                    logger.info(
+                        "Request completed",
+                        method=method,
+                        path=path,
+                        client=client[0] if client else "unknown",
+                        source_agent=source_agent.decode("latin-1"),
+                        is_delegation=is_delegation,
+                        has_auth=has_token,
+                        public_path=path in PUBLIC_PATHS,
+                        status_code=status_code,
+                        duration_ms=round(duration, 2)
+                    )
+                
+                # Add timing header
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-response-time", f"{duration:.2f}ms".encode("latin-1"))
+                ]
+            await send(message)
         
         # Process request
         try:
-            response = await call_next(request)
-            
-            # Log response
-            duration = (time.time() - start_time) * 1000
-            logger.info(
-                "Request completed",
-                method=method,
-                path=path,
-                status_code=response.status_code,
-                duration_ms=round(duration, 2)
-            )
-            
-            # Add timing header
-            response.headers["X-Response-Time"] = f"{duration:.2f}ms"
-            
-            return response
+            await self.app(scope, receive, send_with_timing)
             
         except Exception as e:
             logger.error(
@@ -104,7 +125,10 @@ class TokenValidationMiddleware(BaseHTTPMiddleware):
                 path=path,
                 error=str(e)
             )
-            return JSONResponse(
+            if response_started:
+                raise
+            response = JSONResponse(
                 status_code=500,
                 content={"detail": "Internal server error"}
             )
+            await response(scope, receive, send)
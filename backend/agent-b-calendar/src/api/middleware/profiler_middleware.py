@@ -0,0 +1,73 @@
+"""
+Profiler Middleware
+===================
+
+On-demand request profiling with pyinstrument for debug deployments.
+"""
+
+from urllib.parse import parse_qs
+
+from starlette.responses import HTMLResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from shared.utils import get_logger
+
+try:
+    from pyinstrument import Profiler
+except ImportError:  # pragma: no cover - optional dependency
+    Profiler = None
+
+logger = get_logger(__name__)
+
+
+def _profiling_requested(query_string: bytes) -> bool:
+    """Whether a raw query string carries `profile=1`."""
+    if b"profile=" not in query_string:
+        return False
+    return parse_qs(query_string.decode("latin-1")).get("profile") == ["1"]
+
+
+class ProfilerMiddleware:
+    """
+    Middleware that profiles a request when `?profile=1` is present.
+    
+    The wrapped response is discarded and replaced with pyinstrument's
+    HTML report, so operators can see where time is spent in a request
+    from a browser. Requests without the query parameter pass straight
+    through after a single bytes check on the raw query string; the rest
+    are parsed so only an exact `profile=1` is profiled.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        if Profiler is None:
+            logger.warning("Request profiling disabled: pyinstrument is not installed")
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Profile the request if asked to, otherwise pass it through."""
+        if (
+            Profiler is None
+            or scope["type"] != "http"
+            or not _profiling_requested(scope["query_string"])
+        ):
+            await self.app(scope, receive, send)
+            return
+        
+        async def discard(message: Message) -> None:
+            pass
+        
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, discard)
+        finally:
+            profiler.stop()
+        
+        logger.info(
+            "Request profiled",
+            method=scope["method"],
+            path=scope["path"],
+            duration_ms=round(profiler.last_session.duration * 1000, 2)
+        )
+        response = HTMLResponse(profiler.output_html())
+        await response(scope, receive, send)
@@ -5,12 +5,12 @@ Calendar Routes
 API endpoints for calendar management.
 """
 
-from datetime import datetime
+from datetime import date
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Header, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, status
 
-from shared.auth import TokenClaims, validate_token, require_scope, Scope
+from shared.auth import TokenClaims
 from shared.utils import get_logger
 
 from ..dependencies import get_calendar_service
@@ -19,10 +19,11 @@ from ...schemas.calendar import (
     CalendarEventUpdate,
     CalendarEventResponse,
     CalendarEventsListResponse,
+    CalendarEventsBulkCreate,
+    CalendarEventsBulkResponse,
 )
 from ...services.calendar_service import CalendarService
-from ...core.scopes import CalendarScope, enforce_scope, validate_delegation
-from ...core.config import agent_settings
+from ...core.scopes import require_read, require_write
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -30,10 +31,10 @@ logger = get_logger(__name__)
 
 @router.get("/events", response_model=CalendarEventsListResponse)
 async def list_events(
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
+    start_date: date | None = Query(default=None, description="Start date (YYYY-MM-DD)"),
+    end_date: date | None = Query(default=None, description="End date (YYYY-MM-DD)"),
     max_results: int = 50,
-    claims: TokenClaims = Depends(validate_token),
+    claims: TokenClaims = Depends(require_read),
     calendar_service: CalendarService = Depends(get_calendar_service),
     x_source_agent: Optional[str] = Header(default=None),
 ):
@@ -43,13 +44,6 @@ async def list_events(
     Requires `calendar.read` scope.
     Accepts delegated tokens from Agent A.
     """
-    # Enforce scope
-    enforce_scope(claims, CalendarScope.READ)
-    
-    # Validate delegation if from another agent
-    if claims.delegation or x_source_agent:
-        validate_delegation(claims, agent_settings.allowed_source_agents)
-    
     logger.info(
         f"Listing calendar events",
         user_id=claims.sub,
@@ -64,10 +58,8 @@ async def list_events(
             max_results=max_results
         )
         
-        return CalendarEventsListResponse(
-            events=events,
-            total_count=len(events)
-        )
+        # response_model validates the plain dicts once
+        return {"events": events, "total_count": len(events)}
         
     except Exception as e:
         logger.error(f"Error listing events: {e}")
@@ -80,7 +72,7 @@ async def list_events(
 @router.post("/events", response_model=CalendarEventResponse, status_code=status.HTTP_201_CREATED)
 async def create_event(
     event: CalendarEventCreate,
-    claims: TokenClaims = Depends(validate_token),
+    claims: TokenClaims = Depends(require_write),
     calendar_service: CalendarService = Depends(get_calendar_service),
     x_source_agent: Optional[str] = Header(default=None),
     x_delegation: Optional[str] = Header(default=None),
@@ -94,12 +86,7 @@ async def create_event(
     When called by Agent A with a delegated token, the event is created
     on behalf of the user who originally authenticated.
     """
-    # Enforce scope
-    enforce_scope(claims, CalendarScope.WRITE)
-    
-    # Validate delegation if from another agent
     if claims.delegation or x_delegation == "true":
-        validate_delegation(claims, agent_settings.allowed_source_agents)
         logger.info(
             f"Creating event via delegation from {x_source_agent}",
             user_id=claims.sub
@@ -113,13 +100,11 @@ async def create_event(
     )
     
     try:
-        created_event = await calendar_service.create_event(
+        return await calendar_service.create_event(
             user_id=claims.sub,
-            event_data=event.model_dump()
+            event=event
         )
         
-        return CalendarEventResponse(**created_event)
-        
     except Exception as e:
         logger.error(f"Error creating event: {e}")
         raise HTTPException(
@@ -128,10 +113,55 @@ async def create_event(
         )
 
 
+@router.post(
+    "/events/bulk",
+    response_model=CalendarEventsBulkResponse,
+    status_code=status.HTTP_201_CREATED
+)
+async def create_events_bulk(
+    request: CalendarEventsBulkCreate,
+    claims: TokenClaims = Depends(require_write),
+    calendar_service: CalendarService = Depends(get_calendar_service),
+    x_source_agent: str | None = Header(default=None),
+):
+    """
+    Create several calendar events in one call.
+    
+    Requires `calendar.write` scope.
+    Accepts delegated tokens from Agent A, which uses this endpoint to
+    replace one request per detected event with a single request.
+    """
+    logger.info(
+        f"Creating {len(request.events)} calendar events",
+        user_id=claims.sub,
+        source_agent=x_source_agent
+    )
+    
+    try:
+        created_events = await calendar_service.create_events(
+            user_id=claims.sub,
+            events=request.events
+        )
+        
+        events = [created_event for created_event in created_events if created_event]
+        return {
+            "events": events,
+            "created_count": len(events),
+            "failed_count": len(created_events) - len(events)
+        }
+        
+    except Exception as e:
+        logger.error(f"Error creating events: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create events: {str(e)}"
+        )
+
+
 @router.get("/events/{event_id}", response_model=CalendarEventResponse)
 async def get_event(
     event_id: str,
-    claims: TokenClaims = Depends(validate_token),
+    claims: TokenClaims = Depends(require_read),
     calendar_service: CalendarService = Depends(get_calendar_service),
 ):
     """
@@ -139,8 +169,6 @@ async def get_event(
     
     Requires `calendar.read` scope.
     """
-    enforce_scope(claims, CalendarScope.READ)
-    
     try:
         event = await calendar_service.get_event(
             user_id=claims.sub,
@@ -153,7 +181,7 @@ async def get_event(
                 detail="Event not found"
             )
         
-        return CalendarEventResponse(**event)
+        return event
         
     except HTTPException:
         raise
@@ -169,7 +197,7 @@ async def get_event(
 async def update_event(
     event_id: str,
     event: CalendarEventUpdate,
-    claims: TokenClaims = Depends(validate_token),
+    claims: TokenClaims = Depends(require_write),
     calendar_service: CalendarService = Depends(get_calendar_service),
 ):
     """
@@ -177,15 +205,13 @@ async def update_event(
     
     Requires `calendar.write` scope.
     """
-    enforce_scope(claims, CalendarScope.WRITE)
-    
     logger.info(f"Updating event {event_id}", user_id=claims.sub)
     
     try:
         updated_event = await calendar_service.update_event(
             user_id=claims.sub,
             event_id=event_id,
-            event_data=event.model_dump(exclude_unset=True)
+            event=event
         )
         
         if not updated_event:
@@ -194,7 +220,7 @@ async def update_event(
                 detail="Event not found"
             )
         
-        return CalendarEventResponse(**updated_event)
+        return updated_event
         
     except HTTPException:
         raise
@@ -209,7 +235,7 @@ async def update_event(
 @router.delete("/events/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_event(
     event_id: str,
-    claims: TokenClaims = Depends(validate_token),
+    claims: TokenClaims = Depends(require_write),
     calendar_service: CalendarService = Depends(get_calendar_service),
 ):
     """
@@ -217,8 +243,6 @@ async def delete_event(
     
     Requires `calendar.write` scope.
     """
-    enforce_scope(claims, CalendarScope.WRITE)
-    
     logger.info(f"Deleting event {event_id}", user_id=claims.sub)
     
     try:
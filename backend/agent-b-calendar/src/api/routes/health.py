@@ -7,7 +7,7 @@ Health and status endpoints for Agent B.
 
 from fastapi import APIRouter
 
-from shared.database import AsyncSessionLocal
+from shared.database import check_database
 
 router = APIRouter()
 
@@ -26,13 +26,12 @@ async def health_check():
         "dependencies": {}
     }
     
-    # Check database connection
-    try:
-        async with AsyncSessionLocal() as session:
-            await session.execute("SELECT 1")
+    # Check database connection (result reused for a few seconds)
+    db_error = await check_database()
+    if db_error is None:
         health_status["dependencies"]["database"] = "healthy"
-    except Exception as e:
-        health_status["dependencies"]["database"] = f"unhealthy: {str(e)}"
+    else:
+        health_status["dependencies"]["database"] = f"unhealthy: {db_error}"
         health_status["status"] = "degraded"
     
     return health_status
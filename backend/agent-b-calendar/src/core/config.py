@@ -5,7 +5,7 @@ Agent B Configuration
 Agent-specific configuration extending shared settings.
 """
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Optional
 
 from pydantic import Field
@@ -36,11 +36,42 @@ class AgentBSettings(BaseSettings):
     max_events_per_request: int = Field(default=50)
     default_calendar_id: str = Field(default="primary")
     
+    # Google Calendar per-user quota
+    calendar_requests_per_second: float = Field(
+        default=10.0,
+        description="Sustained Calendar API calls per second allowed for each user"
+    )
+    calendar_request_burst: int = Field(
+        default=20,
+        description="Calendar API calls a user may make back to back"
+    )
+    
+    # Event listing cache
+    event_cache_ttl_seconds: int = Field(
+        default=60,
+        description="Seconds an event listing stays in Redis"
+    )
+    event_cache_local_ttl_seconds: int = Field(
+        default=15,
+        description="Seconds an event listing stays in the in-process cache"
+    )
+    
+    # Request logging
+    request_log_sample_rate: int = Field(
+        default=10,
+        description="Log one in N successful requests (4xx and 5xx are always logged)"
+    )
+    
     # Allowed source agents for delegation
     allowed_source_agents: list[str] = Field(
         default=["agent-a-summarizer"],
         description="List of agents allowed to delegate to this agent"
     )
+    
+    @cached_property
+    def allowed_source_agents_set(self) -> frozenset[str]:
+        """Allowed source agents as a set, built once per settings object."""
+        return frozenset(self.allowed_source_agents)
 
 
 @lru_cache
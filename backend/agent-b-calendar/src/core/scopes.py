@@ -5,14 +5,16 @@ Scope Enforcement
 Scope definitions and enforcement for Agent B.
 """
 
+from collections.abc import Set as AbstractSet
 from enum import Enum
-from typing import List
 
-from fastapi import HTTPException, status
+from fastapi import Depends, HTTPException, status
 
-from shared.auth import TokenClaims
+from shared.auth import TokenClaims, validate_token
 from shared.utils import get_logger
 
+from .config import agent_settings
+
 logger = get_logger(__name__)
 
 
@@ -34,29 +36,29 @@ def enforce_scope(claims: TokenClaims, required_scope: CalendarScope) -> None:
     Raises:
         HTTPException: If scope is missing
     """
-    if str(required_scope) not in claims.scopes:
+    if required_scope.value not in claims.scopes:
         logger.warning(
             f"Scope enforcement failed",
             user_id=claims.sub,
-            required_scope=str(required_scope),
-            available_scopes=claims.scopes
+            required_scope=required_scope.value,
+            available_scopes=sorted(claims.scopes)
         )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Missing required scope: {required_scope}"
+            detail=f"Missing required scope: {required_scope.value}"
         )
 
 
 def validate_delegation(
     claims: TokenClaims,
-    allowed_agents: List[str]
+    allowed_agents: AbstractSet[str]
 ) -> None:
     """
     Validate that a delegated token comes from an allowed agent.
     
     Args:
         claims: Token claims
-        allowed_agents: List of allowed source agent IDs
+        allowed_agents: Set of allowed source agent IDs
         
     Raises:
         HTTPException: If delegation is not valid
@@ -69,7 +71,7 @@ def validate_delegation(
             logger.warning(
                 f"Delegation rejected from unknown agent",
                 delegator=delegator,
-                allowed_agents=allowed_agents
+                allowed_agents=sorted(allowed_agents)
             )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -80,3 +82,32 @@ def validate_delegation(
             f"Delegation accepted from {delegator}",
             user_id=claims.sub
         )
+
+
+def require_calendar_scope(required_scope: CalendarScope):
+    """
+    FastAPI dependency factory combining token, scope, and delegation checks.
+    
+    Usage:
+        @router.get("/events")
+        async def list_events(
+            claims: TokenClaims = Depends(require_read)
+        ):
+            ...
+    
+    Args:
+        required_scope: Scope the endpoint requires
+        
+    Returns:
+        Dependency returning the validated claims
+    """
+    async def dependency(claims: TokenClaims = Depends(validate_token)) -> TokenClaims:
+        enforce_scope(claims, required_scope)
+        validate_delegation(claims, agent_settings.allowed_source_agents_set)
+        return claims
+    
+    return dependency
+
+
+require_read = require_calendar_scope(CalendarScope.READ)
+require_write = require_calendar_scope(CalendarScope.WRITE)
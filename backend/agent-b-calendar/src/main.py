@@ -5,17 +5,25 @@ Agent B - Calendar Manager
 FastAPI application entry point for the calendar management agent.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
+from shared.auth.token_validator import get_validator
 from shared.config import settings
 from shared.database import init_async_db, close_db
-from shared.utils import setup_logging, get_logger
+from shared.http import close_client
+from shared.utils import setup_logging, shutdown_logging, get_logger
 
+from .api.dependencies import close_calendar_service
 from .api.routes import router as api_router
+from .api.routes.health import router as health_router
 from .api.middleware.auth_middleware import TokenValidationMiddleware
+from .api.middleware.profiler_middleware import ProfilerMiddleware
 from .core.config import agent_settings
 
 # Setup logging
@@ -23,6 +31,16 @@ setup_logging()
 logger = get_logger(__name__)
 
 
+async def warm_token_keys() -> None:
+    """Prefetch Descope signing keys so the first request skips the fetch."""
+    validator = get_validator()
+    try:
+        await validator.prime()
+    except Exception as e:
+        logger.warning(f"JWKS prefetch failed, fetching on first request: {e}")
+    validator.start_refresh()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -34,16 +52,23 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Agent B - Calendar Manager")
     logger.info(f"Debug mode: {settings.app.debug}")
     
-    # Initialize database
-    await init_async_db()
-    logger.info("Database initialized")
+    # Independent startup tasks run concurrently; add new warmups here
+    await asyncio.gather(
+        init_async_db(),
+        warm_token_keys()
+    )
+    logger.info("Startup tasks complete")
     
     yield
     
     # Shutdown
     logger.info("Shutting down Agent B")
+    await get_validator().stop_refresh()
+    await close_calendar_service()
+    await close_client()
     await close_db()
     logger.info("Cleanup complete")
+    shutdown_logging()
 
 
 # Create FastAPI application
@@ -67,6 +92,8 @@ app = FastAPI(
     """,
     version="1.0.0",
     lifespan=lifespan,
+    # Serialize responses (including datetimes) with orjson
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.app.debug else None,
     redoc_url="/redoc" if settings.app.debug else None,
 )
@@ -80,21 +107,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses such as event listings
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Add token validation middleware
 app.add_middleware(TokenValidationMiddleware)
 
-# Include API routes
-app.include_router(api_router, prefix="/api/v1")
+# Profile individual requests with ?profile=1 (debug only)
+if settings.app.debug:
+    app.add_middleware(ProfilerMiddleware)
 
+# Health probes are served once, at the root, for container orchestration
+app.include_router(health_router, tags=["Health"])
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint for container orchestration."""
-    return {
-        "status": "healthy",
-        "agent": "agent-b-calendar",
-        "version": "1.0.0"
-    }
+# Include API routes
+app.include_router(api_router, prefix="/api/v1")
 
 
 @app.get("/")
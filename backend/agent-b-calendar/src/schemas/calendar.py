@@ -56,6 +56,12 @@ class CalendarEventCreate(BaseModel):
         }
 
 
+class CalendarEventsBulkCreate(BaseModel):
+    """Request to create several calendar events at once."""
+    
+    events: list[CalendarEventCreate] = Field(min_length=1, max_length=100)
+
+
 class CalendarEventUpdate(BaseModel):
     """Request to update a calendar event."""
     
@@ -105,3 +111,11 @@ class CalendarEventsListResponse(BaseModel):
     events: list[CalendarEventResponse] = Field(default_factory=list)
     total_count: int = Field(default=0)
     next_page_token: Optional[str] = Field(default=None)
+
+
+class CalendarEventsBulkResponse(BaseModel):
+    """Response from bulk event creation."""
+    
+    events: list[CalendarEventResponse] = Field(default_factory=list)
+    created_count: int = Field(default=0)
+    failed_count: int = Field(default=0)
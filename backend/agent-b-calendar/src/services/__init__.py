@@ -1,5 +1,6 @@
 """Agent B Services Package"""
 
 from .calendar_service import CalendarService
+from .event_cache import EventListCache
 
-__all__ = ["CalendarService"]
+__all__ = ["CalendarService", "EventListCache"]
@@ -5,66 +5,274 @@ Calendar Service
 Integration with Google Calendar API for event management.
 """
 
+import asyncio
+import random
+import re
+import secrets
 import uuid
-from datetime import datetime, timedelta
-from typing import Any, Optional
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Optional
+from urllib.parse import quote
 
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+import httpx
+import orjson
 
-from shared.utils import get_logger
+from shared.config import settings
+from shared.http import get_client
+from shared.utils import RateLimiter, get_logger
 from shared.utils.exceptions import ExternalServiceError, NotFoundError
 
 from ..core.config import agent_settings
+from ..schemas.calendar import CalendarEventCreate, CalendarEventUpdate
+from .event_cache import EventListCache
 
 logger = get_logger(__name__)
 
+GOOGLE_CALENDAR_API = "https://www.googleapis.com/calendar/v3"
+GOOGLE_CALENDAR_BATCH_URL = "https://www.googleapis.com/batch/calendar/v3"
+
+# RFC 3339 UTC timestamp format expected by the Calendar API time bounds
+_Z_FMT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Events requested per page when listing (Google's default page size)
+CALENDAR_PAGE_SIZE = 250
+
+# Maximum sub-requests in one Google Calendar batch request
+CALENDAR_BATCH_LIMIT = 100
+
+# Retries of throttled or failed Calendar calls, with exponential backoff
+CALENDAR_MAX_ATTEMPTS = 5
+CALENDAR_RETRY_INITIAL_DELAY = 0.2
+CALENDAR_RETRY_MAX_DELAY = 8.0
+RETRYABLE_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+# Methods whose 5xx responses are not retried: the write may already have
+# been committed, and resending an event insert or batch would duplicate it
+_NON_IDEMPOTENT_METHODS = frozenset({"POST"})
+
+# Boundary parameter of a multipart Content-Type header, optionally quoted
+_BOUNDARY_PATTERN = re.compile(r'boundary="?([^";]+)"?', re.IGNORECASE)
+
+# Connection failures where the request was never sent, so it is safe to resend
+_RETRYABLE_TRANSPORT_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+)
+
+# Sample events seeded for each new mock user: (fields, start offset from now, duration)
+_MOCK_EVENT_TEMPLATES: tuple[tuple[dict[str, Any], timedelta, timedelta], ...] = (
+    (
+        {
+            "id": "mock_1",
+            "google_event_id": "mock_google_1",
+            "title": "Team Standup",
+            "description": "Daily team sync",
+            "location": "Zoom",
+            "timezone": "UTC",
+            "is_all_day": False,
+            "attendees": (),
+            "status": "confirmed",
+            "source": "mock",
+            "is_synced": False
+        },
+        timedelta(days=1, hours=9),
+        timedelta(minutes=30)
+    ),
+    (
+        {
+            "id": "mock_2",
+            "google_event_id": "mock_google_2",
+            "title": "Q1 Planning Session",
+            "description": "Quarterly planning meeting",
+            "location": "Conference Room A",
+            "timezone": "UTC",
+            "is_all_day": False,
+            "attendees": (
+                {
+                    "email": "team@company.com",
+                    "name": "Team",
+                    "response_status": "accepted"
+                },
+            ),
+            "status": "confirmed",
+            "source": "mock",
+            "is_synced": False
+        },
+        timedelta(days=7, hours=14),
+        timedelta(hours=2)
+    ),
+)
+
 
 class CalendarService:
     """
     Service for interacting with Google Calendar API.
     
     Handles authentication, CRUD operations for events, and syncing.
+    Calendar API calls go through the shared async HTTP client, so
+    concurrent requests never block the event loop.
     """
     
-    def __init__(self):
-        """Initialize Calendar service."""
-        self._service_cache: dict[str, Any] = {}
-        self._local_events: dict[str, list[dict]] = {}  # In-memory storage for demo
+    def __init__(self, cache: EventListCache | None = None):
+        """
+        Initialize Calendar service.
+        
+        Args:
+            cache: Event listing cache (default: Redis cache from settings)
+        """
+        self.cache = cache or EventListCache(
+            redis_url=settings.redis.redis_url,
+            ttl_seconds=agent_settings.event_cache_ttl_seconds,
+            local_ttl_seconds=agent_settings.event_cache_local_ttl_seconds
+        )
+        # Event listings currently being fetched, keyed by (user_id, cache key)
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        # Per-user quota smoothing for Calendar API calls
+        self._rate_limiter = RateLimiter(
+            rate=agent_settings.calendar_requests_per_second,
+            burst=agent_settings.calendar_request_burst
+        )
+        # In-memory storage for demo: user_id -> event_id -> event
+        self._local_events: dict[str, dict[str, dict]] = {}
     
-    async def _get_service(self, user_id: str, access_token: str = None):
+    async def close(self):
+        """Close event cache connections."""
+        await self.cache.close()
+    
+    @staticmethod
+    def _events_path(calendar_id: str, event_id: str | None = None) -> str:
+        """Build the API path of a calendar's events or of one event."""
+        path = f"/calendars/{quote(calendar_id, safe='')}/events"
+        if event_id is not None:
+            path = f"{path}/{quote(event_id, safe='')}"
+        return path
+    
+    async def _request(
+        self,
+        user_id: str,
+        access_token: str,
+        method: str,
+        path: str,
+        body: dict | None = None,
+        **kwargs: Any
+    ) -> httpx.Response:
         """
-        Get Google Calendar API service instance for a user.
+        Send a Calendar API request with the user's access token.
         
         Args:
-            user_id: User ID
+            user_id: User ID, used for rate limiting
             access_token: Google OAuth access token
+            method: HTTP method
+            path: Path below the Calendar API root
+            body: JSON request body, encoded with orjson
+            **kwargs: Extra arguments for httpx (params)
             
         Returns:
-            Calendar API service or None for mock mode
+            HTTP response
         """
-        if not access_token:
-            return None  # Use mock mode
+        if body is not None:
+            kwargs["content"] = orjson.dumps(body)
+        return await self._send(
+            user_id, access_token, method, f"{GOOGLE_CALENDAR_API}{path}", **kwargs
+        )
+    
+    async def _send(
+        self,
+        user_id: str,
+        access_token: str,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send a request within the user's rate limit, retrying transient failures.
         
-        cache_key = f"{user_id}_{access_token[:20]}"
+        Throttling (429, or 403 with a rate limit reason) and connection
+        failures before the request was sent are always retried; 5xx
+        responses only for idempotent methods, since a POST may have been
+        applied before the error. Retries use full-jitter exponential
+        backoff, honouring Retry-After. The last response is returned once
+        attempts run out.
         
-        if cache_key not in self._service_cache:
-            credentials = Credentials(token=access_token)
-            self._service_cache[cache_key] = build(
-                "calendar",
-                "v3",
-                credentials=credentials,
-                cache_discovery=False
-            )
+        Args:
+            user_id: User ID whose quota the call counts against
+            access_token: Google OAuth access token
+            method: HTTP method
+            url: Request URL
+            headers: Extra request headers
+            **kwargs: Extra arguments for httpx
+            
+        Returns:
+            HTTP response
+        """
+        headers = {"Authorization": f"Bearer {access_token}", **(headers or {})}
         
-        return self._service_cache[cache_key]
+        for attempt in range(1, CALENDAR_MAX_ATTEMPTS + 1):
+            await self._rate_limiter.acquire(user_id)
+            try:
+                response = await get_client().request(
+                    method, url, headers=headers, **kwargs
+                )
+            except _RETRYABLE_TRANSPORT_ERRORS as e:
+                if attempt == CALENDAR_MAX_ATTEMPTS:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning(
+                    "Retrying Google Calendar request",
+                    error=repr(e),
+                    attempt=attempt,
+                    delay=delay
+                )
+            else:
+                if (
+                    attempt == CALENDAR_MAX_ATTEMPTS
+                    or not self._should_retry(method, response)
+                ):
+                    return response
+                delay = self._retry_delay(attempt, response.headers.get("retry-after"))
+                logger.warning(
+                    "Retrying Google Calendar request",
+                    status_code=response.status_code,
+                    attempt=attempt,
+                    delay=delay
+                )
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _should_retry(method: str, response: httpx.Response) -> bool:
+        """Whether a response is throttling, or a transient error safe to resend."""
+        if response.status_code == 429:
+            return True
+        # Calendar reports quota errors as 403 rateLimitExceeded / userRateLimitExceeded
+        if response.status_code == 403 and b"ateLimitExceeded" in response.content:
+            return True
+        return (
+            response.status_code in RETRYABLE_STATUS_CODES
+            and method.upper() not in _NON_IDEMPOTENT_METHODS
+        )
+    
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: str | None = None) -> float:
+        """Seconds to wait before the next attempt."""
+        if retry_after:
+            try:
+                return min(float(retry_after), CALENDAR_RETRY_MAX_DELAY)
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        ceiling = min(
+            CALENDAR_RETRY_INITIAL_DELAY * 2 ** (attempt - 1),
+            CALENDAR_RETRY_MAX_DELAY
+        )
+        return random.uniform(0, ceiling)
     
     async def list_events(
         self,
         user_id: str,
         access_token: str = None,
-        start_date: Optional[str] = None,
-        end_date: Optional[str] = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
         max_results: int = 50,
         calendar_id: str = "primary"
     ) -> list[dict[str, Any]]:
@@ -74,8 +282,8 @@ class CalendarService:
         Args:
             user_id: User ID
             access_token: Google OAuth access token (optional for mock)
-            start_date: Filter start date (YYYY-MM-DD)
-            end_date: Filter end date (YYYY-MM-DD)
+            start_date: Filter start date
+            end_date: Filter end date
             max_results: Maximum results
             calendar_id: Google Calendar ID
             
@@ -86,43 +294,134 @@ class CalendarService:
         if not access_token:
             return self._get_mock_events(user_id, start_date, end_date)
         
+        cache_key = self.cache.make_key(calendar_id, start_date, end_date, max_results)
+        cached, version = await self.cache.get(user_id, cache_key)
+        if cached is not None:
+            return cached
+        
+        # Concurrent identical misses share one Google call
+        inflight_key = (user_id, cache_key)
+        inflight = self._inflight.get(inflight_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[inflight_key] = future
         try:
-            service = await self._get_service(user_id, access_token)
-            
-            # Build request parameters
-            params = {
-                "calendarId": calendar_id,
-                "maxResults": max_results,
-                "singleEvents": True,
-                "orderBy": "startTime"
-            }
-            
-            if start_date:
-                params["timeMin"] = f"{start_date}T00:00:00Z"
-            else:
-                params["timeMin"] = datetime.utcnow().isoformat() + "Z"
-            
-            if end_date:
-                params["timeMax"] = f"{end_date}T23:59:59Z"
+            events = await self._fetch_events(
+                user_id, access_token, start_date, end_date, max_results, calendar_id
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unshared failure is not logged again
+            future.exception()
+            raise
+        else:
+            future.set_result(events)
+        finally:
+            del self._inflight[inflight_key]
+        
+        await self.cache.set(user_id, cache_key, events, version)
+        return events
+    
+    async def _fetch_events(
+        self,
+        user_id: str,
+        access_token: str,
+        start_date: date | None,
+        end_date: date | None,
+        max_results: int,
+        calendar_id: str
+    ) -> list[dict[str, Any]]:
+        """Fetch and transform events from Google Calendar."""
+        return [
+            event
+            async for event in self.iter_events(
+                user_id, access_token, start_date, end_date, max_results, calendar_id
+            )
+        ]
+    
+    async def iter_events(
+        self,
+        user_id: str,
+        access_token: str | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        max_results: int = 50,
+        calendar_id: str = "primary"
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream calendar events page by page, bypassing the listing cache.
+        
+        Pages are fetched with pageToken as the previous one is consumed,
+        so only one page of Google's response is held at a time.
+        
+        Args:
+            user_id: User ID
+            access_token: Google OAuth access token (optional for mock)
+            start_date: Filter start date
+            end_date: Filter end date
+            max_results: Maximum events yielded in total
+            calendar_id: Google Calendar ID
             
-            # Fetch events
-            response = service.events().list(**params).execute()
-            events = response.get("items", [])
+        Yields:
+            Calendar events in start time order
+        """
+        if not access_token:
+            mock_events = self._get_mock_events(user_id, start_date, end_date)
+            for event in mock_events[:max_results]:
+                yield event
+            return
+        
+        params = {
+            "singleEvents": True,
+            "orderBy": "startTime"
+        }
+        
+        if start_date:
+            params["timeMin"] = f"{start_date.isoformat()}T00:00:00Z"
+        else:
+            params["timeMin"] = datetime.now(timezone.utc).strftime(_Z_FMT)
+        
+        if end_date:
+            params["timeMax"] = f"{end_date.isoformat()}T23:59:59Z"
+        
+        remaining = max_results
+        while remaining > 0:
+            params["maxResults"] = min(remaining, CALENDAR_PAGE_SIZE)
+            try:
+                response = await self._request(
+                    user_id,
+                    access_token,
+                    "GET",
+                    self._events_path(calendar_id),
+                    params=params
+                )
+                response.raise_for_status()
+                page = orjson.loads(response.content)
+            except Exception as e:
+                logger.error(f"Error listing calendar events: {e}")
+                raise ExternalServiceError(
+                    message=f"Failed to list events: {str(e)}",
+                    service="google_calendar"
+                )
             
             # Transform to our format
-            return [self._transform_google_event(e) for e in events]
+            synced_at = datetime.now(timezone.utc).isoformat()
+            items = page.get("items", [])[:remaining]
+            for google_event in items:
+                yield self._transform_google_event(google_event, synced_at)
+            remaining -= len(items)
             
-        except Exception as e:
-            logger.error(f"Error listing calendar events: {e}")
-            raise ExternalServiceError(
-                message=f"Failed to list events: {str(e)}",
-                service="google_calendar"
-            )
+            page_token = page.get("nextPageToken")
+            if not page_token:
+                break
+            params["pageToken"] = page_token
     
     async def create_event(
         self,
         user_id: str,
-        event_data: dict[str, Any],
+        event: CalendarEventCreate,
         access_token: str = None,
         calendar_id: str = "primary"
     ) -> dict[str, Any]:
@@ -131,7 +430,7 @@ class CalendarService:
         
         Args:
             user_id: User ID
-            event_data: Event details
+            event: Validated event details
             access_token: Google OAuth access token
             calendar_id: Google Calendar ID
             
@@ -141,24 +440,28 @@ class CalendarService:
         logger.info(
             f"Creating calendar event",
             user_id=user_id,
-            title=event_data.get("title")
+            title=event.title
         )
         
         # Mock mode for development/testing
         if not access_token:
-            return self._create_mock_event(user_id, event_data)
+            return self._create_mock_event(user_id, event)
         
         try:
-            service = await self._get_service(user_id, access_token)
-            
             # Build Google Calendar event body
-            google_event = self._build_google_event(event_data)
+            google_event = self._build_google_event(event)
             
             # Create event
-            created = service.events().insert(
-                calendarId=calendar_id,
+            response = await self._request(
+                user_id,
+                access_token,
+                "POST",
+                self._events_path(calendar_id),
                 body=google_event
-            ).execute()
+            )
+            response.raise_for_status()
+            created = orjson.loads(response.content)
+            await self.cache.invalidate(user_id)
             
             logger.info(
                 f"Calendar event created",
@@ -175,6 +478,144 @@ class CalendarService:
                 service="google_calendar"
             )
     
+    async def batch_mutate(
+        self,
+        user_id: str,
+        ops: list[dict[str, Any]],
+        access_token: str | None = None,
+        calendar_id: str = "primary"
+    ) -> list[Any]:
+        """
+        Apply several event mutations with as few round-trips as possible.
+        
+        With Google Calendar, operations are sent as multipart/mixed batch
+        requests of up to CALENDAR_BATCH_LIMIT sub-requests each.
+        
+        Args:
+            user_id: User ID
+            ops: Operations, each one of
+                {"op": "create", "event": CalendarEventCreate},
+                {"op": "update", "event_id": str, "event": CalendarEventUpdate},
+                {"op": "delete", "event_id": str}
+            access_token: Google OAuth access token
+            calendar_id: Google Calendar ID
+            
+        Returns:
+            One result per operation, in input order: the event data for
+            creates and updates (None if the event was not found), True or
+            False for deletes, or an ExternalServiceError if it failed
+        """
+        # Mock mode for development/testing
+        if not access_token:
+            return [self._apply_mock_op(user_id, op) for op in ops]
+        
+        results: list[Any] = [None] * len(ops)
+        
+        try:
+            for offset in range(0, len(ops), CALENDAR_BATCH_LIMIT):
+                window = range(offset, min(offset + CALENDAR_BATCH_LIMIT, len(ops)))
+                boundary = f"batch_{uuid.uuid4().hex}"
+                body = "".join(
+                    self._build_batch_part(boundary, index, ops[index], calendar_id)
+                    for index in window
+                ) + f"--{boundary}--\r\n"
+                
+                response = await self._send(
+                    user_id,
+                    access_token,
+                    "POST",
+                    GOOGLE_CALENDAR_BATCH_URL,
+                    headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+                    content=body.encode()
+                )
+                response.raise_for_status()
+                
+                parts = self._parse_batch_response(
+                    response.headers["content-type"], response.content, window.start
+                )
+                synced_at = datetime.now(timezone.utc).isoformat()
+                for index in window:
+                    status_code, payload = parts.get(index, (502, None))
+                    results[index] = self._batch_result(
+                        ops[index]["op"], status_code, payload, synced_at
+                    )
+            
+        except Exception as e:
+            logger.error(f"Error applying calendar batch: {e}")
+            raise ExternalServiceError(
+                message=f"Failed to apply batch: {str(e)}",
+                service="google_calendar"
+            )
+        finally:
+            # Earlier windows may have been applied even if a later one failed
+            await self.cache.invalidate(user_id)
+        
+        return results
+    
+    async def create_events(
+        self,
+        user_id: str,
+        events: list[CalendarEventCreate],
+        access_token: str | None = None,
+        calendar_id: str = "primary"
+    ) -> list[dict[str, Any] | None]:
+        """
+        Create several calendar events in one operation.
+        
+        Args:
+            user_id: User ID
+            events: Validated event details, one entry per event
+            access_token: Google OAuth access token
+            calendar_id: Google Calendar ID
+            
+        Returns:
+            Created event data in input order, or None for events that failed
+        """
+        logger.info(
+            f"Creating {len(events)} calendar events",
+            user_id=user_id
+        )
+        
+        results = await self.batch_mutate(
+            user_id,
+            [{"op": "create", "event": event} for event in events],
+            access_token=access_token,
+            calendar_id=calendar_id
+        )
+        return [None if isinstance(r, ExternalServiceError) else r for r in results]
+    
+    async def delete_events(
+        self,
+        user_id: str,
+        event_ids: list[str],
+        access_token: str | None = None,
+        calendar_id: str = "primary"
+    ) -> list[bool]:
+        """
+        Delete several calendar events in one operation.
+        
+        Args:
+            user_id: User ID
+            event_ids: IDs of the events to delete
+            access_token: Google OAuth access token
+            calendar_id: Google Calendar ID
+            
+        Returns:
+            True for each deleted event, False if not found or failed
+        """
+        logger.info(
+            f"Deleting {len(event_ids)} calendar events",
+            user_id=user_id
+        )
+        
+        results = await self.batch_mutate(
+            user_id,
+            [{"op": "delete", "event_id": event_id} for event_id in event_ids],
+            access_token=access_token,
+            calendar_id=calendar_id
+        )
+        return [r is True for r in results]
+    
     async def get_event(
         self,
         user_id: str,
@@ -199,18 +640,16 @@ class CalendarService:
             return self._get_mock_event(user_id, event_id)
         
         try:
-            service = await self._get_service(user_id, access_token)
-            
-            event = service.events().get(
-                calendarId=calendar_id,
-                eventId=event_id
-            ).execute()
+            response = await self._request(
+                user_id, access_token, "GET", self._events_path(calendar_id, event_id)
+            )
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
             
-            return self._transform_google_event(event)
+            return self._transform_google_event(orjson.loads(response.content))
             
         except Exception as e:
-            if "404" in str(e):
-                return None
             logger.error(f"Error fetching event {event_id}: {e}")
             raise ExternalServiceError(
                 message=f"Failed to fetch event: {str(e)}",
@@ -221,17 +660,19 @@ class CalendarService:
         self,
         user_id: str,
         event_id: str,
-        event_data: dict[str, Any],
+        event: CalendarEventUpdate,
         access_token: str = None,
         calendar_id: str = "primary"
     ) -> Optional[dict[str, Any]]:
         """
         Update a calendar event.
         
+        Only the fields set on the request are changed.
+        
         Args:
             user_id: User ID
             event_id: Event ID
-            event_data: Updated event data
+            event: Validated partial event update
             access_token: Google OAuth access token
             calendar_id: Google Calendar ID
             
@@ -240,34 +681,35 @@ class CalendarService:
         """
         # Mock mode
         if not access_token:
-            return self._update_mock_event(user_id, event_id, event_data)
+            return self._update_mock_event(user_id, event_id, event)
         
         try:
-            service = await self._get_service(user_id, access_token)
+            path = self._events_path(calendar_id, event_id)
             
             # Get existing event
-            existing = service.events().get(
-                calendarId=calendar_id,
-                eventId=event_id
-            ).execute()
+            response = await self._request(user_id, access_token, "GET", path)
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            existing = orjson.loads(response.content)
             
             # Merge updates
-            google_event = self._build_google_event(event_data)
+            google_event = self._build_google_event(event, partial=True)
             for key, value in google_event.items():
                 existing[key] = value
             
             # Update
-            updated = service.events().update(
-                calendarId=calendar_id,
-                eventId=event_id,
-                body=existing
-            ).execute()
+            response = await self._request(
+                user_id, access_token, "PUT", path, body=existing
+            )
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            await self.cache.invalidate(user_id)
             
-            return self._transform_google_event(updated)
+            return self._transform_google_event(orjson.loads(response.content))
             
         except Exception as e:
-            if "404" in str(e):
-                return None
             logger.error(f"Error updating event {event_id}: {e}")
             raise ExternalServiceError(
                 message=f"Failed to update event: {str(e)}",
@@ -298,73 +740,212 @@ class CalendarService:
             return self._delete_mock_event(user_id, event_id)
         
         try:
-            service = await self._get_service(user_id, access_token)
-            
-            service.events().delete(
-                calendarId=calendar_id,
-                eventId=event_id
-            ).execute()
+            response = await self._request(
+                user_id,
+                access_token,
+                "DELETE",
+                self._events_path(calendar_id, event_id)
+            )
+            if response.status_code in (404, 410):
+                return False
+            response.raise_for_status()
+            await self.cache.invalidate(user_id)
             
             return True
             
         except Exception as e:
-            if "404" in str(e):
-                return False
             logger.error(f"Error deleting event {event_id}: {e}")
             raise ExternalServiceError(
                 message=f"Failed to delete event: {str(e)}",
                 service="google_calendar"
             )
     
-    def _build_google_event(self, event_data: dict) -> dict:
-        """Build Google Calendar API event body."""
-        google_event = {
-            "summary": event_data.get("title", "Untitled Event"),
-        }
+    def _build_google_event(
+        self,
+        event: CalendarEventCreate | CalendarEventUpdate,
+        partial: bool = False
+    ) -> dict:
+        """
+        Build Google Calendar API event body.
         
-        if event_data.get("description"):
-            google_event["description"] = event_data["description"]
+        Args:
+            event: Validated event request
+            partial: Only include fields set on the request (for updates)
+        """
+        google_event = {}
         
-        if event_data.get("location"):
-            google_event["location"] = event_data["location"]
+        if not partial or event.title is not None:
+            google_event["summary"] = event.title or "Untitled Event"
         
-        # Handle datetime
-        if event_data.get("is_all_day"):
-            google_event["start"] = {"date": event_data["start_time"][:10]}
-            google_event["end"] = {"date": event_data["end_time"][:10]}
-        else:
-            timezone = event_data.get("timezone", "UTC")
-            start = event_data.get("start_time")
-            end = event_data.get("end_time")
-            
-            if isinstance(start, datetime):
-                start = start.isoformat()
-            if isinstance(end, datetime):
-                end = end.isoformat()
-            
-            google_event["start"] = {"dateTime": start, "timeZone": timezone}
-            google_event["end"] = {"dateTime": end, "timeZone": timezone}
+        if event.description:
+            google_event["description"] = event.description
+        
+        if event.location:
+            google_event["location"] = event.location
+        
+        # Handle datetime: one branch picks the all-day or timed shape
+        start_time, end_time = event.start_time, event.end_time
+        if start_time is not None and end_time is not None:
+            if event.is_all_day:
+                google_event["start"] = {"date": start_time.date().isoformat()}
+                google_event["end"] = {"date": end_time.date().isoformat()}
+            else:
+                tz_name = event.timezone or "UTC"
+                google_event["start"] = {
+                    "dateTime": start_time.isoformat(),
+                    "timeZone": tz_name
+                }
+                google_event["end"] = {
+                    "dateTime": end_time.isoformat(),
+                    "timeZone": tz_name
+                }
         
         # Attendees
-        if event_data.get("attendees"):
+        if event.attendees:
             google_event["attendees"] = [
-                {"email": a.get("email"), "displayName": a.get("name")}
-                for a in event_data["attendees"]
+                {"email": a.email, "displayName": a.name}
+                for a in event.attendees
             ]
         
         return google_event
     
-    def _transform_google_event(self, google_event: dict) -> dict:
-        """Transform Google Calendar event to our format."""
-        start = google_event.get("start", {})
-        end = google_event.get("end", {})
+    def _build_batch_part(
+        self,
+        boundary: str,
+        index: int,
+        op: dict[str, Any],
+        calendar_id: str
+    ) -> str:
+        """Encode one batch_mutate operation as a multipart/mixed part."""
+        if op["op"] == "create":
+            method, path = "POST", self._events_path(calendar_id)
+            body = self._build_google_event(op["event"])
+        elif op["op"] == "update":
+            method, path = "PATCH", self._events_path(calendar_id, op["event_id"])
+            body = self._build_google_event(op["event"], partial=True)
+        elif op["op"] == "delete":
+            method, path = "DELETE", self._events_path(calendar_id, op["event_id"])
+            body = None
+        else:
+            raise ValueError(f"Unknown calendar operation: {op['op']}")
+        
+        part = (
+            f"--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <{index}>\r\n\r\n"
+            f"{method} /calendar/v3{path} HTTP/1.1\r\n"
+        )
+        if body is None:
+            return part + "\r\n"
+        return (
+            part
+            + "Content-Type: application/json\r\n\r\n"
+            + f"{orjson.dumps(body).decode()}\r\n"
+        )
+    
+    @staticmethod
+    def _parse_batch_response(
+        content_type: str,
+        content: bytes,
+        first_index: int = 0
+    ) -> dict[int, tuple[int, dict | None]]:
+        """
+        Split a multipart/mixed batch response into its sub-responses.
+        
+        Parts are split on the raw bytes so sub-response bodies are decoded
+        as UTF-8 JSON; the email package would read them as ASCII and
+        mangle non-ASCII text.
+        
+        Args:
+            content_type: Content-Type header of the batch response
+            content: Raw batch response body
+            first_index: Operation index of the first part, used for parts
+                that carry no Content-ID (Google answers in request order)
+        
+        Returns:
+            Status code and decoded JSON body per operation index
+        """
+        match = _BOUNDARY_PATTERN.search(content_type)
+        if match is None:
+            raise ValueError(
+                f"Batch response has no multipart boundary: {content_type}"
+            )
+        delimiter = b"--" + match.group(1).encode()
+        
+        parts: dict[int, tuple[int, dict | None]] = {}
+        # Before the first delimiter is the preamble; after the last, "--"
+        for position, raw in enumerate(content.split(delimiter)[1:]):
+            if raw.startswith(b"--"):
+                break
+            part_headers, _, http_response = (
+                raw.replace(b"\r\n", b"\n").lstrip(b"\n").partition(b"\n\n")
+            )
+            
+            index = first_index + position
+            for line in part_headers.split(b"\n"):
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-id":
+                    # Content-ID echoes the request's as <response-N>
+                    content_id = value.strip().strip(b"<>").rpartition(b"-")[2]
+                    if content_id.isdigit():
+                        index = int(content_id)
+            
+            status_line, _, rest = http_response.partition(b"\n")
+            _, _, body = rest.partition(b"\n\n")
+            parts[index] = (
+                int(status_line.split(b" ", 2)[1]),
+                orjson.loads(body) if body.strip() else None
+            )
+        return parts
+    
+    def _batch_result(
+        self,
+        op: str,
+        status_code: int,
+        payload: dict | None,
+        synced_at: str
+    ) -> Any:
+        """Map one batch sub-response to a batch_mutate result."""
+        if 200 <= status_code < 300:
+            if op == "delete":
+                return True
+            return self._transform_google_event(payload, synced_at)
+        if status_code in (404, 410):
+            return False if op == "delete" else None
+        
+        error = (payload or {}).get("error", {}).get("message", f"HTTP {status_code}")
+        logger.error(f"Error applying calendar {op} in batch: {error}")
+        return ExternalServiceError(
+            message=f"Failed to {op} event: {error}",
+            service="google_calendar",
+            status_code=status_code
+        )
+    
+    def _transform_google_event(
+        self,
+        google_event: dict,
+        synced_at: str | None = None
+    ) -> dict:
+        """
+        Transform Google Calendar event to our format.
+        
+        Args:
+            google_event: Event resource from the Calendar API
+            synced_at: Sync timestamp shared by a whole listing or batch
+                (default: now)
+        """
+        # Bound once: this runs for every event of every listing
+        get = google_event.get
+        start = get("start", {})
+        end = get("end", {})
+        event_id = get("id")
         
         return {
-            "id": google_event.get("id"),
-            "google_event_id": google_event.get("id"),
-            "title": google_event.get("summary", "Untitled"),
-            "description": google_event.get("description"),
-            "location": google_event.get("location"),
+            "id": event_id,
+            "google_event_id": event_id,
+            "title": get("summary", "Untitled"),
+            "description": get("description"),
+            "location": get("location"),
             "start_time": start.get("dateTime") or start.get("date"),
             "end_time": end.get("dateTime") or end.get("date"),
             "timezone": start.get("timeZone", "UTC"),
@@ -375,14 +956,14 @@ class CalendarService:
                     "name": a.get("displayName"),
                     "response_status": a.get("responseStatus", "needsAction")
                 }
-                for a in google_event.get("attendees", [])
+                for a in get("attendees", [])
             ],
-            "status": google_event.get("status", "confirmed"),
+            "status": get("status", "confirmed"),
             "source": "google_calendar",
-            "created_at": google_event.get("created"),
-            "updated_at": google_event.get("updated"),
+            "created_at": get("created"),
+            "updated_at": get("updated"),
             "is_synced": True,
-            "last_synced_at": datetime.utcnow().isoformat()
+            "last_synced_at": synced_at or datetime.now(timezone.utc).isoformat()
         }
     
     # ==================== Mock Methods for Development ====================
@@ -390,117 +971,88 @@ class CalendarService:
     def _get_mock_events(
         self,
         user_id: str,
-        start_date: str = None,
-        end_date: str = None
+        start_date: date | None = None,
+        end_date: date | None = None
     ) -> list[dict]:
         """Get mock events for development."""
         if user_id not in self._local_events:
-            self._local_events[user_id] = self._generate_mock_events()
-        return self._local_events[user_id]
+            self._local_events[user_id] = {
+                event["id"]: event for event in self._generate_mock_events()
+            }
+        return list(self._local_events[user_id].values())
     
-    def _create_mock_event(self, user_id: str, event_data: dict) -> dict:
+    def _create_mock_event(self, user_id: str, event: CalendarEventCreate) -> dict:
         """Create mock event."""
-        if user_id not in self._local_events:
-            self._local_events[user_id] = []
-        
-        event_id = str(uuid.uuid4())[:8]
-        now = datetime.utcnow().isoformat()
+        event_id = secrets.token_hex(4)
+        now = datetime.now(timezone.utc).isoformat()
         
         event = {
             "id": event_id,
             "google_event_id": f"mock_{event_id}",
-            "title": event_data.get("title", "Untitled"),
-            "description": event_data.get("description"),
-            "location": event_data.get("location"),
-            "start_time": str(event_data.get("start_time")),
-            "end_time": str(event_data.get("end_time")),
-            "timezone": event_data.get("timezone", "UTC"),
-            "is_all_day": event_data.get("is_all_day", False),
-            "attendees": event_data.get("attendees", []),
+            "title": event.title,
+            "description": event.description,
+            "location": event.location,
+            "start_time": event.start_time.isoformat(),
+            "end_time": event.end_time.isoformat(),
+            "timezone": event.timezone,
+            "is_all_day": event.is_all_day,
+            "attendees": [attendee.model_dump() for attendee in event.attendees],
             "status": "confirmed",
-            "source": event_data.get("source", "user_created"),
+            "source": "user_created",
             "created_at": now,
             "updated_at": now,
             "is_synced": False,
             "last_synced_at": None
         }
         
-        self._local_events[user_id].append(event)
+        self._local_events.setdefault(user_id, {})[event_id] = event
         return event
     
+    def _apply_mock_op(self, user_id: str, op: dict[str, Any]) -> Any:
+        """Apply one batch_mutate operation to the mock store."""
+        if op["op"] == "create":
+            return self._create_mock_event(user_id, op["event"])
+        if op["op"] == "update":
+            return self._update_mock_event(user_id, op["event_id"], op["event"])
+        if op["op"] == "delete":
+            return self._delete_mock_event(user_id, op["event_id"])
+        raise ValueError(f"Unknown calendar operation: {op['op']}")
+    
     def _get_mock_event(self, user_id: str, event_id: str) -> Optional[dict]:
         """Get single mock event."""
-        events = self._local_events.get(user_id, [])
-        for event in events:
-            if event["id"] == event_id:
-                return event
-        return None
+        return self._local_events.get(user_id, {}).get(event_id)
     
     def _update_mock_event(
         self,
         user_id: str,
         event_id: str,
-        event_data: dict
+        update: CalendarEventUpdate
     ) -> Optional[dict]:
         """Update mock event."""
-        events = self._local_events.get(user_id, [])
-        for i, event in enumerate(events):
-            if event["id"] == event_id:
-                for key, value in event_data.items():
-                    if value is not None:
-                        event[key] = value
-                event["updated_at"] = datetime.utcnow().isoformat()
-                self._local_events[user_id][i] = event
-                return event
-        return None
+        event = self._local_events.get(user_id, {}).get(event_id)
+        if event is None:
+            return None
+        
+        event.update(update.model_dump(exclude_unset=True, exclude_none=True))
+        event["updated_at"] = datetime.now(timezone.utc).isoformat()
+        return event
     
     def _delete_mock_event(self, user_id: str, event_id: str) -> bool:
         """Delete mock event."""
-        events = self._local_events.get(user_id, [])
-        for i, event in enumerate(events):
-            if event["id"] == event_id:
-                self._local_events[user_id].pop(i)
-                return True
-        return False
+        return self._local_events.get(user_id, {}).pop(event_id, None) is not None
     
     def _generate_mock_events(self) -> list[dict]:
         """Generate sample mock events."""
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
+        created_at = now.isoformat()
         return [
             {
-                "id": "mock_1",
-                "google_event_id": "mock_google_1",
-                "title": "Team Standup",
-                "description": "Daily team sync",
-                "location": "Zoom",
-                "start_time": (now + timedelta(days=1, hours=9)).isoformat(),
-                "end_time": (now + timedelta(days=1, hours=9, minutes=30)).isoformat(),
-                "timezone": "UTC",
-                "is_all_day": False,
-                "attendees": [],
-                "status": "confirmed",
-                "source": "mock",
-                "created_at": now.isoformat(),
-                "updated_at": now.isoformat(),
-                "is_synced": False
-            },
-            {
-                "id": "mock_2",
-                "google_event_id": "mock_google_2",
-                "title": "Q1 Planning Session",
-                "description": "Quarterly planning meeting",
-                "location": "Conference Room A",
-                "start_time": (now + timedelta(days=7, hours=14)).isoformat(),
-                "end_time": (now + timedelta(days=7, hours=16)).isoformat(),
-                "timezone": "UTC",
-                "is_all_day": False,
-                "attendees": [
-                    {"email": "team@company.com", "name": "Team", "response_status": "accepted"}
-                ],
-                "status": "confirmed",
-                "source": "mock",
-                "created_at": now.isoformat(),
-                "updated_at": now.isoformat(),
-                "is_synced": False
+                **fields,
+                "attendees": [dict(attendee) for attendee in fields["attendees"]],
+                "start_time": (now + start_offset).isoformat(),
+                "end_time": (now + start_offset + duration).isoformat(),
+                "created_at": created_at,
+                "updated_at": created_at
             }
+            for fields, start_offset, duration in _MOCK_EVENT_TEMPLATES
         ]
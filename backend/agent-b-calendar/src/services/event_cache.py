@@ -0,0 +1,217 @@
+"""
+Event List Cache
+================
+
+Short-lived cache for Google Calendar event listings: a small in-process
+TTL cache in front of Redis, invalidated whenever the user's events change.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any
+
+import redis.asyncio as redis
+
+from shared.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class EventListCache:
+    """
+    Cache of event listings keyed by user and query parameters.
+    
+    Each user has a version counter in Redis that every mutation bumps.
+    Cached listings record the version they were read under and are only
+    served while it is current, so invalidating a user is a single INCR
+    instead of a key scan. The in-process tier keeps its own per-user
+    generation and a shorter TTL, which bounds how long another replica's
+    writes can go unseen. Generations are tracked for at most
+    local_maxsize users, least recently used first out. Redis failures are
+    logged and treated as misses.
+    """
+    
+    def __init__(
+        self,
+        redis_url: str,
+        ttl_seconds: int = 60,
+        key_prefix: str = "agent-b:events:",
+        local_maxsize: int = 4096,
+        local_ttl_seconds: int = 15
+    ):
+        """
+        Initialize event list cache.
+        
+        Args:
+            redis_url: Redis connection URL
+            ttl_seconds: Time-to-live for listings in Redis
+            key_prefix: Prefix applied to every Redis key
+            local_maxsize: Maximum entries in the in-process cache
+            local_ttl_seconds: Time-to-live for in-process entries
+        """
+        self.redis_url = redis_url
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self.local_maxsize = local_maxsize
+        self.local_ttl_seconds = min(local_ttl_seconds, ttl_seconds)
+        self._client: redis.Redis | None = None
+        # (user_id, key) -> (expires_at, generation, serialized events), LRU first
+        self._local: OrderedDict[tuple[str, str], tuple[float, int, str]] = OrderedDict()
+        # user_id -> generation, least recently used first
+        self._generations: OrderedDict[str, int] = OrderedDict()
+        self._last_generation = 0
+        # Generation of every user not in _generations
+        self._base_generation = 0
+    
+    @property
+    def client(self) -> redis.Redis:
+        """Get or create Redis client."""
+        if self._client is None:
+            self._client = redis.from_url(self.redis_url, decode_responses=True)
+        return self._client
+    
+    async def close(self):
+        """Close Redis connections."""
+        if self._client:
+            await self._client.aclose()
+    
+    @staticmethod
+    def make_key(
+        calendar_id: str,
+        start_date: date | None,
+        end_date: date | None,
+        max_results: int
+    ) -> str:
+        """Build a cache key from the listing parameters."""
+        content = f"{calendar_id}\0{start_date}\0{end_date}\0{max_results}"
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+    
+    async def get(
+        self,
+        user_id: str,
+        key: str
+    ) -> tuple[list[dict[str, Any]] | None, tuple[int, str | None]]:
+        """
+        Get a cached listing.
+        
+        Args:
+            user_id: User ID
+            key: Cache key from make_key
+        
+        Returns:
+            (cached events or None on miss, opaque version to pass to set)
+        """
+        generation = self._generation(user_id)
+        entry = self._local.get((user_id, key))
+        if entry is not None:
+            expires_at, entry_generation, value = entry
+            if time.monotonic() < expires_at and entry_generation == generation:
+                self._local.move_to_end((user_id, key))
+                return json.loads(value), (generation, None)
+            del self._local[(user_id, key)]
+        
+        try:
+            version, value = await self.client.mget(
+                self._version_key(user_id),
+                self._data_key(user_id, key)
+            )
+        except Exception as e:
+            logger.warning(f"Event cache read failed: {e}")
+            return None, (generation, None)
+        
+        version = version or "0"
+        if value is not None:
+            cached = json.loads(value)
+            if cached["version"] == version:
+                self._set_local(user_id, key, generation, json.dumps(cached["events"]))
+                return cached["events"], (generation, version)
+        
+        return None, (generation, version)
+    
+    async def set(
+        self,
+        user_id: str,
+        key: str,
+        events: list[dict[str, Any]],
+        version: tuple[int, str | None]
+    ) -> None:
+        """
+        Store a listing in the cache.
+        
+        Args:
+            user_id: User ID
+            key: Cache key from make_key
+            events: Events to cache
+            version: Version returned by the get that missed, so a listing
+                fetched while the user's events changed is never served
+        """
+        generation, redis_version = version
+        serialized = json.dumps(events, default=str)
+        self._set_local(user_id, key, generation, serialized)
+        if redis_version is None:
+            return
+        
+        try:
+            await self.client.set(
+                self._data_key(user_id, key),
+                f'{{"version": {json.dumps(redis_version)}, "events": {serialized}}}',
+                ex=self.ttl_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Event cache write failed: {e}")
+    
+    async def invalidate(self, user_id: str) -> None:
+        """
+        Drop every cached listing of a user.
+        
+        Args:
+            user_id: User whose events changed
+        """
+        self._last_generation += 1
+        self._generations[user_id] = self._last_generation
+        self._generations.move_to_end(user_id)
+        if len(self._generations) > self.local_maxsize:
+            self._generations.popitem(last=False)
+            # Forgetting a generation must not revive the listings it
+            # invalidated, so every untracked user moves to a fresh one
+            self._last_generation += 1
+            self._base_generation = self._last_generation
+        
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.incr(self._version_key(user_id))
+                # Outlive every listing stored under an older version
+                pipe.expire(self._version_key(user_id), self.ttl_seconds * 10)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Event cache invalidation failed: {e}")
+    
+    def _generation(self, user_id: str) -> int:
+        """Current in-process generation of a user."""
+        generation = self._generations.get(user_id)
+        if generation is None:
+            return self._base_generation
+        self._generations.move_to_end(user_id)
+        return generation
+    
+    def _version_key(self, user_id: str) -> str:
+        return f"{self.key_prefix}{user_id}:version"
+    
+    def _data_key(self, user_id: str, key: str) -> str:
+        return f"{self.key_prefix}{user_id}:{key}"
+    
+    def _set_local(self, user_id: str, key: str, generation: int, value: str) -> None:
+        """Write an entry to the in-process cache, evicting the oldest when full."""
+        if generation != self._generation(user_id):
+            return  # the user's events changed while this listing was fetched
+        self._local[(user_id, key)] = (
+            time.monotonic() + self.local_ttl_seconds,
+            generation,
+            value
+        )
+        self._local.move_to_end((user_id, key))
+        if len(self._local) > self.local_maxsize:
+            self._local.popitem(last=False)
@@ -0,0 +1 @@
+"""Agent B Unit Tests"""
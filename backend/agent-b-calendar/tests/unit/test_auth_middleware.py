@@ -0,0 +1,76 @@
+"""
+Auth Middleware Tests
+=====================
+
+Which requests TokenValidationMiddleware writes a log record for.
+"""
+
+import httpx
+import pytest
+from starlette.responses import PlainTextResponse
+
+from src.api.middleware import auth_middleware
+from src.api.middleware.auth_middleware import TokenValidationMiddleware
+
+
+class FakeLogger:
+    """Collects the status code of every request logged."""
+
+    def __init__(self):
+        self.status_codes: list[int] = []
+
+    def info(self, event, **fields):
+        self.status_codes.append(fields["status_code"])
+
+    def error(self, event, **fields):
+        pass
+
+
+async def app(scope, receive, send):
+    status_code = int(scope["path"].rsplit("/", 1)[-1])
+    await PlainTextResponse("", status_code=status_code)(scope, receive, send)
+
+
+@pytest.fixture
+def logged(monkeypatch):
+    fake = FakeLogger()
+    monkeypatch.setattr(auth_middleware, "logger", fake)
+    return fake.status_codes
+
+
+@pytest.fixture
+def client(monkeypatch, logged):
+    monkeypatch.setattr(
+        auth_middleware.agent_settings, "request_log_sample_rate", 10
+    )
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=TokenValidationMiddleware(app)),
+        base_url="http://agent-b"
+    )
+
+
+async def test_successful_requests_are_sampled(client, logged):
+    for _ in range(20):
+        await client.get("/status/200")
+
+    assert logged == [200, 200]
+
+
+@pytest.mark.parametrize("status_code", [400, 401, 403, 404, 500, 503])
+async def test_error_responses_are_always_logged(client, logged, status_code):
+    for _ in range(3):
+        await client.get(f"/status/{status_code}")
+
+    assert logged == [status_code] * 3
+
+
+async def test_errors_do_not_consume_success_samples(client, logged):
+    await client.get("/status/200")
+    for _ in range(5):
+        await client.get("/status/401")
+    for _ in range(9):
+        await client.get("/status/200")
+
+    assert logged.count(200) == 1
+    await client.get("/status/200")
+    assert logged.count(200) == 2
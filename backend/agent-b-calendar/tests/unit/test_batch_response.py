@@ -0,0 +1,85 @@
+"""
+Batch Response Parser Tests
+===========================
+
+Parsing of Google Calendar multipart/mixed batch responses.
+"""
+
+import orjson
+import pytest
+
+from src.services.calendar_service import CalendarService
+
+BOUNDARY = "batch_abc123"
+CONTENT_TYPE = f"multipart/mixed; boundary={BOUNDARY}"
+
+
+def _part(status: str, body: dict | None = None, content_id: str | None = None) -> bytes:
+    headers = "Content-Type: application/http\r\n"
+    if content_id is not None:
+        headers += f"Content-ID: <{content_id}>\r\n"
+    response = f"HTTP/1.1 {status}\r\n"
+    if body is None:
+        response += "\r\n"
+        payload = b""
+    else:
+        response += "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+        payload = orjson.dumps(body)
+    return (
+        f"--{BOUNDARY}\r\n{headers}\r\n{response}".encode()
+        + payload
+        + b"\r\n"
+    )
+
+
+def _batch(*parts: bytes) -> bytes:
+    return b"".join(parts) + f"--{BOUNDARY}--\r\n".encode()
+
+
+def test_non_ascii_text_round_trips():
+    event = {"id": "evt_1", "summary": "Café ☕ – Übersicht", "location": "Zürich"}
+    content = _batch(_part("200 OK", event, "response-0"))
+
+    parts = CalendarService._parse_batch_response(CONTENT_TYPE, content)
+
+    assert parts == {0: (200, event)}
+
+
+def test_parts_keyed_by_content_id():
+    content = _batch(
+        _part("200 OK", {"id": "b"}, "response-7"),
+        _part("204 No Content", None, "response-5"),
+        _part("404 Not Found", {"error": {"message": "Not Found"}}, "response-6"),
+    )
+
+    parts = CalendarService._parse_batch_response(CONTENT_TYPE, content, first_index=5)
+
+    assert parts[7] == (200, {"id": "b"})
+    assert parts[5] == (204, None)
+    assert parts[6][0] == 404
+
+
+def test_missing_content_id_falls_back_to_position():
+    content = _batch(
+        _part("200 OK", {"id": "first"}),
+        _part("200 OK", {"id": "second"}),
+    )
+
+    parts = CalendarService._parse_batch_response(CONTENT_TYPE, content, first_index=100)
+
+    assert parts == {100: (200, {"id": "first"}), 101: (200, {"id": "second"})}
+
+
+def test_quoted_boundary():
+    content = _batch(_part("200 OK", {"id": "a"}, "response-0"))
+
+    parts = CalendarService._parse_batch_response(
+        f'multipart/mixed; boundary="{BOUNDARY}"', content
+    )
+
+    assert parts == {0: (200, {"id": "a"})}
+
+
+def test_missing_boundary_raises():
+    with pytest.raises(ValueError):
+        CalendarService._parse_batch_response("application/json", b"{}")
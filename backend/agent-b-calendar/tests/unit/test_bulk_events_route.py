@@ -0,0 +1,121 @@
+"""
+Bulk Events Route Tests
+=======================
+
+POST /api/v1/events/bulk as called by Agent A with a delegated token.
+"""
+
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from shared.auth import TokenClaims, validate_token
+
+from src.api.dependencies import get_calendar_service
+from src.api.routes.calendar import router
+
+
+def _event(title: str) -> dict:
+    return {
+        "title": title,
+        "start_time": "2024-01-15T14:00:00Z",
+        "end_time": "2024-01-15T15:00:00Z"
+    }
+
+
+class FakeCalendarService:
+    """Creates every event except those titled "fail"."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, list]] = []
+
+    async def create_events(self, user_id, events):
+        self.calls.append((user_id, events))
+        return [
+            None if event.title == "fail" else {
+                "id": f"evt_{index}",
+                "title": event.title,
+                "start_time": event.start_time,
+                "end_time": event.end_time
+            }
+            for index, event in enumerate(events)
+        ]
+
+
+@pytest.fixture
+def calendar_service():
+    return FakeCalendarService()
+
+
+@pytest.fixture
+def scopes():
+    return ["calendar.write"]
+
+
+@pytest.fixture
+def client(calendar_service, scopes):
+    now = int(time.time())
+    claims = TokenClaims(
+        sub="user_123",
+        iss="descope",
+        exp=now + 600,
+        iat=now,
+        scopes=scopes,
+        delegation=True,
+        delegator="agent-a-summarizer"
+    )
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    app.dependency_overrides[validate_token] = lambda: claims
+    app.dependency_overrides[get_calendar_service] = lambda: calendar_service
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://agent-b"
+    )
+
+
+async def test_creates_every_event_in_one_service_call(client, calendar_service):
+    response = await client.post(
+        "/api/v1/events/bulk",
+        json={"events": [_event("Standup"), _event("Review")]}
+    )
+
+    assert response.status_code == 201
+    body = response.json()
+    assert [event["title"] for event in body["events"]] == ["Standup", "Review"]
+    assert (body["created_count"], body["failed_count"]) == (2, 0)
+    assert len(calendar_service.calls) == 1
+    assert calendar_service.calls[0][0] == "user_123"
+
+
+async def test_failed_events_are_counted_not_returned(client):
+    response = await client.post(
+        "/api/v1/events/bulk",
+        json={"events": [_event("Standup"), _event("fail")]}
+    )
+
+    body = response.json()
+    assert [event["title"] for event in body["events"]] == ["Standup"]
+    assert (body["created_count"], body["failed_count"]) == (1, 1)
+
+
+@pytest.mark.parametrize("count", [0, 101])
+async def test_batch_size_is_validated(client, calendar_service, count):
+    response = await client.post(
+        "/api/v1/events/bulk",
+        json={"events": [_event(f"Event {index}") for index in range(count)]}
+    )
+
+    assert response.status_code == 422
+    assert calendar_service.calls == []
+
+
+@pytest.mark.parametrize("scopes", [["calendar.read"]])
+async def test_write_scope_is_required(client, calendar_service):
+    response = await client.post(
+        "/api/v1/events/bulk", json={"events": [_event("Standup")]}
+    )
+
+    assert response.status_code == 403
+    assert calendar_service.calls == []
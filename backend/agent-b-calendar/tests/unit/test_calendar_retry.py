@@ -0,0 +1,43 @@
+"""
+Calendar Retry Policy Tests
+===========================
+
+Which Google Calendar responses are resent by CalendarService._send.
+"""
+
+import httpx
+import pytest
+
+from src.services.calendar_service import CalendarService
+
+RATE_LIMITED_403 = b'{"error": {"errors": [{"reason": "rateLimitExceeded"}]}}'
+
+
+@pytest.mark.parametrize("method", ["GET", "POST", "PATCH", "DELETE"])
+def test_throttling_is_retried_for_every_method(method):
+    assert CalendarService._should_retry(method, httpx.Response(429))
+    assert CalendarService._should_retry(
+        method, httpx.Response(403, content=RATE_LIMITED_403)
+    )
+
+
+@pytest.mark.parametrize("status_code", [500, 502, 503, 504])
+def test_server_errors_are_not_retried_for_post(status_code):
+    # The insert or batch may already be committed; resending duplicates it
+    assert not CalendarService._should_retry("POST", httpx.Response(status_code))
+
+
+@pytest.mark.parametrize("method", ["GET", "PATCH", "DELETE"])
+@pytest.mark.parametrize("status_code", [500, 502, 503, 504])
+def test_server_errors_are_retried_for_idempotent_methods(method, status_code):
+    assert CalendarService._should_retry(method, httpx.Response(status_code))
+
+
+@pytest.mark.parametrize("status_code", [200, 400, 404])
+def test_other_responses_are_not_retried(status_code):
+    assert not CalendarService._should_retry("GET", httpx.Response(status_code))
+
+
+def test_permission_denied_403_is_not_retried():
+    forbidden = httpx.Response(403, content=b'{"error": {"message": "Forbidden"}}')
+    assert not CalendarService._should_retry("GET", forbidden)
@@ -0,0 +1,155 @@
+"""
+Event List Cache Tests
+======================
+
+Invalidation, per-user isolation and bounded generation tracking of the
+event listing cache.
+"""
+
+import pytest
+
+from src.services.event_cache import EventListCache
+
+EVENTS = [{"id": "evt_1", "title": "Standup"}]
+KEY = EventListCache.make_key("primary", None, None, 50)
+
+
+class FakePipeline:
+    """Buffers commands until execute, like a non-transactional pipeline."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def incr(self, key):
+        self.commands.append(key)
+
+    def expire(self, key, seconds):
+        pass
+
+    async def execute(self):
+        for key in self.commands:
+            self.redis.data[key] = str(int(self.redis.data.get(key, "0")) + 1)
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the async Redis client."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    async def mget(self, *keys):
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(redis_client):
+    cache = EventListCache(redis_url="redis://unused")
+    cache._client = redis_client
+    return cache
+
+
+async def _fill(cache, user_id="user_1", events=EVENTS):
+    _, version = await cache.get(user_id, KEY)
+    await cache.set(user_id, KEY, events, version)
+
+
+async def test_listing_is_served_after_set(cache):
+    await _fill(cache)
+
+    events, _ = await cache.get("user_1", KEY)
+
+    assert events == EVENTS
+
+
+async def test_listing_is_not_served_to_another_user(cache):
+    await _fill(cache)
+
+    events, _ = await cache.get("user_2", KEY)
+
+    assert events is None
+
+
+async def test_invalidate_drops_local_and_redis_listings(cache):
+    await _fill(cache)
+
+    await cache.invalidate("user_1")
+
+    events, _ = await cache.get("user_1", KEY)
+    assert events is None
+
+
+async def test_invalidate_leaves_other_users_alone(cache):
+    await _fill(cache, "user_1")
+    await _fill(cache, "user_2")
+
+    await cache.invalidate("user_1")
+
+    events, _ = await cache.get("user_2", KEY)
+    assert events == EVENTS
+
+
+async def test_listing_fetched_across_an_invalidation_is_discarded(cache):
+    _, version = await cache.get("user_1", KEY)
+    # The user's events change while the listing is being fetched
+    await cache.invalidate("user_1")
+    await cache.set("user_1", KEY, EVENTS, version)
+
+    events, _ = await cache.get("user_1", KEY)
+
+    assert events is None
+
+
+async def test_invalidation_from_another_replica_is_seen(cache, redis_client):
+    await _fill(cache)
+    # Another replica bumps the Redis version; this one's local copy expires
+    other = EventListCache(redis_url="redis://unused")
+    other._client = redis_client
+    await other.invalidate("user_1")
+    cache._local.clear()
+
+    events, _ = await cache.get("user_1", KEY)
+
+    assert events is None
+
+
+async def test_generations_are_bounded(cache):
+    cache.local_maxsize = 3
+
+    for index in range(10):
+        await cache.invalidate(f"user_{index}")
+
+    assert len(cache._generations) == 3
+
+
+async def test_evicted_generation_does_not_revive_invalidated_listing(cache):
+    cache.local_maxsize = 2
+    await _fill(cache, "user_1")
+    await cache.invalidate("user_1")
+    # Invalidating other users pushes user_1 out of the generation table,
+    # while its pre-invalidation listing is still held locally
+    await cache.invalidate("user_2")
+    await cache.invalidate("user_3")
+    assert "user_1" not in cache._generations
+    assert ("user_1", KEY) in cache._local
+
+    events, _ = await cache.get("user_1", KEY)
+
+    assert events is None
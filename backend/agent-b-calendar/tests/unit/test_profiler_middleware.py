@@ -0,0 +1,47 @@
+"""
+Profiler Middleware Tests
+=========================
+
+Which requests are replaced by a pyinstrument report.
+"""
+
+import httpx
+import pytest
+from starlette.responses import PlainTextResponse
+
+from src.api.middleware import profiler_middleware
+from src.api.middleware.profiler_middleware import ProfilerMiddleware
+
+pytestmark = pytest.mark.skipif(
+    profiler_middleware.Profiler is None, reason="pyinstrument is not installed"
+)
+
+
+async def app(scope, receive, send):
+    await PlainTextResponse("events")(scope, receive, send)
+
+
+@pytest.fixture
+def client():
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=ProfilerMiddleware(app)),
+        base_url="http://agent-b"
+    )
+
+
+@pytest.mark.parametrize("query", ["profile=1", "max_results=5&profile=1"])
+async def test_profile_1_returns_the_report(client, query):
+    response = await client.get(f"/api/v1/events?{query}")
+
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.text != "events"
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["", "profile=0", "profile=10", "profile=", "no_profile=1", "q=profile=1"]
+)
+async def test_other_queries_pass_through(client, query):
+    response = await client.get(f"/api/v1/events?{query}")
+
+    assert response.text == "events"
@@ -0,0 +1,59 @@
+"""
+Rate Limiter Tests
+==================
+
+Per-user token buckets that pace Google Calendar calls.
+"""
+
+import asyncio
+import time
+
+from shared.utils import RateLimiter
+
+
+async def test_burst_is_allowed_without_waiting():
+    limiter = RateLimiter(rate=1, burst=5)
+    start = time.monotonic()
+
+    for _ in range(5):
+        await limiter.acquire("user_1")
+
+    assert time.monotonic() - start < 0.1
+
+
+async def test_empty_bucket_waits_for_a_refill():
+    limiter = RateLimiter(rate=20, burst=1)
+    await limiter.acquire("user_1")
+    start = time.monotonic()
+
+    await limiter.acquire("user_1")
+
+    assert time.monotonic() - start >= 0.04
+
+
+async def test_buckets_are_per_key():
+    limiter = RateLimiter(rate=0.01, burst=1)
+    await limiter.acquire("user_1")
+
+    # user_1 would wait ~100s; user_2 has its own full bucket
+    await asyncio.wait_for(limiter.acquire("user_2"), timeout=1)
+
+
+async def test_concurrent_callers_are_paced_at_the_rate():
+    limiter = RateLimiter(rate=50, burst=2)
+    start = time.monotonic()
+
+    await asyncio.gather(*(limiter.acquire("user_1") for _ in range(6)))
+
+    # Two from the burst, then four refills at 20ms each
+    assert time.monotonic() - start >= 0.07
+
+
+async def test_idle_buckets_are_evicted_least_recently_used():
+    limiter = RateLimiter(rate=1, burst=1, max_keys=2)
+
+    await limiter.acquire("user_1")
+    await limiter.acquire("user_2")
+    await limiter.acquire("user_3")
+
+    assert list(limiter._buckets) == ["user_2", "user_3"]
@@ -0,0 +1,92 @@
+"""
+Scope Tests
+===========
+
+Bitmask scope checks used to authorize calendar requests.
+"""
+
+import time
+
+import pytest
+from fastapi import HTTPException
+from shared.auth import TokenClaims
+from shared.auth.scopes import Scope, ScopeChecker, require_scope, scope_mask
+
+
+def _claims(*scopes: str) -> TokenClaims:
+    now = int(time.time())
+    return TokenClaims(
+        sub="user_1", iss="descope", exp=now + 600, iat=now, scopes=scopes
+    )
+
+
+def test_mask_has_one_bit_per_known_scope():
+    mask = scope_mask(["calendar.read", "calendar.write", "calendar.read"])
+
+    assert mask == scope_mask([Scope.CALENDAR_READ]) | scope_mask(
+        [Scope.CALENDAR_WRITE]
+    )
+    assert mask.bit_count() == 2
+
+
+def test_mask_ignores_unknown_scopes():
+    assert scope_mask(["calendar.read", "openid", "calendar:read"]) == scope_mask(
+        ["calendar.read"]
+    )
+
+
+def test_claims_mask_matches_granted_scopes():
+    claims = _claims("calendar.read", "openid")
+
+    assert claims.scope_mask == scope_mask(["calendar.read"])
+
+
+async def test_require_all_passes_with_every_scope():
+    checker = ScopeChecker([Scope.CALENDAR_READ, Scope.CALENDAR_WRITE])
+    claims = _claims("calendar.write", "calendar.read", "profile.read")
+
+    assert await checker(claims) is claims
+
+
+async def test_require_all_reports_missing_scopes():
+    checker = ScopeChecker([Scope.CALENDAR_WRITE, Scope.CALENDAR_READ])
+
+    with pytest.raises(HTTPException) as raised:
+        await checker(_claims("profile.read"))
+
+    assert raised.value.status_code == 403
+    assert raised.value.detail == (
+        "Missing required scopes: calendar.read, calendar.write"
+    )
+
+
+async def test_require_any_passes_with_one_scope():
+    checker = ScopeChecker(
+        [Scope.ADMIN_READ, Scope.CALENDAR_READ], require_all=False
+    )
+    claims = _claims("calendar.read")
+
+    assert await checker(claims) is claims
+
+
+async def test_require_any_rejects_none_granted():
+    checker = ScopeChecker(
+        [Scope.ADMIN_READ, Scope.CALENDAR_READ], require_all=False
+    )
+
+    with pytest.raises(HTTPException) as raised:
+        await checker(_claims("email.read"))
+
+    assert raised.value.status_code == 403
+
+
+def test_unknown_required_scope_is_rejected():
+    with pytest.raises(ValueError):
+        ScopeChecker(["calendar:read"])
+
+
+def test_require_scope_reuses_checker_for_same_scopes():
+    first = require_scope(Scope.CALENDAR_READ, Scope.CALENDAR_WRITE)
+
+    assert require_scope(Scope.CALENDAR_READ, Scope.CALENDAR_WRITE) is first
+    assert require_scope(Scope.CALENDAR_READ) is not first
@@ -0,0 +1,221 @@
+"""
+Token Validator Tests
+=====================
+
+Verification of Descope-issued JWTs against the project's JWKS.
+"""
+
+import json
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+from shared.auth import TokenValidator, token_validator
+from shared.utils.exceptions import AuthenticationError
+
+PROJECT_ID = "P2test"
+ISSUER = f"https://api.descope.com/{PROJECT_ID}"
+
+
+def _rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _jwk(private_key, kid: str) -> dict:
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    return jwk | {"kid": kid, "alg": "RS256", "use": "sig"}
+
+
+SIGNING_KEY = _rsa_key()
+
+
+def _token(key=SIGNING_KEY, kid: str = "key_1", **claims) -> str:
+    now = int(time.time())
+    payload = {"sub": "user_1", "iss": ISSUER, "iat": now, "exp": now + 600}
+    return jwt.encode(
+        payload | claims, key, algorithm="RS256", headers={"kid": kid}
+    )
+
+
+@pytest.fixture
+def validator():
+    validator = TokenValidator(PROJECT_ID)
+    validator.jwks = {"keys": [_jwk(SIGNING_KEY, "key_1")]}
+    validator.fetches = 0
+
+    async def fetch_jwks():
+        validator.fetches += 1
+        return validator.jwks
+
+    validator._fetch_jwks = fetch_jwks
+    return validator
+
+
+async def test_valid_token_yields_claims(validator):
+    claims = await validator.validate_token(
+        _token(scope="calendar:read calendar:write", email="ada@example.com")
+    )
+
+    assert claims.sub == "user_1"
+    assert claims.scopes == {"calendar:read", "calendar:write"}
+    assert claims.email == "ada@example.com"
+
+
+async def test_token_without_audience_is_accepted(validator):
+    claims = await validator.validate_token(_token())
+
+    assert claims.aud is None
+
+
+@pytest.mark.parametrize("audience", [PROJECT_ID, ["other", PROJECT_ID]])
+async def test_token_for_this_project_is_accepted(validator, audience):
+    claims = await validator.validate_token(_token(aud=audience))
+
+    assert claims.sub == "user_1"
+
+
+@pytest.mark.parametrize("audience", ["other", ["other", "another"]])
+async def test_token_for_another_audience_is_rejected(validator, audience):
+    with pytest.raises(AuthenticationError, match="Invalid token"):
+        await validator.validate_token(_token(aud=audience))
+
+
+async def test_token_from_another_issuer_is_rejected(validator):
+    with pytest.raises(AuthenticationError, match="Invalid token"):
+        await validator.validate_token(_token(iss="https://evil.example.com"))
+
+
+async def test_expired_token_is_rejected(validator):
+    with pytest.raises(AuthenticationError, match="expired"):
+        await validator.validate_token(_token(exp=int(time.time()) - 60))
+
+
+async def test_token_signed_with_another_key_is_rejected(validator):
+    with pytest.raises(AuthenticationError, match="Invalid token"):
+        await validator.validate_token(_token(key=_rsa_key()))
+
+
+async def test_jwks_is_fetched_once_for_known_keys(validator):
+    await validator.validate_token(_token(sub="user_1"))
+    await validator.validate_token(_token(sub="user_2"))
+
+    assert validator.fetches == 1
+
+
+async def test_unknown_kid_refreshes_jwks_after_rotation(validator, monkeypatch):
+    monkeypatch.setattr(token_validator, "JWKS_MIN_REFRESH_INTERVAL_SECONDS", 0)
+    await validator.get_jwks()
+    rotated = _rsa_key()
+    validator.jwks = {"keys": [_jwk(rotated, "key_2")]}
+
+    claims = await validator.validate_token(_token(key=rotated, kid="key_2"))
+
+    assert claims.sub == "user_1"
+    assert validator.fetches == 2
+
+
+async def test_unknown_kid_refresh_is_rate_limited(validator):
+    await validator.get_jwks()
+
+    for _ in range(3):
+        with pytest.raises(AuthenticationError):
+            await validator.validate_token(_token(kid="missing"))
+
+    assert validator.fetches == 1
+
+
+async def test_jwks_keys_without_kid_are_skipped(validator):
+    validator.jwks = {
+        "keys": [
+            {"kty": "RSA", "n": "AQAB", "e": "AQAB"},
+            _jwk(SIGNING_KEY, "key_1")
+        ]
+    }
+
+    await validator.prime()
+
+    assert list(validator._keys_by_kid) == ["key_1"]
+
+
+@pytest.mark.parametrize(
+    "token",
+    ["", "not-a-jwt", "a.b", "a.b.c.d", "a.b+c.d", "a.b.c=", "a." * 5000 + "b"]
+)
+async def test_malformed_token_is_rejected_without_jwks(validator, token):
+    with pytest.raises(AuthenticationError, match="Malformed"):
+        await validator.validate_token(token)
+
+    assert validator.fetches == 0
+
+
+async def test_oversized_token_is_rejected_without_jwks(validator):
+    oversized = _token(padding="x" * token_validator.MAX_TOKEN_LENGTH)
+
+    with pytest.raises(AuthenticationError, match="Malformed"):
+        await validator.validate_token(oversized)
+
+    assert validator.fetches == 0
+
+
+@pytest.fixture
+def verifications(validator):
+    calls = []
+    verify = validator._verify_token
+
+    async def counting_verify(token):
+        calls.append(token)
+        return await verify(token)
+
+    validator._verify_token = counting_verify
+    return calls
+
+
+async def test_repeat_token_skips_verification(validator, verifications):
+    token = _token()
+
+    first = await validator.validate_token(token)
+    second = await validator.validate_token(token)
+
+    assert first is second
+    assert len(verifications) == 1
+    # Keyed by digest, so the bearer token itself is not kept
+    assert token.encode() not in validator._claims_cache
+
+
+@pytest.mark.parametrize(
+    ("expires_in", "trusted_for"),
+    [(60, 60), (3600, token_validator.CLAIMS_CACHE_TTL_SECONDS)]
+)
+async def test_claims_are_trusted_until_expiry_or_ttl(
+    validator, expires_in, trusted_for
+):
+    now = time.time()
+    await validator.validate_token(_token(exp=int(now) + expires_in))
+
+    ((trusted_until, _),) = validator._claims_cache.values()
+
+    assert trusted_until == pytest.approx(now + trusted_for, abs=2)
+
+
+async def test_stale_entry_is_verified_again(validator, verifications):
+    token = _token()
+    await validator.validate_token(token)
+    key, (_, claims) = next(iter(validator._claims_cache.items()))
+    validator._claims_cache[key] = (time.time() - 1, claims)
+
+    await validator.validate_token(token)
+
+    assert len(verifications) == 2
+
+
+async def test_claims_cache_evicts_least_recently_used(validator, monkeypatch):
+    monkeypatch.setattr(token_validator, "CLAIMS_CACHE_SIZE", 2)
+    tokens = [_token(sub=f"user_{index}") for index in range(3)]
+
+    for token in tokens:
+        await validator.validate_token(token)
+
+    subjects = [claims.sub for _, claims in validator._claims_cache.values()]
+    assert subjects == ["user_1", "user_2"]
@@ -7,4 +7,4 @@ shared across all agents in the IntelliFlow multi-agent system.
 """
 
 __version__ = "1.0.0"
-__all__ = ["config", "auth", "models", "database", "utils"]
+__all__ = ["config", "auth", "models", "database", "http", "utils"]
@@ -7,12 +7,18 @@ Includes token validation, scope enforcement, and delegation support.
 """
 
 from .descope_client import DescopeClient, get_descope_client
-from .token_validator import TokenValidator, validate_token, get_current_user
+from .token_validator import (
+    TokenClaims,
+    TokenValidator,
+    validate_token,
+    get_current_user,
+)
 from .scopes import Scope, ScopeChecker, require_scope
 
 __all__ = [
     "DescopeClient",
     "get_descope_client",
+    "TokenClaims",
     "TokenValidator",
     "validate_token",
     "get_current_user",
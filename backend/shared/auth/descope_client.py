@@ -7,10 +7,14 @@ Handles token exchange, refresh, and user management.
 """
 
 import asyncio
+import hashlib
+import time
+from collections import OrderedDict
 from functools import lru_cache
 from typing import Any, Optional
 
 import httpx
+import orjson
 from descope import (
     REFRESH_SESSION_COOKIE_NAME,
     SESSION_COOKIE_NAME,
@@ -19,11 +23,22 @@ from descope import (
 )
 
 from ..config import settings
+from ..http import get_client
 from ..utils.logger import get_logger
 from ..utils.exceptions import AuthenticationError, TokenExchangeError
 
 logger = get_logger(__name__)
 
+# Scope sets remembered for recently seen tokens
+SCOPE_CACHE_SIZE = 4096
+
+# Delegated tokens created concurrently by create_delegated_tokens
+DELEGATION_CONCURRENCY = 16
+
+# Validated sessions kept in memory, and the longest time any one is trusted
+SESSION_CACHE_SIZE = 8192
+SESSION_CACHE_TTL_SECONDS = 30
+
 
 class DescopeClient:
     """
@@ -47,7 +62,11 @@ class DescopeClient:
         self.project_id = project_id
         self.management_key = management_key
         self._client: Optional[BaseDescopeClient] = None
-        self._http_client: Optional[httpx.AsyncClient] = None
+        self._base_url = settings.descope.base_url.rstrip("/")
+        # token digest -> (trusted until, claims), least recently used first
+        self._session_cache: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        # token jti -> granted scopes, least recently used first
+        self._scope_cache: OrderedDict[str, frozenset[str]] = OrderedDict()
         
     @property
     def client(self) -> BaseDescopeClient:
@@ -61,23 +80,17 @@ class DescopeClient:
     
     @property
     def http_client(self) -> httpx.AsyncClient:
-        """Get or create async HTTP client for custom API calls."""
-        if self._http_client is None:
-            self._http_client = httpx.AsyncClient(
-                base_url=settings.descope.base_url,
-                timeout=30.0
-            )
-        return self._http_client
-    
-    async def close(self):
-        """Close HTTP client connections."""
-        if self._http_client:
-            await self._http_client.aclose()
+        """Shared pooled HTTP/2 client for custom API calls."""
+        return get_client()
     
     def validate_session(self, session_token: str) -> dict[str, Any]:
         """
         Validate a session token.
         
+        Results are cached by token digest for SESSION_CACHE_TTL_SECONDS,
+        or until the token expires if sooner, so a client calling in a
+        burst pays for one signature verification.
+
         Args:
             session_token: JWT session token
             
@@ -87,11 +100,41 @@ class DescopeClient:
         Raises:
             AuthenticationError: If token is invalid
         """
+        key = self._session_key(session_token)
+        cached = self._session_cache.get(key)
+        if cached is not None:
+            if time.time() < cached[0]:
+                self._session_cache.move_to_end(key)
+                return cached[1]
+            del self._session_cache[key]
+
         try:
-            return self.client.validate_session(session_token)
+            claims = self.client.validate_session(session_token)
         except AuthException as e:
             logger.warning(f"Session validation failed: {e}")
             raise AuthenticationError(f"Invalid session token: {e}")
+
+        trusted_until = time.time() + SESSION_CACHE_TTL_SECONDS
+        if isinstance(claims.get("exp"), (int, float)):
+            trusted_until = min(trusted_until, claims["exp"])
+        self._session_cache[key] = (trusted_until, claims)
+        if len(self._session_cache) > SESSION_CACHE_SIZE:
+            self._session_cache.popitem(last=False)
+        return claims
+
+    def forget_session(self, session_token: str) -> None:
+        """
+        Drop a cached session validation, e.g. on logout.
+
+        Args:
+            session_token: JWT session token
+        """
+        self._session_cache.pop(self._session_key(session_token), None)
+
+    @staticmethod
+    def _session_key(session_token: str) -> bytes:
+        """Digest a session token so raw tokens are not kept as cache keys."""
+        return hashlib.blake2b(session_token.encode(), digest_size=16).digest()
     
     def validate_and_refresh_session(
         self,
@@ -145,7 +188,7 @@ class DescopeClient:
         try:
             # Use Descope's token exchange endpoint
             response = await self.http_client.post(
-                f"/v1/auth/accesskey/exchange",
+                f"{self._base_url}/v1/auth/accesskey/exchange",
                 headers={
                     "Authorization": f"Bearer {self.project_id}",
                     "Content-Type": "application/json"
@@ -158,13 +201,18 @@ class DescopeClient:
                 }
             )
             
+            # Parse the body once, whichever branch is taken
+            try:
+                data = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                data = {}
+
             if response.status_code != 200:
-                error_data = response.json()
                 raise TokenExchangeError(
-                    f"Token exchange failed: {error_data.get('message', 'Unknown error')}"
+                    f"Token exchange failed: {data.get('message', 'Unknown error')}"
                 )
             
-            return response.json()
+            return data
             
         except httpx.HTTPError as e:
             logger.error(f"HTTP error during token exchange: {e}")
@@ -192,7 +240,7 @@ class DescopeClient:
         try:
             # Use management API to create delegated token
             response = await self.http_client.post(
-                f"/v1/mgmt/accesskey/create",
+                f"{self._base_url}/v1/mgmt/accesskey/create",
                 headers={
                     "Authorization": f"Bearer {self.management_key}",
                     "Content-Type": "application/json"
@@ -219,6 +267,36 @@ class DescopeClient:
             logger.error(f"Failed to create delegated token: {e}")
             raise TokenExchangeError(f"Delegation failed: {e}")
     
+    async def create_delegated_tokens(
+        self,
+        requests: list[dict[str, Any]],
+        concurrency: int = DELEGATION_CONCURRENCY
+    ) -> list[str]:
+        """
+        Create several delegated tokens concurrently.
+
+        The management API has no bulk endpoint, so requests run in
+        parallel, at most `concurrency` at a time, over the shared HTTP/2
+        connection.
+
+        Args:
+            requests: Keyword arguments for create_delegated_token, one per token
+            concurrency: Maximum requests in flight
+
+        Returns:
+            Delegated access tokens in request order
+
+        Raises:
+            TokenExchangeError: If any token could not be created
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def create(request: dict[str, Any]) -> str:
+            async with semaphore:
+                return await self.create_delegated_token(**request)
+
+        return list(await asyncio.gather(*(create(request) for request in requests)))
+
     def get_user_scopes(self, token_claims: dict[str, Any]) -> list[str]:
         """
         Extract scopes from token claims.
@@ -252,8 +330,35 @@ class DescopeClient:
         Returns:
             True if scope is present
         """
-        scopes = self.get_user_scopes(token_claims)
-        return required_scope in scopes
+        return required_scope in self.get_scope_set(token_claims)
+
+    def get_scope_set(self, token_claims: dict[str, Any]) -> frozenset[str]:
+        """
+        Get granted scopes as a set, remembered per token.
+
+        Tokens are identified by their unique `jti` claim; claims without
+        one are normalized on every call.
+
+        Args:
+            token_claims: Decoded JWT claims
+
+        Returns:
+            Set of granted scopes
+        """
+        token_id = token_claims.get("jti")
+        if token_id is None:
+            return frozenset(self.get_user_scopes(token_claims))
+
+        scopes = self._scope_cache.get(token_id)
+        if scopes is not None:
+            self._scope_cache.move_to_end(token_id)
+            return scopes
+
+        scopes = frozenset(self.get_user_scopes(token_claims))
+        self._scope_cache[token_id] = scopes
+        if len(self._scope_cache) > SCOPE_CACHE_SIZE:
+            self._scope_cache.popitem(last=False)
+        return scopes
 
 
 @lru_cache
@@ -5,14 +5,14 @@ Scope Definitions and Enforcement
 Defines OAuth scopes and provides utilities for scope-based authorization.
 """
 
+from collections.abc import Iterable
 from enum import Enum
-from functools import wraps
-from typing import Callable, Optional
+from functools import lru_cache
 
 from fastapi import Depends, HTTPException, status
 
-from .token_validator import TokenClaims, validate_token
 from ..utils.logger import get_logger
+from .token_validator import TokenClaims, validate_token
 
 logger = get_logger(__name__)
 
@@ -56,6 +56,28 @@ SCOPE_DESCRIPTIONS = {
     Scope.ADMIN_WRITE: "Perform administrative actions",
 }
 
+# Scope members by value, for mapping granted scope strings back to the enum
+_SCOPES_BY_VALUE: dict[str, Scope] = {scope.value: scope for scope in Scope}
+
+# One bit per Scope member, so scope checks are an integer AND and compare
+_SCOPE_BITS: dict[str, int] = {scope.value: 1 << i for i, scope in enumerate(Scope)}
+
+
+def scope_mask(scopes: Iterable[str]) -> int:
+    """
+    Encode scope strings as a bitmask of Scope members.
+
+    Args:
+        scopes: Scope strings; values that are not Scope members are ignored
+
+    Returns:
+        Bitmask with one bit set per known scope
+    """
+    mask = 0
+    for scope in scopes:
+        mask |= _SCOPE_BITS.get(scope, 0)
+    return mask
+
 
 class ScopeChecker:
     """
@@ -77,7 +99,10 @@ class ScopeChecker:
             require_all: If True, all scopes must be present.
                         If False, at least one scope must be present.
         """
-        self.required_scopes = [str(scope) for scope in required_scopes]
+        # Scope() rejects unknown strings, which the bitmask cannot represent
+        self.required_scopes = [str(Scope(scope)) for scope in required_scopes]
+        self.required_scope_set = frozenset(self.required_scopes)
+        self.required_mask = scope_mask(self.required_scopes)
         self.require_all = require_all
     
     async def __call__(
@@ -96,14 +121,12 @@ class ScopeChecker:
         Raises:
             HTTPException: If scope check fails
         """
-        user_scopes = claims.scopes
+        granted = claims.scope_mask & self.required_mask
         
         if self.require_all:
-            missing = [
-                scope for scope in self.required_scopes
-                if scope not in user_scopes
-            ]
-            if missing:
+            if granted != self.required_mask:
+                # Sorted for a stable error message
+                missing = sorted(self.required_scope_set - claims.scopes)
                 logger.warning(
                     f"Scope check failed for user {claims.sub}. "
                     f"Missing scopes: {missing}"
@@ -113,11 +136,7 @@ class ScopeChecker:
                     detail=f"Missing required scopes: {', '.join(missing)}"
                 )
         else:
-            has_any = any(
-                scope in user_scopes
-                for scope in self.required_scopes
-            )
-            if not has_any:
+            if not granted:
                 logger.warning(
                     f"Scope check failed for user {claims.sub}. "
                     f"Requires at least one of: {self.required_scopes}"
@@ -147,8 +166,15 @@ def require_scope(*scopes: Scope, require_all: bool = True):
         require_all: If True, all scopes must be present
         
     Returns:
-        ScopeChecker dependency
+        ScopeChecker dependency, shared by every call with the same
+        arguments so FastAPI resolves it once per request
     """
+    return _require_scope_cached(scopes, require_all)
+
+
+@lru_cache(maxsize=128)
+def _require_scope_cached(scopes: tuple[Scope, ...], require_all: bool) -> ScopeChecker:
+    """Build one ScopeChecker per distinct scope combination."""
     return ScopeChecker(list(scopes), require_all=require_all)
 
 
@@ -177,8 +203,8 @@ def get_allowed_scopes(claims: TokenClaims) -> list[Scope]:
         List of matching Scope enums
     """
     return [
-        scope for scope in Scope
-        if str(scope) in claims.scopes
+        _SCOPES_BY_VALUE[scope] for scope in claims.scopes
+        if scope in _SCOPES_BY_VALUE
     ]
 
 
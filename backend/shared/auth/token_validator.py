@@ -6,21 +6,42 @@ JWT token validation utilities using Descope's JWKS.
 Provides FastAPI dependencies for authentication.
 """
 
+import asyncio
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from functools import cached_property
 from typing import Any, Optional
 
-import httpx
+import jwt
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
-from jose.exceptions import ExpiredSignatureError
-from pydantic import BaseModel
+from jwt import ExpiredSignatureError, InvalidTokenError, PyJWK
+from pydantic import BaseModel, field_validator
 
 from ..config import settings
+from ..http import get_client
 from ..utils.logger import get_logger
 from ..utils.exceptions import AuthenticationError
 
 logger = get_logger(__name__)
 
+# Validated tokens kept in memory, and the longest time any one is trusted
+CLAIMS_CACHE_SIZE = 4096
+CLAIMS_CACHE_TTL_SECONDS = 300
+
+# Tokens longer than this are rejected before any decoding
+MAX_TOKEN_LENGTH = 8192
+
+# header.payload.signature, each segment base64url without padding
+_JWT_SHAPE = re.compile(r"[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+")
+
+# Background JWKS refresh period, and the minimum gap between refreshes
+# triggered by tokens signed with an unknown key
+JWKS_REFRESH_INTERVAL_SECONDS = 300
+JWKS_MIN_REFRESH_INTERVAL_SECONDS = 30
+
 # HTTP Bearer token security scheme
 security = HTTPBearer(auto_error=False)
 
@@ -34,7 +55,7 @@ class TokenClaims(BaseModel):
     exp: int  # Expiration timestamp
     iat: int  # Issued at timestamp
     azp: Optional[str] = None  # Authorized party (client ID)
-    scopes: list[str] = []  # Granted scopes
+    scopes: frozenset[str] = frozenset()  # Granted scopes
     email: Optional[str] = None
     name: Optional[str] = None
     delegation: bool = False  # Whether this is a delegated token
@@ -43,12 +64,29 @@ class TokenClaims(BaseModel):
     class Config:
         extra = "allow"  # Allow additional claims
 
+    @field_validator("scopes", mode="before")
+    @classmethod
+    def split_scope_string(cls, value: Any) -> Any:
+        """Accept OAuth's space-delimited scope string as well as a list."""
+        if isinstance(value, str):
+            return value.split()
+        return value
+
+    @cached_property
+    def scope_mask(self) -> int:
+        """Granted scopes as a Scope bitmask, built once per claims object."""
+        from .scopes import scope_mask  # scopes imports this module
+        return scope_mask(self.scopes)
+
 
 class TokenValidator:
     """
     JWT token validator using Descope's JWKS.
     
-    Caches the JWKS and provides validation methods.
+    Caches the JWKS indexed by key ID and provides validation methods.
+    Keys are refreshed periodically once start_refresh is called, and on
+    demand when a token names a key ID that is not cached, which picks up
+    Descope key rotation.
     """
     
     def __init__(self, project_id: str):
@@ -60,25 +98,102 @@ class TokenValidator:
         """
         self.project_id = project_id
         self._jwks: Optional[dict] = None
+        self._keys_by_kid: dict[str, PyJWK] = {}
+        self._jwks_fetched_at = 0.0
+        self._jwks_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+        # token digest -> (trusted until, claims), least recently used first
+        self._claims_cache: OrderedDict[bytes, tuple[float, TokenClaims]] = OrderedDict()
         self._jwks_uri = f"https://api.descope.com/{project_id}/.well-known/jwks.json"
     
     async def _fetch_jwks(self) -> dict:
         """Fetch JWKS from Descope."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self._jwks_uri)
-            response.raise_for_status()
-            return response.json()
+        response = await get_client().get(self._jwks_uri)
+        response.raise_for_status()
+        return response.json()
+
+    async def prime(self) -> dict:
+        """Fetch the JWKS and index its parsed keys by key ID."""
+        jwks = await self._fetch_jwks()
+        keys_by_kid = {}
+        for key in jwks.get("keys", []):
+            if "kid" not in key:
+                continue
+            try:
+                keys_by_kid[key["kid"]] = PyJWK(key)
+            except jwt.PyJWTError as e:
+                logger.warning(f"Skipping unusable JWKS key {key['kid']}: {e}")
+        self._keys_by_kid = keys_by_kid
+        self._jwks = jwks
+        self._jwks_fetched_at = time.monotonic()
+        return jwks
     
     async def get_jwks(self) -> dict:
         """Get JWKS, fetching if not cached."""
         if self._jwks is None:
-            self._jwks = await self._fetch_jwks()
+            async with self._jwks_lock:
+                if self._jwks is None:
+                    await self.prime()
         return self._jwks
     
+    async def _get_signing_key(self, kid: str | None) -> PyJWK | None:
+        """
+        Find the JWKS key for a key ID.
+
+        An unknown key ID triggers one refresh, shared by concurrent
+        callers and rate limited, in case Descope rotated its keys.
+        """
+        await self.get_jwks()
+        key = self._keys_by_kid.get(kid)
+        if key is not None:
+            return key
+
+        fetched_at = self._jwks_fetched_at
+        async with self._jwks_lock:
+            if (
+                self._jwks_fetched_at == fetched_at
+                and time.monotonic() - fetched_at >= JWKS_MIN_REFRESH_INTERVAL_SECONDS
+            ):
+                logger.info("Unknown signing key, refreshing JWKS", kid=kid)
+                await self.prime()
+        return self._keys_by_kid.get(kid)
+
+    def start_refresh(self) -> None:
+        """Start refreshing the JWKS in the background."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_periodically())
+
+    async def stop_refresh(self) -> None:
+        """Stop the background JWKS refresh."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    async def _refresh_periodically(self) -> None:
+        """Re-fetch the JWKS every JWKS_REFRESH_INTERVAL_SECONDS."""
+        while True:
+            await asyncio.sleep(JWKS_REFRESH_INTERVAL_SECONDS)
+            try:
+                async with self._jwks_lock:
+                    await self.prime()
+            except Exception as e:
+                # Keep serving the cached keys until the next attempt
+                logger.warning(f"JWKS refresh failed: {e}")
+
     async def validate_token(self, token: str) -> TokenClaims:
         """
         Validate a JWT token.
         
+        Claims of a verified token are cached until the token expires, or
+        for at most CLAIMS_CACHE_TTL_SECONDS, so repeat requests with the
+        same session token skip signature verification. The signature
+        binds the token string to its claims, so a digest of the token is
+        a safe cache key, and raw tokens are not kept in memory.
+
         Args:
             token: JWT token string
             
@@ -88,40 +203,65 @@ class TokenValidator:
         Raises:
             AuthenticationError: If token is invalid
         """
+        # Reject garbage without hashing, JWKS lookups or crypto
+        if len(token) > MAX_TOKEN_LENGTH or _JWT_SHAPE.fullmatch(token) is None:
+            raise AuthenticationError("Malformed token")
+
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        cached = self._claims_cache.get(key)
+        if cached is not None:
+            if time.time() < cached[0]:
+                self._claims_cache.move_to_end(key)
+                return cached[1]
+            del self._claims_cache[key]
+
+        claims = await self._verify_token(token)
+
+        self._claims_cache[key] = (
+            min(claims.exp, time.time() + CLAIMS_CACHE_TTL_SECONDS),
+            claims
+        )
+        if len(self._claims_cache) > CLAIMS_CACHE_SIZE:
+            self._claims_cache.popitem(last=False)
+        return claims
+
+    async def _verify_token(self, token: str) -> TokenClaims:
+        """Verify a JWT signature and standard claims, and build TokenClaims."""
         try:
-            # Get JWKS for signature verification
-            jwks = await self.get_jwks()
-            
             # Decode header to get key ID
-            unverified_headers = jwt.get_unverified_headers(token)
+            unverified_headers = jwt.get_unverified_header(token)
             kid = unverified_headers.get("kid")
             
             # Find matching key
-            rsa_key = None
-            for key in jwks.get("keys", []):
-                if key.get("kid") == kid:
-                    rsa_key = key
-                    break
+            signing_key = await self._get_signing_key(kid)
             
-            if not rsa_key:
+            if not signing_key:
                 raise AuthenticationError("Unable to find matching key")
             
             # Verify and decode token
             payload = jwt.decode(
                 token,
-                rsa_key,
+                signing_key.key,
                 algorithms=[settings.app.jwt_algorithm],
-                audience=self.project_id,
-                issuer=f"https://api.descope.com/{self.project_id}"
+                issuer=f"https://api.descope.com/{self.project_id}",
+                # The audience is checked below, only when the token has one
+                options={"verify_aud": False}
             )
             
+            audience = payload.get("aud")
+            if audience is not None:
+                audiences = [audience] if isinstance(audience, str) else audience
+                if self.project_id not in audiences:
+                    raise jwt.InvalidAudienceError("Audience doesn't match")
+                # A list audience is recorded as the entry that matched
+                audience = self.project_id
+
             # Extract scopes from various possible locations
             scopes = []
             if "scopes" in payload:
                 scopes = payload["scopes"]
             elif "scope" in payload:
-                scope = payload["scope"]
-                scopes = scope.split() if isinstance(scope, str) else scope
+                scopes = payload["scope"]  # split by TokenClaims if a string
             elif "permissions" in payload:
                 scopes = payload["permissions"]
             
@@ -129,7 +269,7 @@ class TokenValidator:
             claims = TokenClaims(
                 sub=payload.get("sub", ""),
                 iss=payload.get("iss", ""),
-                aud=payload.get("aud"),
+                aud=audience,
                 exp=payload.get("exp", 0),
                 iat=payload.get("iat", 0),
                 azp=payload.get("azp"),
@@ -145,7 +285,7 @@ class TokenValidator:
         except ExpiredSignatureError:
             logger.warning("Token has expired")
             raise AuthenticationError("Token has expired")
-        except JWTError as e:
+        except InvalidTokenError as e:
             logger.warning(f"JWT validation error: {e}")
             raise AuthenticationError(f"Invalid token: {e}")
         except Exception as e:
@@ -167,7 +307,7 @@ class TokenValidator:
         Returns:
             True if all required scopes are present
         """
-        return all(scope in claims.scopes for scope in required_scopes)
+        return claims.scopes.issuperset(map(str, required_scopes))
 
 
 # Global validator instance
@@ -225,6 +365,6 @@ async def get_current_user(
         "user_id": claims.sub,
         "email": claims.email,
         "name": claims.name,
-        "scopes": claims.scopes,
+        "scopes": sorted(claims.scopes),
         "is_delegated": claims.delegation,
     }
@@ -5,14 +5,21 @@ Database Module
 Database connection and session management using SQLAlchemy.
 """
 
+from typing import Any
+
+from . import connection
 from .connection import (
-    engine,
-    async_engine,
-    SessionLocal,
-    AsyncSessionLocal,
+    get_engine,
+    get_async_engine,
+    get_session_factory,
+    get_async_session_factory,
     get_db,
     get_async_db,
+    get_db_session,
     init_db,
+    init_async_db,
+    close_db,
+    check_database,
 )
 
 __all__ = [
@@ -20,7 +27,20 @@ __all__ = [
     "async_engine",
     "SessionLocal",
     "AsyncSessionLocal",
+    "get_engine",
+    "get_async_engine",
+    "get_session_factory",
+    "get_async_session_factory",
     "get_db",
     "get_async_db",
+    "get_db_session",
     "init_db",
+    "init_async_db",
+    "close_db",
+    "check_database",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # engine, async_engine and the session factories are created on first access
+    return getattr(connection, name)
@@ -6,12 +6,23 @@ SQLAlchemy engine and session configuration.
 Supports both sync and async database operations.
 """
 
+import time
+import uuid
+from collections.abc import AsyncGenerator, Generator
 from contextlib import asynccontextmanager, contextmanager
-from typing import AsyncGenerator, Generator
+from functools import cache
+from typing import Any
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import orjson
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from ..config import settings
 from ..models.base import Base
@@ -19,6 +30,12 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds a database health check result is reused by check_database
+DB_HEALTH_CACHE_SECONDS = 5.0
+
+# (monotonic time of last check, error message or None if healthy)
+_last_health_check: tuple[float, str | None] = (float("-inf"), None)
+
 
 def get_sync_url() -> str:
     """Get synchronous database URL."""
@@ -40,39 +57,125 @@ def get_async_url() -> str:
     return url
 
 
-# Create sync engine
-engine = create_engine(
-    get_sync_url(),
-    pool_size=settings.database.db_pool_size,
-    max_overflow=settings.database.db_max_overflow,
-    echo=settings.database.db_echo,
-    pool_pre_ping=True,  # Enable connection health checks
-)
+def get_pool_options() -> dict[str, Any]:
+    """Get engine pooling arguments for the configured pool class."""
+    if settings.database.db_pool_class == "null":
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": settings.database.db_pool_size,
+        "max_overflow": settings.database.db_max_overflow,
+        "pool_timeout": settings.database.db_pool_timeout,
+        # Replace connections before server-side or PgBouncer idle timeouts;
+        # dead sockets are caught by TCP keepalive instead of a per-checkout
+        # SELECT 1 unless pre-ping is enabled
+        "pool_recycle": settings.database.db_pool_recycle,
+        "pool_pre_ping": settings.database.db_pool_pre_ping,
+    }
 
-# Create async engine
-async_engine = create_async_engine(
-    get_async_url(),
-    pool_size=settings.database.db_pool_size,
-    max_overflow=settings.database.db_max_overflow,
-    echo=settings.database.db_echo,
-    pool_pre_ping=True,
-)
 
-# Session factories
-SessionLocal = sessionmaker(
-    bind=engine,
-    autocommit=False,
-    autoflush=False,
-    expire_on_commit=False,
-)
+def json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB column values with orjson."""
+    return orjson.dumps(value).decode()
 
-AsyncSessionLocal = async_sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    autocommit=False,
-    autoflush=False,
-    expire_on_commit=False,
-)
+
+def is_postgres(url: str) -> bool:
+    """Whether a database URL points at PostgreSQL."""
+    return url.startswith(("postgresql", "postgres://"))
+
+
+# Engines and session factories are created on first use, so a process that
+# only uses the async engine never loads the sync driver or opens its pool.
+
+
+@cache
+def get_engine() -> Engine:
+    """Get the sync engine, creating it on first use."""
+    url = get_sync_url()
+    connect_args = {}
+    if is_postgres(url):
+        # libpq client-side keepalive
+        connect_args = {
+            "keepalives": 1,
+            "keepalives_idle": settings.database.db_tcp_keepalive_idle,
+        }
+    return create_engine(
+        url,
+        echo=settings.database.db_echo,
+        connect_args=connect_args,
+        json_serializer=json_serializer,
+        json_deserializer=orjson.loads,
+        **get_pool_options(),
+    )
+
+
+@cache
+def get_async_engine() -> AsyncEngine:
+    """Get the async engine, creating it on first use."""
+    url = get_async_url()
+    connect_args = {}
+    if is_postgres(url) and settings.database.db_pgbouncer:
+        # In transaction mode consecutive statements may run on different
+        # server connections, so asyncpg must not keep prepared statements,
+        # and PgBouncer rejects startup parameters such as tcp_keepalives_idle
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    elif is_postgres(url):
+        # asyncpg has no client keepalive option; have the server probe instead
+        connect_args = {
+            "server_settings": {
+                "tcp_keepalives_idle": str(settings.database.db_tcp_keepalive_idle)
+            }
+        }
+    return create_async_engine(
+        url,
+        echo=settings.database.db_echo,
+        connect_args=connect_args,
+        json_serializer=json_serializer,
+        json_deserializer=orjson.loads,
+        **get_pool_options(),
+    )
+
+
+@cache
+def get_session_factory() -> sessionmaker:
+    """Get the sync session factory."""
+    return sessionmaker(
+        bind=get_engine(),
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+@cache
+def get_async_session_factory() -> async_sessionmaker:
+    """Get the async session factory."""
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        class_=AsyncSession,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+# Module attributes kept for backward compatibility, resolved lazily
+_LAZY_ATTRIBUTES = {
+    "engine": get_engine,
+    "async_engine": get_async_engine,
+    "SessionLocal": get_session_factory,
+    "AsyncSessionLocal": get_async_session_factory,
+}
+
+
+def __getattr__(name: str) -> Any:
+    factory = _LAZY_ATTRIBUTES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
 
 
 @contextmanager
@@ -84,7 +187,7 @@ def get_db() -> Generator[Session, None, None]:
         with get_db() as db:
             users = db.query(User).all()
     """
-    session = SessionLocal()
+    session = get_session_factory()()
     try:
         yield session
         session.commit()
@@ -95,37 +198,21 @@ def get_db() -> Generator[Session, None, None]:
         session.close()
 
 
-@asynccontextmanager
-async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
-    """
-    Get an async database session.
-    
-    Usage:
-        async with get_async_db() as db:
-            result = await db.execute(select(User))
-    """
-    session = AsyncSessionLocal()
-    try:
-        yield session
-        await session.commit()
-    except Exception:
-        await session.rollback()
-        raise
-    finally:
-        await session.close()
-
-
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
     FastAPI dependency for async database sessions.
     
+    Declared async so FastAPI awaits it inline, and cached per request
+    (the Depends default) so every dependency of a request shares one
+    session, committed once when the request succeeds.
+
     Usage:
         @app.get("/users")
         async def get_users(db: AsyncSession = Depends(get_db_session)):
             result = await db.execute(select(User))
             return result.scalars().all()
     """
-    async with AsyncSessionLocal() as session:
+    async with get_async_session_factory()() as session:
         try:
             yield session
             await session.commit()
@@ -134,6 +221,12 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+# Same session lifecycle as get_db_session, for use outside FastAPI:
+#     async with get_async_db() as db:
+#         result = await db.execute(select(User))
+get_async_db = asynccontextmanager(get_db_session)
+
+
 def init_db() -> None:
     """
     Initialize the database by creating all tables.
@@ -142,7 +235,7 @@ def init_db() -> None:
     For production, use Alembic migrations.
     """
     logger.info("Initializing database tables...")
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
     logger.info("Database tables created successfully")
 
 
@@ -151,7 +244,7 @@ async def init_async_db() -> None:
     Async version of database initialization.
     """
     logger.info("Initializing database tables (async)...")
-    async with async_engine.begin() as conn:
+    async with get_async_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     logger.info("Database tables created successfully")
 
@@ -163,6 +256,39 @@ async def close_db() -> None:
     Should be called on application shutdown.
     """
     logger.info("Closing database connections...")
-    await async_engine.dispose()
-    engine.dispose()
+    # Only dispose engines this process actually created
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
     logger.info("Database connections closed")
+
+
+async def check_database(max_age: float = DB_HEALTH_CACHE_SECONDS) -> str | None:
+    """
+    Check database connectivity, reusing a recent result.
+
+    Health probes arrive every few seconds; reusing the last result for
+    `max_age` seconds keeps them from tying up a pool connection each.
+
+    Args:
+        max_age: Seconds a previous result stays valid
+
+    Returns:
+        None if the database is reachable, otherwise the error message
+    """
+    global _last_health_check
+    checked_at, error = _last_health_check
+    now = time.monotonic()
+    if now - checked_at < max_age:
+        return error
+
+    try:
+        async with get_async_engine().connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        error = None
+    except Exception as e:
+        error = str(e)
+
+    _last_health_check = (now, error)
+    return error
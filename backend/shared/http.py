@@ -0,0 +1,59 @@
+"""
+Shared HTTP Client
+==================
+
+Process-wide pooled HTTP client for calls between agents and to
+external services.
+
+Every service in a process shares one connection pool, so requests
+reuse open connections instead of repeating TCP/TLS handshakes. The
+application lifespan opens the client on startup and closes it on
+shutdown.
+"""
+
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+
+
+def create_client() -> httpx.AsyncClient:
+    """
+    Create a pooled HTTP/2 client.
+
+    Returns:
+        Configured async HTTP client
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        # Fail fast when a peer is unreachable instead of waiting the full timeout
+        timeout=httpx.Timeout(30.0, connect=3.0),
+        # HTTP/2 multiplexes concurrent requests, so a small idle pool suffices
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=30.0
+        )
+        # No default Content-Type: httpx sets it per request from json=/data=/files=
+    )
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+
+    Returns:
+        Shared async HTTP client
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_client()
+    return _client
+
+
+async def close_client() -> None:
+    """Close the process-wide HTTP client and its connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
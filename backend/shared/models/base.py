@@ -5,13 +5,18 @@ Base Model Classes
 SQLAlchemy declarative base and common mixins.
 """
 
+import re
 from datetime import datetime
+from functools import cache
 from typing import Any
 
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import DateTime, func
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+# Position before each inner capital letter, for CamelCase -> snake_case
+_SNAKE_CASE_BOUNDARY = re.compile(r'(?<!^)(?=[A-Z])')
+
 
 class Base(DeclarativeBase):
     """
@@ -23,16 +28,17 @@ class Base(DeclarativeBase):
     @declared_attr.directive
     def __tablename__(cls) -> str:
         """Generate table name from class name (snake_case)."""
-        import re
-        name = cls.__name__
-        return re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
+        return _SNAKE_CASE_BOUNDARY.sub('_', cls.__name__).lower()
+
+    @classmethod
+    @cache
+    def _column_names(cls) -> tuple[str, ...]:
+        """Column names of the model's table, computed once per class."""
+        return tuple(column.name for column in cls.__table__.columns)
     
     def to_dict(self) -> dict[str, Any]:
         """Convert model instance to dictionary."""
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
+        return {name: getattr(self, name) for name in self._column_names()}
 
 
 class TimestampMixin:
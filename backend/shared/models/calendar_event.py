@@ -9,7 +9,18 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    false,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -49,7 +60,7 @@ class CalendarEvent(Base, TimestampMixin):
     
     # Google Calendar identifiers
     google_event_id: Mapped[Optional[str]] = mapped_column(String(255), unique=True)
-    google_calendar_id: Mapped[str] = mapped_column(String(255), default="primary")
+    google_calendar_id: Mapped[str] = mapped_column(String(255), server_default="primary")
     
     # Event details
     title: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -59,21 +70,29 @@ class CalendarEvent(Base, TimestampMixin):
     # Timing
     start_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     end_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    is_all_day: Mapped[bool] = mapped_column(Boolean, default=False)
-    timezone: Mapped[str] = mapped_column(String(100), default="UTC")
+    is_all_day: Mapped[bool] = mapped_column(Boolean, server_default=false())
+    timezone: Mapped[str] = mapped_column(String(100), server_default="UTC")
+    stored_duration_minutes: Mapped[int | None] = mapped_column(
+        "duration_minutes",
+        Integer,
+        Computed(
+            "CAST(TRUNC(EXTRACT(EPOCH FROM (end_time - start_time)) / 60) AS INTEGER)",
+            persisted=True
+        )
+    )  # Generated by Postgres; read through duration_minutes
     
     # Recurrence
-    is_recurring: Mapped[bool] = mapped_column(Boolean, default=False)
+    is_recurring: Mapped[bool] = mapped_column(Boolean, server_default=false())
     recurrence_rule: Mapped[Optional[str]] = mapped_column(Text)  # RRULE format
     
     # Attendees
-    attendees: Mapped[Optional[list]] = mapped_column(JSONB, default=list)
+    attendees: Mapped[list | None] = mapped_column(JSONB, server_default=text("'[]'::jsonb"))
     # Example: [{"email": "user@example.com", "name": "John", "response": "accepted"}]
     
     # Source tracking
     source: Mapped[str] = mapped_column(
         String(50),
-        default=EventSource.EMAIL_SUMMARY.value
+        server_default=EventSource.EMAIL_SUMMARY.value
     )
     source_email_id: Mapped[Optional[int]] = mapped_column(
         Integer,
@@ -87,16 +106,16 @@ class CalendarEvent(Base, TimestampMixin):
     # Status
     status: Mapped[str] = mapped_column(
         String(50),
-        default=EventStatus.PENDING.value
+        server_default=EventStatus.PENDING.value
     )
     
     # Sync status
-    is_synced: Mapped[bool] = mapped_column(Boolean, default=False)
+    is_synced: Mapped[bool] = mapped_column(Boolean, server_default=false())
     last_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     sync_error: Mapped[Optional[str]] = mapped_column(Text)
     
     # Reminders
-    reminders: Mapped[Optional[dict]] = mapped_column(JSONB, default=dict)
+    reminders: Mapped[dict | None] = mapped_column(JSONB, server_default=text("'{}'::jsonb"))
     # Example: {"useDefault": false, "overrides": [{"method": "email", "minutes": 30}]}
     
     # Agent metadata
@@ -104,12 +123,22 @@ class CalendarEvent(Base, TimestampMixin):
     extraction_notes: Mapped[Optional[str]] = mapped_column(Text)
     
     # Table indexes
+    # (user_id, start_time) serves per-user range scans and, as a prefix,
+    # plain per-user lookups
     __table_args__ = (
-        Index("idx_calendar_events_user_id", "user_id"),
+        Index("idx_calendar_events_user_start", "user_id", "start_time"),
+        Index("idx_calendar_events_user_status_start", "user_id", "status", "start_time"),
         Index("idx_calendar_events_google_event_id", "google_event_id"),
-        Index("idx_calendar_events_start_time", "start_time"),
         Index("idx_calendar_events_status", "status"),
         Index("idx_calendar_events_source", "source"),
+        # Containment queries, e.g. attendees @> '[{"email": "..."}]'
+        Index(
+            "idx_calendar_events_attendees",
+            "attendees",
+            postgresql_using="gin",
+            postgresql_ops={"attendees": "jsonb_path_ops"},
+        ),
+        Index("idx_calendar_events_reminders", "reminders", postgresql_using="gin"),
     )
     
     def __repr__(self) -> str:
@@ -117,6 +146,28 @@ class CalendarEvent(Base, TimestampMixin):
     
     @property
     def duration_minutes(self) -> int:
-        """Calculate event duration in minutes."""
+        """
+        Event duration in minutes.
+
+        Uses the generated column when loaded from the database, and
+        computes it for events not yet flushed.
+        """
+        if self.stored_duration_minutes is not None:
+            return self.stored_duration_minutes
         delta = self.end_time - self.start_time
         return int(delta.total_seconds() / 60)
+
+    @property
+    def attendee_emails(self) -> frozenset[str]:
+        """
+        Attendee email addresses as a set.
+
+        Built from the current attendees on each access (not cached, since
+        attendees may be modified); bind it once when checking several
+        addresses.
+        """
+        return frozenset(
+            attendee["email"]
+            for attendee in self.attendees or ()
+            if attendee.get("email")
+        )
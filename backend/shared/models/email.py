@@ -9,7 +9,20 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    desc,
+    false,
+    text,
+    true,
+)
+from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -41,14 +54,14 @@ class Email(Base, TimestampMixin):
     )
     
     # Gmail message identifiers
-    gmail_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    gmail_id: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     thread_id: Mapped[Optional[str]] = mapped_column(String(255))
     
     # Email metadata
     subject: Mapped[Optional[str]] = mapped_column(Text)
     sender: Mapped[Optional[str]] = mapped_column(String(255))
     sender_name: Mapped[Optional[str]] = mapped_column(String(255))
-    recipients: Mapped[Optional[list]] = mapped_column(JSONB, default=list)
+    recipients: Mapped[list | None] = mapped_column(JSONB, server_default=text("'[]'::jsonb"))
     
     # Content
     snippet: Mapped[Optional[str]] = mapped_column(Text)
@@ -59,34 +72,57 @@ class Email(Base, TimestampMixin):
     received_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     
     # Labels and categories
-    labels: Mapped[Optional[list]] = mapped_column(JSONB, default=list)
-    is_unread: Mapped[bool] = mapped_column(Boolean, default=True)
-    is_important: Mapped[bool] = mapped_column(Boolean, default=False)
+    # text[]: flat string list, packed and natively indexable by GIN
+    labels: Mapped[list[str] | None] = mapped_column(ARRAY(Text), server_default=text("'{}'"))
+    is_unread: Mapped[bool] = mapped_column(Boolean, server_default=true())
+    is_important: Mapped[bool] = mapped_column(Boolean, server_default=false())
     
     # Processing status
-    status: Mapped[str] = mapped_column(
-        String(50),
-        default=EmailStatus.PENDING.value
+    # Native Postgres enum (4 bytes per row), storing the lowercase values
+    status: Mapped[EmailStatus] = mapped_column(
+        SQLEnum(
+            EmailStatus,
+            name="email_status",
+            values_callable=lambda statuses: [status.value for status in statuses]
+        ),
+        server_default=EmailStatus.PENDING.value,
+        nullable=False
     )
     
     # Relationships
+    # Loaded with one extra "WHERE email_id IN (...)" query per batch of
+    # emails, never per email; lazy loads also fail under AsyncSession
     summaries: Mapped[list["EmailSummary"]] = relationship(
         "EmailSummary",
         back_populates="email",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="selectin"
     )
     
     # Table indexes
     __table_args__ = (
-        Index("idx_emails_user_id", "user_id"),
-        Index("idx_emails_gmail_id", "gmail_id"),
+        # Inbox view: a user's latest emails, optionally by status, in one
+        # index range read; also serves plain per-user lookups as a prefix
+        Index("idx_emails_user_recent", "user_id", desc("received_at"), "status"),
+        Index(
+            "idx_emails_pending",
+            "user_id",
+            "received_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
         Index("idx_emails_thread_id", "thread_id"),
-        Index("idx_emails_received_at", "received_at"),
-        Index("idx_emails_status", "status"),
+        # Array operators (@>, &&), e.g. Email.labels.contains(["IMPORTANT"])
+        Index("idx_emails_labels", "labels", postgresql_using="gin"),
+        Index(
+            "idx_emails_recipients",
+            "recipients",
+            postgresql_using="gin",
+            postgresql_ops={"recipients": "jsonb_path_ops"},
+        ),
     )
     
     def __repr__(self) -> str:
-        return f"<Email {self.gmail_id}: {self.subject[:50] if self.subject else 'No Subject'}>"
+        return f"<Email {self.gmail_id}: {(self.subject or 'No Subject')[:50]}>"
 
 
 class EmailSummary(Base, TimestampMixin):
@@ -94,6 +130,8 @@ class EmailSummary(Base, TimestampMixin):
     AI-generated email summary.
     
     Stores the summary, extracted action items, and detected events.
+    Low-selectivity columns such as priority are indexed through partial
+    index predicates rather than standalone B-tree indexes.
     """
     
     __tablename__ = "email_summaries"
@@ -107,14 +145,14 @@ class EmailSummary(Base, TimestampMixin):
     
     # Summary content
     summary: Mapped[str] = mapped_column(Text, nullable=False)
-    key_points: Mapped[Optional[list]] = mapped_column(JSONB, default=list)
+    key_points: Mapped[list[str] | None] = mapped_column(ARRAY(Text), server_default=text("'{}'"))
     
     # Extracted action items
-    action_items: Mapped[Optional[list]] = mapped_column(JSONB, default=list)
+    action_items: Mapped[list | None] = mapped_column(JSONB, server_default=text("'[]'::jsonb"))
     # Example: [{"title": "Follow up", "deadline": "2024-01-15", "priority": "high"}]
     
     # Detected events/meetings
-    detected_events: Mapped[Optional[list]] = mapped_column(JSONB, default=list)
+    detected_events: Mapped[list | None] = mapped_column(JSONB, server_default=text("'[]'::jsonb"))
     # Example: [{"title": "Meeting", "date": "2024-01-15", "time": "10:00", "attendees": [...]}]
     
     # Sentiment and priority
@@ -122,13 +160,13 @@ class EmailSummary(Base, TimestampMixin):
     priority: Mapped[Optional[str]] = mapped_column(String(50))  # low, medium, high, urgent
     
     # LLM metadata
-    model_used: Mapped[str] = mapped_column(String(100), default="claude-3-sonnet")
+    model_used: Mapped[str] = mapped_column(String(100), server_default="claude-3-sonnet")
     tokens_used: Mapped[Optional[int]] = mapped_column(Integer)
     processing_time_ms: Mapped[Optional[int]] = mapped_column(Integer)
     
     # Calendar sync status
-    calendar_synced: Mapped[bool] = mapped_column(Boolean, default=False)
-    calendar_event_ids: Mapped[Optional[list]] = mapped_column(JSONB, default=list)
+    calendar_synced: Mapped[bool] = mapped_column(Boolean, server_default=false())
+    calendar_event_ids: Mapped[list | None] = mapped_column(JSONB, server_default=text("'[]'::jsonb"))
     
     # Relationship
     email: Mapped["Email"] = relationship("Email", back_populates="summaries")
@@ -136,7 +174,25 @@ class EmailSummary(Base, TimestampMixin):
     # Table indexes
     __table_args__ = (
         Index("idx_email_summaries_email_id", "email_id"),
-        Index("idx_email_summaries_priority", "priority"),
+        # Only the selective priorities ("what is urgent?") are worth indexing
+        Index(
+            "idx_email_summaries_priority_hot",
+            "email_id",
+            postgresql_where=text("priority IN ('high', 'urgent')"),
+        ),
+        # Containment (@>) queries on extracted items
+        Index(
+            "idx_email_summaries_action_items",
+            "action_items",
+            postgresql_using="gin",
+            postgresql_ops={"action_items": "jsonb_path_ops"},
+        ),
+        Index(
+            "idx_email_summaries_detected_events",
+            "detected_events",
+            postgresql_using="gin",
+            postgresql_ops={"detected_events": "jsonb_path_ops"},
+        ),
     )
     
     def __repr__(self) -> str:
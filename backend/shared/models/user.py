@@ -5,12 +5,29 @@ User Model
 User and authentication-related models.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import (
+    Boolean,
+    ColumnElement,
+    DateTime,
+    ForeignKey,
+    Index,
+    Select,
+    String,
+    Text,
+    UniqueConstraint,
+    false,
+    func,
+    select,
+    text,
+    true,
+)
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, TimestampMixin
@@ -38,17 +55,19 @@ class User(Base, TimestampMixin):
     
     # OAuth connections
     descope_user_id: Mapped[Optional[str]] = mapped_column(String(255), unique=True)
-    google_connected: Mapped[bool] = mapped_column(Boolean, default=False)
+    google_connected: Mapped[bool] = mapped_column(Boolean, server_default=false())
     google_email: Mapped[Optional[str]] = mapped_column(String(255))
     
     # Status
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    is_verified: Mapped[bool] = mapped_column(Boolean, default=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, server_default=true())
+    is_verified: Mapped[bool] = mapped_column(Boolean, server_default=false())
     
     # Settings stored as JSON
-    preferences: Mapped[Optional[dict]] = mapped_column(JSONB, default=dict)
+    preferences: Mapped[dict | None] = mapped_column(JSONB, server_default=text("'{}'::jsonb"))
     
     # Relationships
+    # Lazy: most user lookups never touch tokens. Queries that do should use
+    # .options(selectinload(User.tokens)) to avoid one query per user.
     tokens: Mapped[list["UserToken"]] = relationship(
         "UserToken",
         back_populates="user",
@@ -82,13 +101,20 @@ class UserToken(Base, TimestampMixin):
     )
     
     # Token details
-    provider: Mapped[str] = mapped_column(String(50), nullable=False)
+    provider: Mapped[AuthProvider] = mapped_column(
+        SQLEnum(
+            AuthProvider,
+            name="auth_provider",
+            values_callable=lambda providers: [provider.value for provider in providers]
+        ),
+        nullable=False
+    )
     access_token: Mapped[str] = mapped_column(Text, nullable=False)
     refresh_token: Mapped[Optional[str]] = mapped_column(Text)
-    token_type: Mapped[str] = mapped_column(String(50), default="Bearer")
+    token_type: Mapped[str] = mapped_column(String(50), server_default="Bearer")
     
     # Scopes granted
-    scopes: Mapped[Optional[list]] = mapped_column(JSONB, default=list)
+    scopes: Mapped[list[str] | None] = mapped_column(ARRAY(Text), server_default=text("'{}'"))
     
     # Expiration
     expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
@@ -98,15 +124,55 @@ class UserToken(Base, TimestampMixin):
     
     # Table indexes
     __table_args__ = (
-        Index("idx_user_tokens_user_provider", "user_id", "provider"),
+        UniqueConstraint("user_id", "provider", name="uq_user_tokens_user_provider"),
+        Index(
+            "idx_user_tokens_expires_at",
+            "expires_at",
+            postgresql_where=text("expires_at IS NOT NULL"),
+        ),
+        # Refreshable tokens by expiry, for expiring_within
+        Index(
+            "idx_user_tokens_expires_soon",
+            "expires_at",
+            postgresql_where=text("refresh_token IS NOT NULL"),
+        ),
     )
     
-    @property
+    @hybrid_property
     def is_expired(self) -> bool:
         """Check if token is expired."""
         if self.expires_at is None:
             return False
         return datetime.now(self.expires_at.tzinfo) > self.expires_at
     
+    @is_expired.inplace.expression
+    @classmethod
+    def _is_expired_expression(cls) -> ColumnElement[bool]:
+        """SQL form, so expired tokens can be found with a WHERE clause."""
+        return cls.expires_at < func.now()
+
+    @classmethod
+    def expiring_within(cls, seconds: int) -> Select[tuple["UserToken"]]:
+        """
+        Build a query for refreshable tokens that expire within `seconds`.
+
+        Use this rather than loading every token and filtering on
+        `is_expired` in Python; it is an index range scan on
+        idx_user_tokens_expires_soon.
+
+        Usage:
+            tokens = (await db.scalars(UserToken.expiring_within(300))).all()
+
+        Args:
+            seconds: Look-ahead window in seconds
+
+        Returns:
+            Select statement for the matching tokens
+        """
+        return select(cls).where(
+            cls.refresh_token.is_not(None),
+            cls.expires_at < func.now() + timedelta(seconds=seconds),
+        )
+
     def __repr__(self) -> str:
         return f"<UserToken {self.provider} for {self.user_id}>"
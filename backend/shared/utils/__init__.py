@@ -5,7 +5,7 @@ Utilities Module
 Common utility functions for logging, error handling, and more.
 """
 
-from .logger import get_logger, setup_logging
+from .logger import get_logger, setup_logging, shutdown_logging
 from .exceptions import (
     IntelliFlowError,
     AuthenticationError,
@@ -14,11 +14,15 @@ from .exceptions import (
     ValidationError,
     NotFoundError,
     ExternalServiceError,
+    CircuitOpenError,
 )
+from .circuit_breaker import CircuitBreaker
+from .rate_limiter import RateLimiter
 
 __all__ = [
     "get_logger",
     "setup_logging",
+    "shutdown_logging",
     "IntelliFlowError",
     "AuthenticationError",
     "AuthorizationError",
@@ -26,4 +30,7 @@ __all__ = [
     "ValidationError",
     "NotFoundError",
     "ExternalServiceError",
+    "CircuitOpenError",
+    "CircuitBreaker",
+    "RateLimiter",
 ]
@@ -0,0 +1,140 @@
+"""
+Circuit Breaker
+===============
+
+Fail-fast protection for calls to services that may be down.
+
+After `fail_max` consecutive failures the breaker opens and rejects calls
+immediately with CircuitOpenError. Once `reset_timeout` seconds have
+passed it lets a single trial call through (half-open); success closes
+the breaker again, failure re-opens it.
+"""
+
+import time
+
+from .exceptions import CircuitOpenError
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Three-state (closed, open, half-open) circuit breaker for async code.
+
+    Use as an async context manager around a call, or call
+    `before_call`, `record_success`, and `record_failure` directly when
+    failures are signalled by return values rather than exceptions.
+
+    Usage:
+        breaker = CircuitBreaker("agent-b")
+        async with breaker:
+            response = await client.get(url)
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        fail_max: int = 5,
+        reset_timeout: float = 30.0,
+        exclude: tuple[type[BaseException], ...] = ()
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            name: Name used in logs and errors
+            fail_max: Consecutive failures that open the breaker
+            reset_timeout: Seconds to stay open before allowing a trial call
+            exclude: Exception types that do not count as failures
+        """
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.exclude = exclude
+        self.failure_count = 0
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the timeout passes."""
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._transition(self.HALF_OPEN)
+        return self._state
+
+    def before_call(self) -> None:
+        """
+        Check that a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a
+                trial call already in flight
+        """
+        state = self.state
+
+        if state == self.CLOSED:
+            return
+
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return
+
+        retry_after: float | None = None
+        if state == self.OPEN:
+            retry_after = self.reset_timeout - (time.monotonic() - self._opened_at)
+        raise CircuitOpenError(
+            message=f"Circuit '{self.name}' is open",
+            circuit=self.name,
+            retry_after=retry_after
+        )
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the breaker."""
+        self._trial_in_flight = False
+        self.failure_count = 0
+        if self._state != self.CLOSED:
+            self._transition(self.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker if the limit is reached."""
+        self._trial_in_flight = False
+        self.failure_count += 1
+        if self._state == self.HALF_OPEN or self.failure_count >= self.fail_max:
+            self._opened_at = time.monotonic()
+            if self._state != self.OPEN:
+                self._transition(self.OPEN)
+
+    def release(self) -> None:
+        """Release a half-open trial slot without recording an outcome."""
+        self._trial_in_flight = False
+
+    def _transition(self, state: str) -> None:
+        """Change state and log the transition."""
+        logger.warning(
+            f"Circuit breaker '{self.name}' {self._state} -> {state}",
+            circuit=self.name,
+            failure_count=self.failure_count
+        )
+        self._state = state
+
+    async def __aenter__(self) -> "CircuitBreaker":
+        self.before_call()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None or issubclass(exc_type, self.exclude):
+            self.record_success()
+        elif issubclass(exc_type, Exception):
+            self.record_failure()
+        else:
+            self.release()
+        return False
@@ -5,7 +5,13 @@ Custom Exceptions
 Custom exception classes for IntelliFlow.
 """
 
-from typing import Any, Optional
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+# Shared read-only details for errors raised without any, so the common
+# no-details path allocates nothing
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
 
 
 class IntelliFlowError(Exception):
@@ -19,11 +25,11 @@ class IntelliFlowError(Exception):
         self,
         message: str,
         code: str = "INTELLIFLOW_ERROR",
-        details: Optional[dict[str, Any]] = None
+        details: Mapping[str, Any] | None = None
     ):
         self.message = message
         self.code = code
-        self.details = details or {}
+        self.details = details or _EMPTY_DETAILS
         super().__init__(self.message)
     
     def to_dict(self) -> dict[str, Any]:
@@ -32,7 +38,7 @@ class IntelliFlowError(Exception):
             "error": {
                 "code": self.code,
                 "message": self.message,
-                "details": self.details,
+                "details": dict(self.details),
             }
         }
 
@@ -40,7 +46,11 @@ class IntelliFlowError(Exception):
 class AuthenticationError(IntelliFlowError):
     """Raised when authentication fails."""
     
-    def __init__(self, message: str = "Authentication failed", details: dict = None):
+    def __init__(
+        self,
+        message: str = "Authentication failed",
+        details: Mapping[str, Any] | None = None
+    ):
         super().__init__(
             message=message,
             code="AUTHENTICATION_ERROR",
@@ -55,11 +65,10 @@ class AuthorizationError(IntelliFlowError):
         self,
         message: str = "Insufficient permissions",
         required_scopes: list[str] = None,
-        details: dict = None
+        details: Mapping[str, Any] | None = None
     ):
-        details = details or {}
         if required_scopes:
-            details["required_scopes"] = required_scopes
+            details = {**(details or {}), "required_scopes": required_scopes}
         super().__init__(
             message=message,
             code="AUTHORIZATION_ERROR",
@@ -74,11 +83,10 @@ class TokenExchangeError(IntelliFlowError):
         self,
         message: str = "Token exchange failed",
         target_agent: str = None,
-        details: dict = None
+        details: Mapping[str, Any] | None = None
     ):
-        details = details or {}
         if target_agent:
-            details["target_agent"] = target_agent
+            details = {**(details or {}), "target_agent": target_agent}
         super().__init__(
             message=message,
             code="TOKEN_EXCHANGE_ERROR",
@@ -93,11 +101,10 @@ class ValidationError(IntelliFlowError):
         self,
         message: str = "Validation failed",
         field: str = None,
-        details: dict = None
+        details: Mapping[str, Any] | None = None
     ):
-        details = details or {}
         if field:
-            details["field"] = field
+            details = {**(details or {}), "field": field}
         super().__init__(
             message=message,
             code="VALIDATION_ERROR",
@@ -113,13 +120,12 @@ class NotFoundError(IntelliFlowError):
         message: str = "Resource not found",
         resource_type: str = None,
         resource_id: str = None,
-        details: dict = None
+        details: Mapping[str, Any] | None = None
     ):
-        details = details or {}
         if resource_type:
-            details["resource_type"] = resource_type
+            details = {**(details or {}), "resource_type": resource_type}
         if resource_id:
-            details["resource_id"] = resource_id
+            details = {**(details or {}), "resource_id": resource_id}
         super().__init__(
             message=message,
             code="NOT_FOUND_ERROR",
@@ -135,13 +141,12 @@ class ExternalServiceError(IntelliFlowError):
         message: str = "External service error",
         service: str = None,
         status_code: int = None,
-        details: dict = None
+        details: Mapping[str, Any] | None = None
     ):
-        details = details or {}
         if service:
-            details["service"] = service
+            details = {**(details or {}), "service": service}
         if status_code:
-            details["status_code"] = status_code
+            details = {**(details or {}), "status_code": status_code}
         super().__init__(
             message=message,
             code="EXTERNAL_SERVICE_ERROR",
@@ -156,11 +161,10 @@ class RateLimitError(IntelliFlowError):
         self,
         message: str = "Rate limit exceeded",
         retry_after: int = None,
-        details: dict = None
+        details: Mapping[str, Any] | None = None
     ):
-        details = details or {}
         if retry_after:
-            details["retry_after_seconds"] = retry_after
+            details = {**(details or {}), "retry_after_seconds": retry_after}
         super().__init__(
             message=message,
             code="RATE_LIMIT_ERROR",
@@ -176,15 +180,35 @@ class AgentCommunicationError(IntelliFlowError):
         message: str = "Agent communication failed",
         source_agent: str = None,
         target_agent: str = None,
-        details: dict = None
+        details: Mapping[str, Any] | None = None
     ):
-        details = details or {}
         if source_agent:
-            details["source_agent"] = source_agent
+            details = {**(details or {}), "source_agent": source_agent}
         if target_agent:
-            details["target_agent"] = target_agent
+            details = {**(details or {}), "target_agent": target_agent}
         super().__init__(
             message=message,
             code="AGENT_COMMUNICATION_ERROR",
             details=details
         )
+
+
+class CircuitOpenError(IntelliFlowError):
+    """Raised when a call is rejected because its circuit breaker is open."""
+
+    def __init__(
+        self,
+        message: str = "Circuit breaker is open",
+        circuit: str = None,
+        retry_after: float = None,
+        details: Mapping[str, Any] | None = None
+    ):
+        if circuit:
+            details = {**(details or {}), "circuit": circuit}
+        if retry_after is not None:
+            details = {**(details or {}), "retry_after_seconds": round(retry_after, 1)}
+        super().__init__(
+            message=message,
+            code="CIRCUIT_OPEN_ERROR",
+            details=details
+        )
@@ -6,29 +6,59 @@ Structured logging setup using structlog.
 """
 
 import logging
+import queue
 import sys
+from contextlib import AbstractContextManager
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
+import orjson
 import structlog
 
 from ..config import settings
 
+# Background thread that writes queued log records to stdout
+_queue_listener: QueueListener | None = None
+
+# Per-request loggers, resolved once (structlog proxies bind on first use)
+_request_logger = structlog.get_logger("api.request")
+_response_logger = structlog.get_logger("api.response")
+
+
+def _orjson_dumps(event_dict: dict, **kwargs: Any) -> str:
+    """Serialize a log event with orjson; the stdlib handler expects str."""
+    return orjson.dumps(event_dict, **kwargs).decode()
+
 
 def setup_logging(log_level: str = None) -> None:
     """
     Configure structured logging for the application.
     
+    structlog renders each event on the calling thread and hands it to
+    the standard library, whose only handler enqueues the record. A
+    QueueListener thread does the actual stdout writes, so logging never
+    blocks the event loop on I/O. Call `shutdown_logging` on shutdown to
+    flush the queue.
+
     Args:
         log_level: Override log level (default: from settings)
     """
-    level = log_level or settings.app.log_level
+    global _queue_listener
+    level = getattr(logging, (log_level or settings.app.log_level).upper(), logging.INFO)
     
-    # Configure standard logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, level.upper(), logging.INFO),
-    )
+    # Configure standard logging: enqueue on the caller, write on a listener thread
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    root_logger = logging.getLogger()
+    root_logger.handlers = [QueueHandler(log_queue)]
+    root_logger.setLevel(level)
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    _queue_listener = QueueListener(log_queue, stream_handler)
+    _queue_listener.start()
     
     # Configure structlog
     processors = [
@@ -36,7 +66,7 @@ def setup_logging(log_level: str = None) -> None:
         structlog.processors.add_log_level,
         structlog.processors.StackInfoRenderer(),
         structlog.dev.set_exc_info,
-        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
     ]
     
     if settings.app.debug:
@@ -46,20 +76,31 @@ def setup_logging(log_level: str = None) -> None:
         # Production: JSON output
         processors.extend([
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ])
     
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, level.upper(), logging.INFO)
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
+def shutdown_logging() -> None:
+    """
+    Flush queued log records and stop the background writer thread.
+
+    Records logged afterwards are written synchronously.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        logging.getLogger().handlers = list(_queue_listener.handlers)
+        _queue_listener = None
+
+
 def get_logger(name: str = None) -> structlog.BoundLogger:
     """
     Get a structured logger instance.
@@ -73,28 +114,18 @@ def get_logger(name: str = None) -> structlog.BoundLogger:
     return structlog.get_logger(name)
 
 
-class LogContext:
+def LogContext(**context: Any) -> AbstractContextManager[None]:  # noqa: N802
     """
     Context manager for adding temporary context to logs.
     
+    Wraps structlog's `bound_contextvars`, which snapshots the context on
+    entry and restores it on exit, including any values it shadowed.
+
     Usage:
         with LogContext(request_id="abc123", user_id="user1"):
             logger.info("Processing request")
     """
-    
-    def __init__(self, **context: Any):
-        self.context = context
-        self._tokens = []
-    
-    def __enter__(self):
-        for key, value in self.context.items():
-            token = structlog.contextvars.bind_contextvars(**{key: value})
-            self._tokens.append((key, token))
-        return self
-    
-    def __exit__(self, *args):
-        for key, _ in reversed(self._tokens):
-            structlog.contextvars.unbind_contextvars(key)
+    return structlog.contextvars.bound_contextvars(**context)
 
 
 def log_request(
@@ -112,8 +143,7 @@ def log_request(
         user_id: Optional user ID
         extra: Additional context
     """
-    logger = get_logger("api.request")
-    logger.info(
+    _request_logger.info(
         "API Request",
         method=method,
         path=path,
@@ -135,9 +165,13 @@ def log_response(
         duration_ms: Request duration in milliseconds
         extra: Additional context
     """
-    logger = get_logger("api.response")
-    level = "info" if status_code < 400 else "warning" if status_code < 500 else "error"
-    getattr(logger, level)(
+    if status_code < 400:
+        log = _response_logger.info
+    elif status_code < 500:
+        log = _response_logger.warning
+    else:
+        log = _response_logger.error
+    log(
         "API Response",
         status_code=status_code,
         duration_ms=round(duration_ms, 2),
@@ -0,0 +1,68 @@
+"""
+Rate Limiter
+============
+
+Keyed token-bucket rate limiting for calls against per-user quotas.
+
+Each key gets a bucket holding up to `burst` tokens that refills at
+`rate` tokens per second. `acquire` takes a token, sleeping until one is
+available, so callers are smoothed to the quota instead of being rejected.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+
+
+class RateLimiter:
+    """
+    Token buckets keyed by caller, for async code.
+
+    Buckets are kept in a bounded LRU map; a key that has been idle long
+    enough to be evicted would have refilled to a full bucket anyway.
+
+    Usage:
+        limiter = RateLimiter(rate=10, burst=20)
+        await limiter.acquire(user_id)
+        response = await client.get(url)
+    """
+
+    def __init__(self, rate: float, burst: int, max_keys: int = 10000):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Tokens added to each bucket per second
+            burst: Bucket capacity (calls allowed back to back)
+            max_keys: Maximum buckets kept before evicting the least recently used
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        # key -> (tokens, last refill time), least recently used first
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def acquire(self, key: str) -> None:
+        """
+        Take one token from a key's bucket, waiting for a refill if empty.
+
+        Args:
+            key: Bucket key, e.g. a user ID
+        """
+        while True:
+            now = time.monotonic()
+            tokens, updated = self._buckets.pop(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+
+            if tokens >= 1:
+                self._store(key, tokens - 1, now)
+                return
+
+            self._store(key, tokens, now)
+            await asyncio.sleep((1 - tokens) / self.rate)
+
+    def _store(self, key: str, tokens: float, now: float) -> None:
+        """Save a bucket as most recently used, evicting the oldest when full."""
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
@@ -8,12 +8,13 @@ Seeds the database with sample data for development and testing.
 
 import os
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 # Add shared module to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
 try:
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
     from sqlalchemy.orm import Session
     from shared.database import SessionLocal, init_db
     from shared.models import User, Email, EmailSummary, CalendarEvent
@@ -28,7 +29,7 @@ def seed_users(db: Session) -> list:
     print("📝 Creating sample users...")
     
     users = [
-        User(
+        dict(
             id="user_demo_1",
             email="demo@intelliflow.local",
             name="Demo User",
@@ -39,7 +40,7 @@ def seed_users(db: Session) -> list:
             is_verified=True,
             preferences={"theme": "dark", "notifications": True}
         ),
-        User(
+        dict(
             id="user_demo_2",
             email="test@intelliflow.local",
             name="Test User",
@@ -50,26 +51,25 @@ def seed_users(db: Session) -> list:
         ),
     ]
     
+    # One bulk statement; existing rows are skipped and not returned
+    created = set(db.scalars(
+        pg_insert(User).on_conflict_do_nothing(index_elements=["id"]).returning(User.id),
+        users
+    ))
     for user in users:
-        existing = db.query(User).filter(User.id == user.id).first()
-        if not existing:
-            db.add(user)
-            print(f"  ✅ Created user: {user.email}")
+        if user["id"] in created:
+            print(f"  ✅ Created user: {user['email']}")
         else:
-            print(f"  ⏩ User exists: {user.email}")
-    
-    db.commit()
+            print(f"  ⏩ User exists: {user['email']}")
     return users
 
 
-def seed_emails(db: Session, user_id: str) -> list:
+def seed_emails(db: Session, user_id: str, now: datetime) -> list:
     """Create sample emails."""
     print("📧 Creating sample emails...")
     
-    now = datetime.utcnow()
-    
     emails = [
-        Email(
+        dict(
             user_id=user_id,
             gmail_id="mock_msg_001",
             thread_id="mock_thread_001",
@@ -103,7 +103,7 @@ John Manager""",
             labels=["INBOX", "IMPORTANT", "UNREAD"],
             status="pending"
         ),
-        Email(
+        dict(
             user_id=user_id,
             gmail_id="mock_msg_002",
             thread_id="mock_thread_002",
@@ -130,19 +130,21 @@ Sarah""",
         ),
     ]
     
+    created = set(db.scalars(
+        pg_insert(Email)
+        .on_conflict_do_nothing(index_elements=["gmail_id"])
+        .returning(Email.gmail_id),
+        emails
+    ))
     for email in emails:
-        existing = db.query(Email).filter(Email.gmail_id == email.gmail_id).first()
-        if not existing:
-            db.add(email)
-            print(f"  ✅ Created email: {email.subject[:40]}...")
+        if email["gmail_id"] in created:
+            print(f"  ✅ Created email: {email['subject'][:40]}...")
         else:
-            print(f"  ⏩ Email exists: {email.subject[:40]}...")
-    
-    db.commit()
+            print(f"  ⏩ Email exists: {email['subject'][:40]}...")
     return emails
 
 
-def seed_summaries(db: Session, emails: list):
+def seed_summaries(db: Session, emails: list, now: datetime):
     """Create sample email summaries."""
     print("📋 Creating sample summaries...")
     
@@ -169,7 +171,7 @@ def seed_summaries(db: Session, emails: list):
         detected_events=[
             {
                 "title": "Q1 Planning Meeting",
-                "date": (datetime.utcnow() + timedelta(days=2)).strftime("%Y-%m-%d"),
+                "date": (now + timedelta(days=2)).strftime("%Y-%m-%d"),
                 "time": "14:00",
                 "duration_minutes": 60,
                 "location": "Conference Room A",
@@ -190,18 +192,14 @@ def seed_summaries(db: Session, emails: list):
         print(f"  ✅ Created summary for: {email.subject[:40]}...")
     else:
         print(f"  ⏩ Summary exists for: {email.subject[:40]}...")
-    
-    db.commit()
 
 
-def seed_calendar_events(db: Session, user_id: str):
+def seed_calendar_events(db: Session, user_id: str, now: datetime):
     """Create sample calendar events."""
     print("📅 Creating sample calendar events...")
     
-    now = datetime.utcnow()
-    
     events = [
-        CalendarEvent(
+        dict(
             user_id=user_id,
             google_event_id="mock_event_001",
             title="Q1 Planning Meeting",
@@ -219,7 +217,7 @@ def seed_calendar_events(db: Session, user_id: str):
             is_synced=False,
             confidence_score=0.95,
         ),
-        CalendarEvent(
+        dict(
             user_id=user_id,
             google_event_id="mock_event_002",
             title="Weekly Standup",
@@ -235,17 +233,17 @@ def seed_calendar_events(db: Session, user_id: str):
         ),
     ]
     
+    created = set(db.scalars(
+        pg_insert(CalendarEvent)
+        .on_conflict_do_nothing(index_elements=["google_event_id"])
+        .returning(CalendarEvent.google_event_id),
+        events
+    ))
     for event in events:
-        existing = db.query(CalendarEvent).filter(
-            CalendarEvent.google_event_id == event.google_event_id
-        ).first()
-        if not existing:
-            db.add(event)
-            print(f"  ✅ Created event: {event.title}")
+        if event["google_event_id"] in created:
+            print(f"  ✅ Created event: {event['title']}")
         else:
-            print(f"  ⏩ Event exists: {event.title}")
-    
-    db.commit()
+            print(f"  ⏩ Event exists: {event['title']}")
 
 
 def main():
@@ -258,14 +256,16 @@ def main():
     init_db()
     print("  ✅ Database initialized")
     
-    # Seed data
-    with SessionLocal() as db:
+    # Seed data, all relative to one timezone-aware timestamp, in a single
+    # transaction committed when the block exits
+    now = datetime.now(timezone.utc)
+    with SessionLocal.begin() as db:
         users = seed_users(db)
-        user_id = users[0].id
+        user_id = users[0]["id"]
         
-        emails = seed_emails(db, user_id)
-        seed_summaries(db, emails)
-        seed_calendar_events(db, user_id)
+        emails = seed_emails(db, user_id, now)
+        seed_summaries(db, emails, now)
+        seed_calendar_events(db, user_id, now)
     
     print("\n" + "=" * 50)
     print("✅ Database seeding complete!")
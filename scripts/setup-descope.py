@@ -7,16 +7,58 @@ Sets up Descope Inbound Apps for Agent A and Agent B.
 Configures OAuth scopes and permissions.
 """
 
+from __future__ import annotations
+
+import asyncio
+import hashlib
 import os
+import random
 import sys
 import json
-from typing import Optional
+from pathlib import Path
+from typing import Iterable, Optional
+
+# Imported by load_dependencies once the credentials are known to be set, so a
+# run with missing environment variables fails before paying for the imports
+httpx = None
+orjson = None
+
+# Payload digests of apps provisioned by earlier runs, keyed by project and app
+STATE_FILE = Path(__file__).with_name(".descope-setup-state.json")
+
+# Retries of throttled or failed management API calls, with exponential backoff
+MAX_ATTEMPTS = 4
+RETRY_INITIAL_DELAY = 0.1
+RETRY_MAX_DELAY = 1.0
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+def _scope_objects(*scopes: str) -> tuple[dict, ...]:
+    """Build the inbound app scope entries for the given scope names."""
+    return tuple({"name": scope, "description": f"Access to {scope}"} for scope in scopes)
+
+
+# Scopes granted to each agent's inbound app
+AGENT_A_SCOPES = _scope_objects("email.read", "email.summarize", "calendar.delegate")
+AGENT_B_SCOPES = _scope_objects("calendar.read", "calendar.write")
 
-try:
-    import httpx
-except ImportError:
-    print("Error: httpx not installed. Run: pip install httpx")
-    sys.exit(1)
+# Inbound apps to provision, as create_inbound_app keyword arguments
+AGENTS: tuple[dict, ...] = (
+    # Agent A - Email Summarizer
+    {
+        "app_id": "agent-a-summarizer",
+        "name": "Agent A - Email Summarizer",
+        "description": "AI agent for email fetching and summarization",
+        "scopes": AGENT_A_SCOPES,
+    },
+    # Agent B - Calendar Manager
+    {
+        "app_id": "agent-b-calendar",
+        "name": "Agent B - Calendar Manager",
+        "description": "AI agent for calendar event management",
+        "scopes": AGENT_B_SCOPES,
+    },
+)
 
 
 class DescopeSetup:
@@ -26,20 +68,87 @@ class DescopeSetup:
         self.project_id = project_id
         self.management_key = management_key
         self.base_url = "https://api.descope.com/v1/mgmt"
-        
-    def _headers(self) -> dict:
-        """Get auth headers."""
-        return {
-            "Authorization": f"Bearer {self.management_key}",
+        self._auth_headers = {
+            "Authorization": f"Bearer {management_key}",
             "Content-Type": "application/json"
         }
+        # One pooled HTTP/2 client, so concurrent requests multiplex over a
+        # single connection
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._auth_headers,
+            http2=True,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+        )
+        self._state = self._load_state()
+        # Status lines, written to stdout in one go by setup_agents
+        self._messages: list[str] = []
+    
+    async def __aenter__(self) -> "DescopeSetup":
+        return self
+    
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+    
+    @staticmethod
+    def _load_state() -> dict[str, str]:
+        """Load the payload digests recorded by previous runs."""
+        try:
+            return json.loads(STATE_FILE.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
     
-    def create_inbound_app(
+    def _save_state(self) -> None:
+        """Record the payload digests of successfully provisioned apps."""
+        STATE_FILE.write_text(json.dumps(self._state, indent=2, sort_keys=True))
+    
+    async def _request(self, method: str, url: str, payload: dict) -> httpx.Response:
+        """
+        Send a management API request, retrying transient failures.
+        
+        429 and 502/503/504 responses are retried with full-jitter
+        exponential backoff, honouring Retry-After. The last response is
+        returned once attempts run out.
+        
+        Args:
+            method: HTTP method
+            url: Path relative to the management API base URL
+            payload: JSON body
+            
+        Returns:
+            HTTP response
+        """
+        body = orjson.dumps(payload)
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            # Content-Type is among the client's default headers
+            response = await self._client.request(method, url, content=body)
+            if attempt == MAX_ATTEMPTS or response.status_code not in RETRYABLE_STATUS_CODES:
+                return response
+            await asyncio.sleep(self._retry_delay(attempt, response))
+        return response
+    
+    @staticmethod
+    def _retry_delay(attempt: int, response: httpx.Response) -> float:
+        """Seconds to wait before retry `attempt` + 1."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(float(retry_after), RETRY_MAX_DELAY)
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        ceiling = min(RETRY_INITIAL_DELAY * 2 ** (attempt - 1), RETRY_MAX_DELAY)
+        return random.uniform(0, ceiling)
+    
+    async def create_inbound_app(
         self,
         app_id: str,
         name: str,
         description: str,
-        scopes: list[str]
+        scopes: tuple[dict, ...]
     ) -> dict:
         """
         Create or update an inbound app.
@@ -48,77 +157,148 @@ class DescopeSetup:
             app_id: Unique app identifier
             name: Display name
             description: App description
-            scopes: List of allowed scopes
+            scopes: Allowed scope entries, e.g. AGENT_A_SCOPES
         """
-        print(f"\n📱 Creating Inbound App: {name}")
-        
+        # Collected per app so concurrent registrations print as whole blocks
+        lines = [f"\n📱 Creating Inbound App: {name}"]
+        try:
+            return await self._provision(app_id, name, description, scopes, lines)
+        finally:
+            self._messages.extend(lines)
+    
+    async def _provision(
+        self,
+        app_id: str,
+        name: str,
+        description: str,
+        scopes: tuple[dict, ...],
+        lines: list[str]
+    ) -> dict:
+        """Create or update an inbound app, appending status to `lines`."""
         payload = {
             "id": app_id,
             "name": name,
             "description": description,
             "enabled": True,
-            "scopes": [{"name": scope, "description": f"Access to {scope}"} for scope in scopes]
+            "scopes": list(scopes)
         }
         
-        with httpx.Client() as client:
-            # Try to create, if exists, update
-            response = client.post(
-                f"{self.base_url}/app/inbound",
-                headers=self._headers(),
-                json=payload
-            )
-            
+        state_key = f"{self.project_id}:{app_id}"
+        digest = hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        if self._state.get(state_key) == digest:
+            lines.append("  ⏩ Unchanged since last run, skipped")
+            return {}
+        
+        existing = await self._load_if_unchanged(app_id, payload)
+        if existing is not None:
+            lines.append("  ⏩ Already up to date in Descope, skipped")
+            self._state[state_key] = digest
+            return existing
+        
+        # Re-runs mostly hit existing apps: update first, create only if missing
+        response = await self._request("PUT", f"/app/inbound/{app_id}", payload)
+        if response.status_code == 200:
+            lines.append("  ✅ Updated existing app")
+        elif response.status_code == 404:
+            response = await self._request("POST", "/app/inbound", payload)
             if response.status_code == 200:
-                print(f"  ✅ Created successfully")
-                return response.json()
-            elif response.status_code == 409:
-                # Already exists, update it
-                response = client.put(
-                    f"{self.base_url}/app/inbound/{app_id}",
-                    headers=self._headers(),
-                    json=payload
-                )
-                if response.status_code == 200:
-                    print(f"  ✅ Updated existing app")
-                    return response.json()
-            
-            print(f"  ❌ Error: {response.status_code} - {response.text}")
+                lines.append("  ✅ Created successfully")
+        
+        if response.status_code != 200:
+            lines.append(f"  ❌ Error: {response.status_code} - {response.text}")
             return {}
+        
+        self._state[state_key] = digest
+        return response.json()
     
-    def setup_agents(self):
-        """Set up both agents."""
-        print("\n🚀 Setting up Descope for IntelliFlow")
-        print("=" * 50)
+    async def _load_if_unchanged(self, app_id: str, payload: dict) -> Optional[dict]:
+        """
+        Fetch an existing app and check whether it already matches `payload`.
         
-        # Agent A - Email Summarizer
-        self.create_inbound_app(
-            app_id="agent-a-summarizer",
-            name="Agent A - Email Summarizer",
-            description="AI agent for email fetching and summarization",
-            scopes=[
-                "email.read",
-                "email.summarize",
-                "calendar.delegate"
-            ]
-        )
+        Covers re-runs without local state (fresh checkout, CI) with one
+        small GET instead of a full PUT.
+        
+        Args:
+            app_id: Unique app identifier
+            payload: Payload that would be sent
+            
+        Returns:
+            The existing app if it matches, otherwise None
+        """
+        response = await self._client.get(f"/app/inbound/{app_id}")
+        if response.status_code != 200:
+            return None
+        existing = response.json()
+        # Compare only the fields we send; the API adds its own
+        projection = {key: existing.get(key) for key in payload}
+        projection["scopes"] = [
+            {"name": scope.get("name"), "description": scope.get("description")}
+            for scope in existing.get("scopes") or ()
+        ]
+        return existing if projection == payload else None
+    
+    @classmethod
+    async def provision_many(
+        cls,
+        project_id: str,
+        management_key: str,
+        agent_specs: Iterable[dict] = AGENTS
+    ) -> list[dict]:
+        """
+        Provision a batch of agents through one client lifecycle.
         
-        # Agent B - Calendar Manager
-        self.create_inbound_app(
-            app_id="agent-b-calendar",
-            name="Agent B - Calendar Manager",
-            description="AI agent for calendar event management",
-            scopes=[
-                "calendar.read",
-                "calendar.write"
-            ]
+        Every app shares one connection and TLS handshake, so batch all
+        agents into a single call rather than running the script per agent.
+        
+        Args:
+            project_id: Descope project ID
+            management_key: Descope management key
+            agent_specs: create_inbound_app keyword arguments, one per agent
+            
+        Returns:
+            One result per agent, in order
+        """
+        async with cls(project_id, management_key) as setup:
+            return await setup.setup_agents(agent_specs)
+    
+    async def setup_agents(self, agent_specs: Iterable[dict] = AGENTS) -> list[dict]:
+        """Set up the given agents, registering them concurrently."""
+        self._messages += ["\n🚀 Setting up Descope for IntelliFlow", "=" * 50]
+        try:
+            return await self._setup_agents(agent_specs)
+        finally:
+            sys.stdout.write("\n".join(self._messages) + "\n")
+            self._messages.clear()
+    
+    async def _setup_agents(self, agent_specs: Iterable[dict]) -> list[dict]:
+        """Register the agents and queue the closing status lines."""
+        results = await asyncio.gather(
+            *(self.create_inbound_app(**agent) for agent in agent_specs)
         )
         
-        print("\n" + "=" * 50)
-        print("✅ Descope setup complete!")
-        print("\nNext steps:")
-        print("1. Log in to Descope Console and verify the apps")
-        print("2. Configure OAuth flows for user consent")
-        print("3. Update .env with your project credentials")
+        self._save_state()
+        
+        self._messages += [
+            "\n" + "=" * 50,
+            "✅ Descope setup complete!",
+            "\nNext steps:",
+            "1. Log in to Descope Console and verify the apps",
+            "2. Configure OAuth flows for user consent",
+            "3. Update .env with your project credentials",
+        ]
+        return results
+
+
+def load_dependencies() -> None:
+    """Import the HTTP client and JSON encoder, exiting if they are missing."""
+    global httpx, orjson
+    try:
+        import httpx
+        import h2  # noqa: F401  (HTTP/2 support for httpx)
+        import orjson
+    except ImportError:
+        print("Error: dependencies not installed. Run: pip install 'httpx[http2]' orjson")
+        sys.exit(1)
 
 
 def main():
@@ -134,8 +314,8 @@ def main():
         print("  python setup-descope.py")
         sys.exit(1)
     
-    setup = DescopeSetup(project_id, management_key)
-    setup.setup_agents()
+    load_dependencies()
+    asyncio.run(DescopeSetup.provision_many(project_id, management_key))
 
 
 if __name__ == "__main__":